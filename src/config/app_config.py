@@ -1,8 +1,9 @@
 """
 앱 테스트 설정 관리
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
+import tempfile
 
 
 class AppConfig:
@@ -20,29 +21,154 @@ class AppConfig:
         "automationName": "UiAutomator2",
     }
 
+    # 성능 프로필 (capabilities + 세션 생성 후 적용할 Appium settings)
+    # default: 기본 동작 | fast: 서버 재설치/디바이스 초기화 생략, 애니메이션 끔, 유휴 대기 단축
+    # debug: 기본 동작 + 명령 대기 시간 연장, 찾기 실패 시 page_source 출력
+    CAPABILITY_PROFILE: str = os.getenv("CAPABILITY_PROFILE", "default")
+    CAPABILITY_PROFILES: Dict[str, Dict[str, Any]] = {
+        "default": {},
+        "fast": {
+            "skipServerInstallation": True,     # UiAutomator2 서버 설치 확인 생략 (이미 설치된 디바이스)
+            "skipDeviceInitialization": True,   # 권한/로케일 등 디바이스 초기화 생략
+            "disableWindowAnimation": True,     # 시스템 애니메이션 끔 (화면 안정화 대기 단축)
+            "noReset": True,                    # 세션 시작 시 앱 데이터 유지 (초기화는 DriverSession 이 담당)
+        },
+        "debug": {
+            "newCommandTimeout": 3600,          # 브레이크포인트에서 멈춰도 세션 유지
+            "printPageSourceOnFindFailure": True,
+        },
+    }
+    SETTINGS_PROFILES: Dict[str, Dict[str, Any]] = {
+        "default": {},
+        "fast": {
+            "waitForIdleTimeout": 100,          # 기본 10000ms - 애니메이션/광고로 유휴 상태가 늦는 화면에서 대기 단축
+            "ignoreUnimportantViews": True,     # 계층 압축 (page_source 크기/조회 시간 감소)
+        },
+        "debug": {
+            "ignoreUnimportantViews": False,    # 전체 계층 (로케이터 조사용)
+        },
+    }
+    PROFILE_TIMING_LOG: str = os.getenv("PROFILE_TIMING_LOG", "./reports/profile_timings.jsonl")
+    PHASE_TIMING_LOG: str = os.getenv("PHASE_TIMING_LOG", "./reports/startup_phases.jsonl")  # 테스트별 준비 단계 시간
+
     # 타임아웃 설정
     DEFAULT_TIMEOUT: int = 10
     LONG_TIMEOUT: int = 30
     SHORT_TIMEOUT: int = 5
 
+    # 디바이스 풀 설정 (pytest-xdist 워커별 디바이스/포트 할당)
+    DEVICE_POOL_FILE: str = os.getenv("DEVICE_POOL_FILE", "./devices.json")
+    DEVICE_LOCK_DIR: str = os.getenv("DEVICE_LOCK_DIR", os.path.join(tempfile.gettempdir(), "woongjin_device_locks"))
+    DEVICE_ACQUIRE_TIMEOUT: float = float(os.getenv("DEVICE_ACQUIRE_TIMEOUT", "300"))
+    DEVICE_POOL_CHECK_SERVER: bool = os.getenv("DEVICE_POOL_CHECK_SERVER", "1") != "0"  # 할당 전 Appium /status 확인
+    SYSTEM_PORT_BASE: int = 8200  # UiAutomator2 systemPort = 8200 + 디바이스 순번
+    MJPEG_PORT_BASE: int = 9200   # mjpegServerPort = 9200 + 디바이스 순번
+
+    # 드라이버 세션 설정
+    DRIVER_SCOPE: str = os.getenv("DRIVER_SCOPE", "session")  # session: 세션 재사용 | function: 테스트마다 새 세션
+    APP_RESET_STRATEGY: str = os.getenv("APP_RESET", "clear")  # none | restart | clear (테스트 사이 앱 상태 초기화)
+    AUTH_RESET_STRATEGY: str = os.getenv("AUTH_RESET", "restart")  # logged_in 테스트용 (앱 데이터 유지 → 로그인 유지)
+
     # 대기 시간 설정
-    POPUP_WAIT: float = 1.5
+    POPUP_WAIT: float = 1.5  # 초기 팝업 처리 후 홈 화면이 이 시간 동안 변화 없으면 완료
+    POPUP_MAX_WAIT: float = float(os.getenv("POPUP_MAX_WAIT", "30"))  # 초기 팝업 처리 최대 시간 (초)
+
+    # 위치 기반 배너 닫기 좌표 캐시 (디바이스/해상도/앱 버전별 학습 좌표)
+    BANNER_POSITION_CACHE: str = os.getenv("BANNER_POSITION_CACHE", "./cache/banner_positions.json")
+    APP_VERSION: str = os.getenv("APP_VERSION", "")  # 설치된 앱 버전 (CI에서 APK 설치 시 지정, 없으면 디바이스에서 조회)
+
+    # 테스트 중 팝업 감시 설정 (opt-in: POPUP_GUARD=1 또는 @pytest.mark.popup_guard)
+    POPUP_GUARD: bool = os.getenv("POPUP_GUARD", "0") == "1"
+    POPUP_GUARD_INTERVAL: float = float(os.getenv("POPUP_GUARD_INTERVAL", "1.0"))  # 감시 틱 간격 (초)
+    POPUP_GUARD_MAX_DUTY: float = 0.2  # 감시 스레드 드라이버 점유율 상한
+    POPUP_GUARD_LOCK_TIMEOUT: float = float(os.getenv("POPUP_GUARD_LOCK_TIMEOUT", "30"))  # 테스트 명령의 감시 잠금 대기 상한 (초)
     APP_LOADING_WAIT: int = 8
     BANNER_WAIT: int = 10  # 배너 로딩 대기 시간 (하드코딩)
 
+    # UI 계층 스냅샷 캐시 설정 (액션이 없으면 TTL 동안 page_source 재사용)
+    HIERARCHY_CACHE_ENABLED: bool = os.getenv("HIERARCHY_CACHE", "1") != "0"
+    HIERARCHY_CACHE_TTL: float = float(os.getenv("HIERARCHY_CACHE_TTL", "1.0"))
+    # 존재/보임 확인을 로컬 로케이터 엔진으로 처리 (페이지 객체별 USE_LOCAL_LOCATORS 로 변경 가능)
+    LOCAL_LOCATOR_ENGINE: bool = os.getenv("LOCAL_LOCATOR_ENGINE", "1") != "0"
+    BENCHMARK: bool = os.getenv("BENCHMARK", "0") == "1"  # 성능 측정 테스트 실행 (또는 -m slow)
+
+    # 화면 안정화 대기 설정 (고정 sleep 대체)
+    SETTLE_QUIET_PERIOD: float = float(os.getenv("SETTLE_QUIET_PERIOD", "0.2"))
+    FIXED_SLEEPS: bool = os.getenv("FIXED_SLEEPS", "0") == "1"  # 디버깅용: 기존 고정 대기로 복원
+
+    # 부재 확인 설정 (화면 안정화 확인 후 즉시 판정, 페이지 객체별 변경 가능)
+    ABSENCE_SETTLE: float = 0.3   # 연속 두 스냅샷 사이 간격 (초)
+    ABSENCE_TIMEOUT: float = 3.0  # 화면이 안정되지 않을 때 최대 대기 (초)
+
+    # 로깅 설정
+    LOG_QUEUE: bool = os.getenv("LOG_QUEUE", "0") == "1"  # 큐 모드 (포맷/파일 쓰기를 리스너 스레드에서)
+    LOG_JSON: bool = os.getenv("LOG_JSON", "0") == "1"    # logs/test_{시각}.jsonl 추가 출력
+    LOG_SAMPLING: str = os.getenv("LOG_SAMPLING", "")      # 레벨별 샘플링 비율 "DEBUG=20,INFO=5"
+    LOG_SAMPLING_BURST: int = 5  # 호출 위치별 처음 N건은 샘플링하지 않음
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_MB", "50")) * 1024 * 1024  # 로그 파일 회전 크기 (0: 회전 안 함)
+    LOG_BACKUP_COUNT: int = int(os.getenv("LOG_BACKUP_COUNT", "10"))  # 보관할 회전본(gzip) 개수
+
     # 스크린샷 설정
     SCREENSHOT_DIR: str = "./screenshots"
+    SCREENSHOT_ASYNC: bool = os.getenv("SCREENSHOT_ASYNC", "1") != "0"  # 백그라운드 저장
+    SCREENSHOT_WRITER_WORKERS: int = 2
+    SCREENSHOT_MAX_PENDING: int = 8  # 저장 대기 최대 개수 (초과 시 캡처 대기)
+    SCREENSHOT_SCALE: float = float(os.getenv("SCREENSHOT_SCALE", "1.0"))  # 축소 비율
+    SCREENSHOT_FORMAT: str = os.getenv("SCREENSHOT_FORMAT", "png")  # png | jpeg | webp
+    SCREENSHOT_QUALITY: int = 85  # jpeg/webp 품질
+    SCREENSHOT_DEDUP: bool = os.getenv("SCREENSHOT_DEDUP", "1") != "0"  # 해시 기반 저장소 사용
+    SCREENSHOT_PHASH: bool = os.getenv("SCREENSHOT_PHASH", "0") == "1"  # 지각 해시 중복 판정
+    SCREENSHOT_PHASH_DISTANCE: int = 2  # 같은 화면으로 볼 지각 해시 최대 비트 차이
+
+    # 픽셀 기반 깨진 이미지 검사 (스크린샷 1장으로 빈/플레이스홀더 이미지 감지)
+    PIXEL_CHECK: bool = os.getenv("PIXEL_CHECK", "0") == "1"
+    PIXEL_SAMPLE_GRID: int = 16  # 고유 색상 샘플 격자 (16×16)
+    PIXEL_BLANK_STD: float = 3.0  # 밝기 표준편차 이하 → 단색
+    PIXEL_BLANK_MIN_SIDE: int = 100  # 단색 판정 최소 크기 (px, 단색 아이콘/구분선 제외)
+    PIXEL_PLACEHOLDER_COLOR_RATIO: float = 0.03  # 고유 색상 비율 이하 → 플레이스홀더 후보
+    PIXEL_PLACEHOLDER_EDGE: float = 4.0  # 평균 밝기 변화량 이하 → 플레이스홀더 후보
+    PIXEL_PLACEHOLDER_MIN_SIDE: int = 200  # 플레이스홀더 판정 최소 크기 (px, 아이콘 제외)
+
+    # 시각 회귀 비교 설정 (기준 이미지 대비 타일 단위 비교)
+    # opt-in: VISUAL_BASELINE=1 일 때만 take_screenshot(baseline=True) 가 기준 이미지와 비교
+    # 기준 이미지는 저장소에 커밋하지 않음 - CI 는 BASELINE_DIR 을 유지되는 경로(캐시/아티팩트)로 지정
+    VISUAL_BASELINE: bool = os.getenv("VISUAL_BASELINE", "0") == "1"
+    BASELINE_DIR: str = os.getenv("BASELINE_DIR", "./baselines")
+    BASELINE_UPDATE: bool = os.getenv("BASELINE_UPDATE", "0") == "1"  # 기준 이미지 갱신 모드
+    BASELINE_TOLERANCE: float = 0.01  # 허용 변경 픽셀 비율 (마스크 제외 영역 기준)
+    BASELINE_TILE_TOLERANCE: float = 0.25  # 타일 하나의 허용 변경 비율 (작은 영역의 큰 변화 감지)
+    BASELINE_TILE_SIZE: int = 64  # 비교 타일 크기 (px)
+    BASELINE_PIXEL_THRESHOLD: int = 24  # 채널 차이가 이 값 이하면 같은 픽셀
 
     # 페이지 소스 저장 경로
     PAGE_SOURCE_DIR: str = "./page_sources"
 
+    # 실패 증거 수집 설정
+    FAILURE_CAPTURE_TIMEOUT: float = float(os.getenv("FAILURE_CAPTURE_TIMEOUT", "10"))  # 전체 제한 시간 (초)
+    FAILURE_ARTIFACT_MAX_COUNT: int = int(os.getenv("FAILURE_ARTIFACT_MAX_COUNT", "50"))  # 세션당 최대 저장 건수
+    FAILURE_ARTIFACT_MAX_BYTES: int = int(os.getenv("FAILURE_ARTIFACT_MAX_MB", "200")) * 1024 * 1024  # 세션당 최대 용량
+
     @staticmethod
-    def get_capabilities(app_name: str = "woongjin") -> Dict[str, str]:
-        """앱별 capabilities 반환"""
+    def get_capabilities(app_name: str = "woongjin", profile: Optional[str] = None) -> Dict[str, Any]:
+        """앱별 capabilities 반환 (성능 프로필 적용한 사본)"""
         if app_name == "woongjin":
-            return AppConfig.WOONGJIN_APP
+            capabilities = dict(AppConfig.WOONGJIN_APP)
         else:
             raise ValueError(f"Unknown app name: {app_name}")
+        capabilities.update(AppConfig._profile(AppConfig.CAPABILITY_PROFILES, profile))
+        return capabilities
+
+    @staticmethod
+    def get_settings(profile: Optional[str] = None) -> Dict[str, Any]:
+        """세션 생성 후 적용할 Appium settings (성능 프로필)"""
+        return dict(AppConfig._profile(AppConfig.SETTINGS_PROFILES, profile))
+
+    @staticmethod
+    def _profile(profiles: Dict[str, Dict[str, Any]], profile: Optional[str]) -> Dict[str, Any]:
+        profile = profile or AppConfig.CAPABILITY_PROFILE
+        if profile not in AppConfig.CAPABILITY_PROFILES:
+            raise ValueError(f"Unknown capability profile: {profile} (사용 가능: {', '.join(AppConfig.CAPABILITY_PROFILES)})")
+        return profiles.get(profile, {})
 
     @staticmethod
     def ensure_directories() -> None:
@@ -2,10 +2,9 @@
 pytest conftest.py - 테스트 픽스처 및 설정
 """
 from typing import Generator
+import allure
 import pytest
-from appium import webdriver
 from appium.webdriver.webdriver import WebDriver
-from appium.options.android import UiAutomator2Options
 from pages.woongjin_app_home_page import WoongjinAppHomePage
 from pages.woongjin_app_search_page import WoongjinAppSearchPage
 from pages.woongjin_app_category_page import WoongjinAppCategoryPage
@@ -13,9 +12,17 @@ from pages.woongjin_app_like_page import WoongjinAppLikePage
 from pages.woongjin_app_login_page import WoongjinAppLoginPage
 from config.app_config import AppConfig
 from pages.woongjin_app_my_tab import WoongjinAppMyTabPage
-from utils.popup_handler import handle_woongjin_popups
+from utils.device_pool import get_device_pool
+from utils.driver_session import DriverSession
+from utils.hierarchy_cache import get_hierarchy_cache, log_cache_stats, stats_delta
 from utils.logger import get_logger
-from datetime import datetime
+from utils.phase_timer import PhaseTimer, log_phase_timing_summary, write_phase_record
+from utils.screenshot_writer import flush_screenshot_writer
+from utils.artifact_store import log_artifact_store_summary
+from utils.banner_position_cache import log_banner_position_summary
+from utils.failure_capture import capture_failure_artifacts, log_failure_capture_summary
+from utils.popup_guardian import get_popup_guardian, log_popup_guardian_summary
+from utils.visual_baseline import log_baseline_summary
 import os
 from dotenv import load_dotenv
 
@@ -23,23 +30,68 @@ logger = get_logger(__name__)
 load_dotenv()
 
 
-@pytest.fixture(scope="function")
-def driver() -> Generator[WebDriver, None, None]:
-    """웅진마켓 앱 드라이버"""
-    # 설정에서 capabilities 가져오기
-    caps = AppConfig.get_capabilities("woongjin")
-    options = UiAutomator2Options().load_capabilities(caps)
-
-    # Appium 드라이버 생성
-    driver = webdriver.Remote(AppConfig.APPIUM_SERVER_URL, options=options)
-
-    # 초기 팝업 처리
-    handle_woongjin_popups(driver, wait_time=AppConfig.POPUP_WAIT)
+@pytest.fixture(scope="session")
+def driver_session() -> Generator[DriverSession, None, None]:
+    """
+    Appium 세션 관리자 (pytest-xdist 사용 시 워커당 1개, 디바이스도 워커당 1대)
+    DRIVER_SCOPE=function 이면 테스트마다 새 세션 (기존 방식)
+    """
+    # 워커별 디바이스 + 포트 할당 (pytest-xdist 병렬 실행 시 디바이스 충돌 방지)
+    pool = get_device_pool()
+    lease = pool.acquire()
+    session = DriverSession(
+        capabilities=lease.capabilities(AppConfig.get_capabilities("woongjin", AppConfig.CAPABILITY_PROFILE)),
+        server_url=lease.appium_url,
+        profile=AppConfig.CAPABILITY_PROFILE,
+    )
+    logger.info(
+        f"드라이버 세션: {lease.udid}, {AppConfig.DRIVER_SCOPE} 범위, 앱 초기화 방식 {session.reset_strategy}, "
+        f"성능 프로필 {session.profile}"
+    )
+    try:
+        yield session
+    finally:
+        session.close()
+        pool.release(lease)
 
-    yield driver
 
-    # 테스트 종료 후 드라이버 종료
-    driver.quit()
+@pytest.fixture(scope="function")
+def driver(request, driver_session: DriverSession) -> Generator[WebDriver, None, None]:
+    """
+    웅진마켓 앱 드라이버 (세션 재사용 + 테스트 전 앱 상태 초기화)
+    logged_in 픽스처를 쓰는 테스트는 앱 데이터를 유지하는 방식으로 초기화 (로그인 유지)
+    popup_guard 마커(또는 POPUP_GUARD=1)가 있으면 테스트 중 팝업 감시 스레드 실행
+    """
+    reset_strategy = None
+    if "logged_in" in request.fixturenames and driver_session.reset_strategy == "clear":
+        reset_strategy = AppConfig.AUTH_RESET_STRATEGY
+    # 준비 단계별 시간 측정 (세션 생성 / 앱 초기화 / 팝업 처리) → JSON lines 기록
+    with PhaseTimer(request.node.nodeid) as timer:
+        driver = driver_session.acquire(reset_strategy)
+    write_phase_record(timer.to_record(mode=driver_session.setup_timings[-1][0]))
+
+    # 테스트 중 팝업 감시 (opt-in)
+    guardian = None
+    if AppConfig.POPUP_GUARD or request.node.get_closest_marker("popup_guard"):
+        guardian = get_popup_guardian(driver)
+        guardian.start(request.node.nodeid)
+
+    # 세션 재사용 시 캐시 통계는 누적값 → 테스트 시작 시점 기준 증가분만 기록
+    cache_before = get_hierarchy_cache(driver).stats()
+    try:
+        yield driver
+    finally:
+        try:
+            if guardian is not None:
+                interruptions = guardian.stop()
+                if interruptions:
+                    allure.attach(
+                        "\n".join(f"{i.popup}: {'처리' if i.handled else '처리 실패'}" for i in interruptions),
+                        name="popup_interruptions", attachment_type=allure.attachment_type.TEXT,
+                    )
+            log_cache_stats(stats_delta(cache_before, get_hierarchy_cache(driver).stats()))
+        finally:
+            driver_session.release()
 
 
 @pytest.fixture(scope="function")
@@ -80,6 +132,38 @@ def test_user_credentials() -> dict:
         "password": os.getenv("TEST_USER_PASSWORD")
     }
 
+@pytest.fixture(scope="function")
+def logged_in(driver_session: DriverSession, home_page: WoongjinAppHomePage,
+              login_page: WoongjinAppLoginPage, test_user_credentials: dict) -> WoongjinAppHomePage:
+    """
+    로그인된 홈 화면 (워커/세션당 UI 로그인 1회)
+    이전 테스트의 로그인 상태가 남아 있으면 마이탭으로 확인만 하고 재사용, 만료됐으면 다시 로그인
+    """
+    user_id = test_user_credentials["user_id"]
+    password = test_user_credentials["password"]
+
+    if driver_session.authenticated_user == user_id:
+        state = home_page.check_login_state()
+        if state == "logged_in":
+            driver_session.login_reuses += 1
+            logger.info(f"🔑 로그인 상태 재사용: {user_id}")
+            home_page.click_home_tab()
+            return home_page
+        logger.info(f"🔑 로그인 만료 ({state}) - 다시 로그인")
+    else:
+        state = home_page.check_login_state()
+
+    if state != "logged_in":
+        assert login_page.is_login_page_visible(), "❌ 로그인 페이지가 보이지 않음"
+        login_page.click_email_login()
+        login_page.email_login(user_id, password)
+        driver_session.logins += 1
+    driver_session.authenticated_user = user_id
+
+    home_page.click_home_tab()
+    assert home_page.home_page_is_visible(), "❌ 로그인 후 홈페이지가 보이지 않음"
+    return home_page
+
 @pytest.fixture(scope="function")
 def wrong_user_credentials() -> dict:
     """잘못된 테스트 사용자 자격 증명"""
@@ -111,6 +195,14 @@ def setup_test_environment() -> Generator[None, None, None]:
     logger.info("테스트 환경 설정 완료")
     logger.info("=" * 80)
     yield
+    # 백그라운드에서 저장 중인 스크린샷 마무리
+    flush_screenshot_writer()
+    log_artifact_store_summary()
+    log_baseline_summary()
+    log_failure_capture_summary()
+    log_popup_guardian_summary()
+    log_banner_position_summary()
+    log_phase_timing_summary()
     logger.info("테스트 환경 정리 완료")
 
 
@@ -131,31 +223,14 @@ def pytest_runtest_makereport(item, call):
             driver = item.funcargs["driver"]
 
             try:
-                # 타임스탬프
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                # 스크린샷/페이지 소스/현재 화면 동시 수집 (제한 시간 내), 파일 저장은 백그라운드
                 test_name = item.nodeid.replace("::", "_").replace("/", "_")
+                artifacts = capture_failure_artifacts(driver, test_name)
 
-                # 스크린샷 저장
-                screenshot_dir = AppConfig.SCREENSHOT_DIR
-                os.makedirs(screenshot_dir, exist_ok=True)
-
-                screenshot_path = f"{screenshot_dir}/FAILED_{test_name}_{timestamp}.png"
-                driver.get_screenshot_as_file(screenshot_path)
-                logger.error(f"📸 실패 스크린샷 저장: {screenshot_path}")
-
-                # 페이지 소스 저장
-                page_source_dir = AppConfig.PAGE_SOURCE_DIR
-                os.makedirs(page_source_dir, exist_ok=True)
-
-                source_path = f"{page_source_dir}/FAILED_{test_name}_{timestamp}.xml"
-                with open(source_path, 'w', encoding='utf-8') as f:
-                    f.write(driver.page_source)
-                logger.error(f"📄 실패 페이지 소스 저장: {source_path}")
-
-                # 현재 액티비티 정보
-                current_activity = driver.current_activity
-                current_package = driver.current_package
-                logger.error(f"📱 현재 화면: {current_package}/{current_activity}")
+                # 메모리의 스크린샷을 바로 첨부 (파일 저장 완료를 기다리지 않음)
+                if artifacts['png'] is not None:
+                    allure.attach(artifacts['png'], name=artifacts['screenshot_name'],
+                                  attachment_type=allure.attachment_type.PNG)
 
             except Exception as e:
                 logger.error(f"실패 캡처 중 에러: {e}")
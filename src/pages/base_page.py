@@ -11,6 +11,13 @@ from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.common.appiumby import AppiumBy
 from config.app_config import AppConfig
 from utils.logger import get_logger
+from utils.ui_hierarchy import IMAGE_VIEW_CLASS, Bounds, find_image_views, image_identity, is_duplicate_candidate
+from utils.hierarchy_cache import HierarchyCache, HierarchySnapshot, get_hierarchy_cache
+from utils.screenshot_writer import get_screenshot_writer, image_extension, write_image
+from utils.artifact_store import get_artifact_store
+from utils.image_analysis import analyze_image_regions
+from utils.visual_baseline import VisualDiff, get_baseline_store
+from utils.element_waits import LocatorMatch, find_first_of, wait_for_any, wait_until_settled
 import time
 
 logger = get_logger(__name__)
@@ -23,9 +30,54 @@ class BasePage:
 
     Locators = Locator
 
+    # 존재/보임 확인을 page_source 스냅샷 + 로컬 로케이터 엔진으로 처리할지 여부
+    USE_LOCAL_LOCATORS: bool = AppConfig.LOCAL_LOCATOR_ENGINE
+
+    # 부재 확인(is_absent) 화면 안정화 기준
+    ABSENCE_SETTLE: float = AppConfig.ABSENCE_SETTLE
+    ABSENCE_TIMEOUT: float = AppConfig.ABSENCE_TIMEOUT
+
+    # 시각 비교(assert_matches_baseline)에서 제외할 동적 영역 (배너, 시계 등)
+    DYNAMIC_REGIONS: List[Locator] = []
+
     def __init__(self, driver: WebDriver) -> None:
         self.driver: WebDriver = driver
         self.wait: WebDriverWait = WebDriverWait(driver, AppConfig.DEFAULT_TIMEOUT)
+        self.last_image_scan_stats: Dict[str, Any] = {}
+
+    @property
+    def hierarchy_cache(self) -> HierarchyCache:
+        """드라이버 단위 UI 계층 스냅샷 캐시"""
+        return get_hierarchy_cache(self.driver)
+
+    def _invalidate_hierarchy(self, reason: str) -> None:
+        """화면을 바꿀 수 있는 액션 후 스냅샷 폐기"""
+        self.hierarchy_cache.invalidate(reason)
+
+    def _check_from_snapshot(self, locator: Locator, check: str = "visible") -> bool:
+        """
+        스냅샷(로컬 로케이터 엔진)으로 존재/보임/클릭 가능 여부 확인
+        True면 원격 조회 생략, False면 서버 대기로 넘김 (아직 안 나타났을 수 있음)
+
+        Args:
+            check: "present" | "visible" | "clickable"
+        """
+        if not (AppConfig.HIERARCHY_CACHE_ENABLED and self.USE_LOCAL_LOCATORS):
+            return False
+        cache = self.hierarchy_cache
+        try:
+            snapshot = cache.snapshot()
+        except Exception as e:
+            logger.debug("계층 스냅샷 조회 실패: %s", e)
+            return False
+        if check == "clickable":
+            result = snapshot.is_clickable(locator)
+        elif check == "present":
+            result = bool(snapshot.find(locator))
+        else:
+            result = snapshot.is_visible(locator)
+        cache.record(found=bool(result))
+        return bool(result)
     
     def find_element(self, locator: Locator, timeout: int = 10) -> WebElement:
         """요소 찾기"""
@@ -33,7 +85,7 @@ class BasePage:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
             )
-            logger.info(f"Element found: {locator}")
+            logger.info("Element found: %s", locator)
             return element
         except TimeoutException as e:
             logger.error(f"Failed to find element: {locator} - {e}")
@@ -52,7 +104,8 @@ class BasePage:
                 EC.element_to_be_clickable(locator)
             )
             element.click()
-            logger.info(f"Clicked element: {locator}")
+            self._invalidate_hierarchy("click")
+            logger.info("Clicked element: %s", locator)
             return element
         except (TimeoutException, Exception) as e:
             logger.error(f"Failed to click element: {locator} - {e}")
@@ -60,14 +113,17 @@ class BasePage:
         
     def is_element_clickable(self, locator: Locator, timeout: int = 10) -> bool:
         """요소가 클릭 가능한지 확인"""
+        if self._check_from_snapshot(locator, check="clickable"):
+            logger.info("Element is clickable (snapshot): %s", locator)
+            return True
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.element_to_be_clickable(locator)
             )
-            logger.info(f"Element is clickable: {locator}")
+            logger.info("Element is clickable: %s", locator)
             return True
         except TimeoutException:
-            logger.info(f"Element is not clickable: {locator}")
+            logger.info("Element is not clickable: %s", locator)
             return False
     
     def input_text(self, locator: Locator, text: str, timeout: int = 10) -> WebElement:
@@ -76,56 +132,182 @@ class BasePage:
             element = self.find_element(locator, timeout)
             element.clear()
             element.send_keys(text)
+            self._invalidate_hierarchy("input_text")
             masked = "****" if "password" in str(locator).lower() else text
-            logger.info(f"Input text to {locator}: {masked}")
+            logger.info("Input text to %s: %s", locator, masked)
             return element
         except Exception as e:
             logger.error(f"Failed to input text to {locator} - {e}")
             raise
     
-    def swipe_up(self, start_x: int = 500, start_y: int = 1500, end_x: int = 500, end_y: int = 500, duration: int = 500) -> None:
+    def swipe_up(self, start_x: int = 500, start_y: int = 1500, end_x: int = 500, end_y: int = 500, duration: int = 500,
+                 settle: float = 0.5) -> None:
         """위로 스와이프"""
-        logger.debug(f"스와이프 UP: ({start_x},{start_y}) → ({end_x},{end_y})")
+        logger.debug("스와이프 UP: (%s,%s) → (%s,%s)", start_x, start_y, end_x, end_y)
         self.driver.swipe(start_x, start_y, end_x, end_y, duration)
-        time.sleep(0.5)  # 스와이프 후 안정화 대기
+        self._invalidate_hierarchy("swipe_up")
+        self.wait_until_settled(max_wait=settle)  # 스와이프 후 안정화 대기 (settle: 최대 대기 시간)
 
-    def swipe_down(self, start_x: int = 500, start_y: int = 500, end_x: int = 500, end_y: int = 1500, duration: int = 500) -> None:
+    def swipe_down(self, start_x: int = 500, start_y: int = 500, end_x: int = 500, end_y: int = 1500, duration: int = 500,
+                   settle: float = 0.5) -> None:
         """아래로 스와이프"""
-        logger.debug(f"스와이프 DOWN: ({start_x},{start_y}) → ({end_x},{end_y})")
+        logger.debug("스와이프 DOWN: (%s,%s) → (%s,%s)", start_x, start_y, end_x, end_y)
         self.driver.swipe(start_x, start_y, end_x, end_y, duration)
-        time.sleep(0.5)  # 스와이프 후 안정화 대기
+        self._invalidate_hierarchy("swipe_down")
+        self.wait_until_settled(max_wait=settle)  # 스와이프 후 안정화 대기 (settle: 최대 대기 시간)
+
+    def wait_until_settled(self, max_wait: float = 2.0, quiet_period: float = AppConfig.SETTLE_QUIET_PERIOD) -> bool:
+        """
+        화면이 안정될 때까지 대기 (고정 sleep 대체)
+        연속 두 계층 지문이 같으면 즉시 반환, FIXED_SLEEPS=1 이면 max_wait 고정 대기
+        """
+        return wait_until_settled(self.driver, max_wait=max_wait, quiet_period=quiet_period)
+
+    def press_keycode(self, keycode: int) -> None:
+        """안드로이드 키 입력 (예: 66=Enter, 4=Back)"""
+        self.driver.press_keycode(keycode)
+        self._invalidate_hierarchy("press_keycode")
+        logger.info("Pressed keycode: %s", keycode)
+
+    def hide_keyboard(self) -> None:
+        """키보드 숨기기"""
+        self.driver.hide_keyboard()
+        self._invalidate_hierarchy("hide_keyboard")
 
     def scroll_to_element(self, locator: Locator, max_scrolls: int = 5) -> WebElement:
         """요소가 나올 때까지 스크롤"""
         for i in range(max_scrolls):
             try:
                 element = self.find_element(locator, timeout=2)
-                logger.info(f"Element found after {i+1} scroll(s): {locator}")
+                logger.info("Element found after %s scroll(s): %s", i+1, locator)
                 return element
             except (TimeoutException, NoSuchElementException):
-                logger.info(f"Scrolling up... ({i+1}/{max_scrolls})")
+                logger.info("Scrolling up... (%s/%s)", i+1, max_scrolls)
                 self.swipe_up()
         logger.error(f"Element not found after {max_scrolls} scrolls: {locator}")
         raise NoSuchElementException(f"Element not found after {max_scrolls} scrolls")
     
-    def take_screenshot(self, name: str = "screenshot") -> Optional[str]:
-        """스크린샷 저장"""
+    def take_screenshot(self, name: str = "screenshot", baseline: bool = False) -> Optional[str]:
+        """
+        스크린샷 저장
+
+        Args:
+            name: 스크린샷 이름
+            baseline: True 이고 VISUAL_BASELINE=1 이면 같은 캡처를 기준 이미지와 비교 (다르면 AssertionError)
+        """
         try:
             AppConfig.ensure_directories()
-            screenshot_path = f"{AppConfig.SCREENSHOT_DIR}/{name}.png"
-            self.driver.get_screenshot_as_file(screenshot_path)
-            logger.info(f"Screenshot saved to {screenshot_path}")
-            return screenshot_path
+            png = self.driver.get_screenshot_as_png()
+            screenshot_path = self._store_screenshot(name, png)
         except Exception as e:
             logger.error(f"Failed to take screenshot: {e}")
             return None
+        if baseline and AppConfig.VISUAL_BASELINE:
+            self._compare_with_baseline(name, png)
+        return screenshot_path
+
+    def _store_screenshot(self, name: str, png: bytes) -> str:
+        """캡처한 PNG bytes 저장 (설정에 따라 해시 저장소/백그라운드 저장)"""
+        # 재인코딩 형식(SCREENSHOT_FORMAT)에 맞는 확장자 (ScreenshotWriter.submit 과 동일)
+        screenshot_path = f"{AppConfig.SCREENSHOT_DIR}/{name}.{image_extension()}"
+        if not AppConfig.SCREENSHOT_ASYNC:
+            if AppConfig.SCREENSHOT_DEDUP:
+                screenshot_path = get_artifact_store().put(name, png)
+            else:
+                write_image(png, screenshot_path)
+            logger.info("Screenshot saved to %s", screenshot_path)
+            return screenshot_path
+
+        # 테스트 스레드는 캡처만, 파일 저장은 백그라운드에서
+        if AppConfig.SCREENSHOT_DEDUP:
+            # 같은 이미지는 한 번만 저장, 이름은 index.jsonl 로 참조
+            screenshot_path = get_artifact_store().put(name, png, writer=get_screenshot_writer())
+        else:
+            screenshot_path = get_screenshot_writer().submit(png, screenshot_path)
+        logger.info("Screenshot queued to %s (%s)", screenshot_path, name)
+        return screenshot_path
+
+    def assert_matches_baseline(self, name: str, tolerance: float = AppConfig.BASELINE_TOLERANCE,
+                                mask_locators: Optional[List[Locator]] = None,
+                                tile_tolerance: float = AppConfig.BASELINE_TILE_TOLERANCE) -> VisualDiff:
+        """
+        현재 화면을 기준 이미지와 비교 (다르면 AssertionError)
+        기준 이미지가 없으면 현재 화면을 기준으로 저장 (BASELINE_UPDATE=1 이면 항상 갱신)
+
+        캡처는 take_screenshot 과 같이 저장되므로 take_screenshot 대신 사용
+        (VISUAL_BASELINE 과 관계없이 항상 비교 - 스모크 테스트는 take_screenshot(baseline=True) 사용)
+
+        Args:
+            name: 기준 이미지 이름
+            tolerance: 허용 변경 픽셀 비율 (마스크 제외 영역 기준, 기본 1%)
+            mask_locators: 추가로 제외할 동적 영역 (페이지의 DYNAMIC_REGIONS 에 더해짐)
+            tile_tolerance: 타일 하나의 허용 변경 비율 (기본 25%) - 작은 영역이 통째로 바뀐 경우 감지
+        """
+        AppConfig.ensure_directories()
+        name = name[:-4] if name.endswith(".png") else name
+        png = self.driver.get_screenshot_as_png()
+        self._store_screenshot(name, png)
+        return self._compare_with_baseline(name, png, tolerance, mask_locators, tile_tolerance)
+
+    def _compare_with_baseline(self, name: str, png: bytes, tolerance: float = AppConfig.BASELINE_TOLERANCE,
+                               mask_locators: Optional[List[Locator]] = None,
+                               tile_tolerance: float = AppConfig.BASELINE_TILE_TOLERANCE) -> VisualDiff:
+        """캡처한 PNG 를 기준 이미지와 비교 (동적 영역은 현재 계층 bounds 로 마스킹)"""
+        name = name[:-4] if name.endswith(".png") else name
+        snapshot = self.hierarchy_cache.snapshot()
+        mask_bounds = self._dynamic_region_bounds(snapshot, list(self.DYNAMIC_REGIONS) + list(mask_locators or []))
+        result = get_baseline_store().compare(
+            name, png, mask_bounds=mask_bounds, screen_size=self._screen_size(snapshot),
+            tolerance=tolerance, tile_tolerance=tile_tolerance
+        )
+        logger.info(
+            "📐 시각 비교 [%s]: %s, 변경 %.2f%% (허용 %.2f%%), 최대 타일 변경 %.0f%% (허용 %.0f%%), "
+            "변경 타일 %s개, 마스크 %s개",
+            name, result.status, result.changed_ratio * 100, tolerance * 100,
+            result.max_tile_ratio * 100, tile_tolerance * 100, result.changed_tiles, len(mask_bounds)
+        )
+        if not result.passed(tolerance, tile_tolerance):
+            raise AssertionError(
+                f"기준 이미지와 다름: {name} - {result.status}, 변경 {result.changed_ratio * 100:.2f}% "
+                f"(허용 {tolerance * 100:.2f}%), 최대 타일 변경 {result.max_tile_ratio * 100:.0f}% "
+                f"(허용 {tile_tolerance * 100:.0f}%) (기준: {result.baseline_path}, 히트맵: {result.heatmap_path})"
+            )
+        return result
+
+    @staticmethod
+    def _screen_size(snapshot: Optional[HierarchySnapshot]) -> Optional[Tuple[int, int]]:
+        """계층 기준 화면 크기 (hierarchy 루트의 width/height 속성)"""
+        if snapshot is None or not snapshot.root.get('width') or not snapshot.root.get('height'):
+            return None
+        return int(snapshot.root.get('width')), int(snapshot.root.get('height'))
+
+    def _dynamic_region_bounds(self, snapshot: HierarchySnapshot, locators: List[Locator]) -> List[Bounds]:
+        """
+        동적 영역 bounds 수집 (스냅샷에서 로컬 조회, 원격 호출 없음)
+        앱 창 위쪽(상태바 - 시계/알림 아이콘)은 항상 포함
+        """
+        bounds: List[Bounds] = []
+        tree = snapshot.tree
+        window = tree.root.children[0] if tree.root.children else None
+        if window is not None and window.bounds is not None and window.bounds[1] > 0:
+            screen_size = self._screen_size(snapshot)
+            width = screen_size[0] if screen_size else window.bounds[2]
+            bounds.append((0, 0, width, window.bounds[1]))
+
+        for locator in locators:
+            nodes = snapshot.find(locator)
+            if nodes is None:
+                logger.warning(f"동적 영역 로케이터는 로컬 조회 불가 - 마스크 제외: {locator}")
+                continue
+            bounds.extend(node.bounds for node in nodes if node.is_visible)
+        return bounds
 
     def get_text(self, locator: Locator, timeout: int = 10) -> str:
         """요소의 텍스트 가져오기"""
         try:
             element = self.find_element(locator, timeout)
             text = element.text
-            logger.info(f"Got text from {locator}: {text}")
+            logger.info("Got text from %s: %s", locator, text)
             return text
         except Exception as e:
             logger.error(f"Failed to get text from {locator} - {e}")
@@ -133,24 +315,121 @@ class BasePage:
 
     def is_element_visible(self, locator: Locator, timeout: int = 5) -> bool:
         """요소가 보이는지 확인"""
+        if self._check_from_snapshot(locator):
+            logger.info("Element is visible (snapshot): %s", locator)
+            return True
         try:
             WebDriverWait(self.driver, timeout).until(
                 EC.visibility_of_element_located(locator)
             )
-            logger.info(f"Element is visible: {locator}")
+            logger.info("Element is visible: %s", locator)
             return True
         except TimeoutException:
-            logger.info(f"Element is not visible: {locator}")
+            logger.info("Element is not visible: %s", locator)
             return False
         
 
+    def find_first_of(self, locators: List[Locator], timeout: int = 10, visible: bool = False) -> Optional[LocatorMatch]:
+        """
+        우선순위 순 후보 로케이터 중 먼저 매칭되는 요소 찾기
+        폴링마다 page_source 1회로 모든 후보 확인 (fallback 체인 비용 = 타임아웃 1회)
+
+        Returns:
+            LocatorMatch(index, locator, element), 타임아웃 시 None
+        """
+        match = find_first_of(self.driver, locators, timeout=timeout, visible=visible)
+        if match is None:
+            logger.info("No candidate matched within %ss: %s locators", timeout, len(locators))
+        else:
+            logger.info("Candidate %s/%s matched: %s", match.index + 1, len(locators), match.locator)
+        return match
+
+    def wait_for_any(self, branches: Dict[str, Locator], timeout: int = 5) -> Tuple[Optional[str], Optional[WebElement]]:
+        """
+        여러 결과 분기 중 먼저 보이는 분기 대기
+        모든 분기를 함께 폴링하므로 가장 빠른 분기 시간만큼만 소요
+
+        Args:
+            branches: {분기 이름: 로케이터} - 동시에 보이면 먼저 적힌 분기 우선
+
+        Returns:
+            (분기 이름, 요소), 타임아웃 시 (None, None)
+        """
+        name, element = wait_for_any(self.driver, branches, timeout=timeout)
+        if name is None:
+            logger.info("No branch appeared within %ss: %s", timeout, list(branches))
+        else:
+            logger.info("Branch appeared: %s - %s", name, branches[name])
+        return name, element
+
+    def is_element_present(self, locator: Locator, timeout: int = 5) -> bool:
+        """요소가 (보이지 않더라도) 계층에 존재하는지 확인"""
+        if self._check_from_snapshot(locator, check="present"):
+            logger.info("Element is present (snapshot): %s", locator)
+            return True
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(locator)
+            )
+            logger.info("Element is present: %s", locator)
+            return True
+        except TimeoutException:
+            logger.info("Element is not present: %s", locator)
+            return False
+
+    def is_absent(self, locator: Locator, settle: Optional[float] = None, timeout: Optional[float] = None) -> bool:
+        """
+        요소가 없는지 확인 (존재 타임아웃을 기다리지 않음)
+
+        연속 두 스냅샷의 계층 지문이 같으면(화면 안정) 그 스냅샷 기준으로 즉시 판정
+        보이는 매칭 요소가 없으면 부재로 판단
+
+        Args:
+            settle: 스냅샷 간격 (초), 기본 ABSENCE_SETTLE
+            timeout: 화면이 안정되지 않을 때 최대 대기 (초), 기본 ABSENCE_TIMEOUT
+        """
+        settle = self.ABSENCE_SETTLE if settle is None else settle
+        timeout = self.ABSENCE_TIMEOUT if timeout is None else timeout
+        cache = self.hierarchy_cache
+        deadline = time.monotonic() + timeout
+        started = time.monotonic()
+
+        snapshot = cache.snapshot()
+        settled = False
+        while time.monotonic() < deadline:
+            time.sleep(settle)
+            current = cache.refresh()
+            settled = current.fingerprint == snapshot.fingerprint
+            snapshot = current
+            if settled:
+                break
+
+        visible = snapshot.is_visible(locator)
+        if visible is None:
+            # 로컬 해석 불가 로케이터는 서버에 즉시 조회 (대기 없음)
+            visible = any(e.is_displayed() for e in self.driver.find_elements(*locator))
+
+        elapsed = time.monotonic() - started
+        state = "settled" if settled else "not settled"
+        if visible:
+            logger.info("Element is present (%s, %.2fs): %s", state, elapsed, locator)
+        else:
+            logger.info("Element is absent (%s, %.2fs): %s", state, elapsed, locator)
+        return not visible
+
+    def assert_absent(self, locator: Locator, message: str = "", settle: Optional[float] = None, timeout: Optional[float] = None) -> None:
+        """요소가 없어야 함을 검증 (있으면 AssertionError)"""
+        assert self.is_absent(locator, settle=settle, timeout=timeout), (
+            message or f"요소가 존재하면 안 됩니다: {locator}"
+        )
+
     def wait_for_element(self, locator, timeout: int = 10) -> WebElement:
         """요소가 나타날 때까지 대기"""
         try:
             element = WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located(locator)
             )
-            logger.info(f"Element appeared: {locator}")
+            logger.info("Element appeared: %s", locator)
             return element
         except TimeoutException as e:
             logger.error(f"Element did not appear within {timeout} seconds: {locator} - {e}")
@@ -172,93 +451,141 @@ class BasePage:
                 logger.warning(f"Image is not displayed")
                 return False
 
-            logger.info(f"Image loaded successfully: {image_locator}")
+            logger.info("Image loaded successfully: %s", image_locator)
             return True
 
         except Exception as e:
             logger.error(f"Failed to check image: {image_locator} - {e}")
             return False
 
-    def find_broken_images(self, wait_for_load: bool = True) -> List[Dict[str, Any]]:
+    def find_broken_images(self, wait_for_load: bool = True, use_snapshot: bool = True,
+                           pixel_check: bool = AppConfig.PIXEL_CHECK) -> List[Dict[str, Any]]:
         """
         페이지의 모든 깨진 이미지 찾기
 
         Args:
             wait_for_load: 이미지 로딩 대기 여부 (기본 True)
+            use_snapshot: page_source 1회 조회로 로컬 검증 (기본 True)
+                          False면 이미지마다 원격 호출하는 기존 방식
+            pixel_check: 스크린샷 1장으로 빈/플레이스홀더 이미지까지 검사
+                         (크기는 정상인데 내용이 비어 있는 이미지 감지)
         """
         logger.info("=" * 60)
-        logger.info("이미지 검증 시작")
+        logger.info("이미지 검증 시작 (%s 모드)", '스냅샷' if use_snapshot else '요소별 조회')
 
         broken_images = []
         valid_images = []
+        self.last_image_scan_stats = {}
 
         try:
             # 페이지 로딩 대기
             if wait_for_load:
-                logger.info("이미지 로딩 대기 중... (3초)")
-                time.sleep(3)
+                logger.info("이미지 로딩 대기 중... (최대 3초)")
+                self.wait_until_settled(max_wait=3)
 
-            # 모든 ImageView 요소 찾기
+            # 모든 ImageView 정보 수집
             logger.info("ImageView 요소 검색 중...")
-            images = self.driver.find_elements(
-                AppiumBy.XPATH,
-                "//android.widget.ImageView"
-            )
+            if use_snapshot:
+                images, round_trips, fingerprint = self._collect_images_from_snapshot()
+            else:
+                images, round_trips = self._collect_images_from_elements()
+                fingerprint = None
             total_images = len(images)
-            logger.info(f"총 {total_images}개의 이미지 발견")
+            logger.info("총 %s개의 이미지 발견", total_images)
+
+            # 기존 방식: find_elements 1회 + 이미지당 4회 (size, bounds, resource-id, content-desc)
+            legacy_round_trips = 1 + total_images * 4
+
+            # 픽셀 검사: 스크린샷 1회로 모든 이미지 영역 분석 (요소별 스크린샷이면 이미지당 1회)
+            pixel_results = [None] * total_images
+            if pixel_check and total_images:
+                pixel_results = self._analyze_image_pixels(images)
+                round_trips += 1
+                legacy_round_trips += total_images
+            self.last_image_scan_stats = {
+                'mode': 'snapshot' if use_snapshot else 'elements',
+                'images': total_images,
+                'round_trips': round_trips,
+                'legacy_round_trips': legacy_round_trips,
+                'fingerprint': fingerprint,
+                # 스크롤 간 중복 판정용 (식별 키, 기준 텍스트)
+                'image_keys': [(img['identity'], img['anchor']) for img in images if 'error' not in img],
+            }
+            logger.info("🌐 원격 호출: %s회 (기존 방식: %s회)", round_trips, legacy_round_trips)
 
             if total_images == 0:
                 logger.warning("⚠️ 이미지가 하나도 발견되지 않음! 페이지가 제대로 로드되었는지 확인 필요")
                 return []
 
             # 각 이미지 검증
-            for idx, img in enumerate(images):
-                try:
-                    # 크기 확인
-                    size = img.size
-                    bounds = img.get_attribute('bounds')
-                    resource_id = img.get_attribute('resource-id') or "Unknown"
-                    content_desc = img.get_attribute('content-desc') or ""
-
-                    logger.debug(
-                        f"[{idx+1}/{total_images}] "
-                        f"ID: {resource_id[:50]}, "
-                        f"Size: {size['width']}x{size['height']}"
-                    )
+            for img in images:
+                idx = img['index']
+                if 'error' in img:
+                    logger.error(f"이미지 [{idx+1}] 검증 중 에러: {img['error']}")
+                    broken_images.append({
+                        'index': idx,
+                        'reason_code': 'CHECK_ERROR',
+                        'reason': f"Error checking image: {img['error']}"
+                    })
+                    continue
+
+                size = img['size']
+                resource_id = img['resource_id']
 
-                    # 크기가 너무 작으면 깨진 이미지로 판단
-                    if size['width'] <= 1 or size['height'] <= 1:
-                        broken_images.append({
-                            'index': idx,
-                            'resource_id': resource_id,
-                            'content_desc': content_desc,
-                            'bounds': bounds,
-                            'size': size,
-                            'reason': 'Invalid size (width or height <= 1)'
-                        })
-                        logger.warning(
-                            f"❌ 깨진 이미지 발견 [{idx+1}]: "
-                            f"ID={resource_id}, Size={size}"
-                        )
-                    else:
-                        valid_images.append({
-                            'index': idx,
-                            'resource_id': resource_id,
-                            'size': size
-                        })
-
-                except Exception as e:
-                    logger.error(f"이미지 [{idx+1}] 검증 중 에러: {e}")
+                # 이미지마다 기록 - 포맷은 DEBUG 가 켜져 있을 때만 (대량 화면은 LOG_SAMPLING 으로 샘플링)
+                logger.debug("[%s/%s] ID: %.50s, Size: %sx%s", idx + 1, total_images, resource_id,
+                             size['width'], size['height'])
+
+                # 크기가 너무 작으면 깨진 이미지로 판단
+                if size['width'] <= 1 or size['height'] <= 1:
+                    broken_images.append({
+                        'index': idx,
+                        'resource_id': resource_id,
+                        'content_desc': img['content_desc'],
+                        'bounds': img['bounds'],
+                        'size': size,
+                        'identity': img['identity'],
+                        'anchor': img['anchor'],
+                        'reason_code': 'INVALID_SIZE',
+                        'reason': 'Invalid size (width or height <= 1)'
+                    })
+                    logger.warning(
+                        f"❌ 깨진 이미지 발견 [{idx+1}]: "
+                        f"ID={resource_id}, Size={size}"
+                    )
+                elif pixel_results[idx] is not None and pixel_results[idx]['reason_code']:
+                    pixels = pixel_results[idx]
                     broken_images.append({
                         'index': idx,
-                        'reason': f'Error checking image: {str(e)}'
+                        'resource_id': resource_id,
+                        'content_desc': img['content_desc'],
+                        'bounds': img['bounds'],
+                        'size': size,
+                        'identity': img['identity'],
+                        'anchor': img['anchor'],
+                        'reason_code': pixels['reason_code'],
+                        'reason': (
+                            f"Blank or placeholder pixels (std={pixels['std']}, "
+                            f"edge={pixels['edge_energy']}, colors={pixels['unique_ratio']})"
+                        ),
+                        'pixel_stats': pixels,
+                    })
+                    logger.warning(
+                        f"❌ 빈 이미지 발견 [{idx+1}]: "
+                        f"ID={resource_id}, {pixels['reason_code']}, Bounds={img['bounds']}"
+                    )
+                else:
+                    valid_images.append({
+                        'index': idx,
+                        'resource_id': resource_id,
+                        'size': size
                     })
 
             # 결과 요약
             logger.info("=" * 60)
-            logger.info(f"✅ 정상 이미지: {len(valid_images)}개")
-            logger.info(f"❌ 깨진 이미지: {len(broken_images)}개")
-            logger.info(f"📊 전체 검사율: {(len(valid_images) + len(broken_images)) / total_images * 100:.1f}%")
+            logger.info("✅ 정상 이미지: %s개", len(valid_images))
+            logger.info("❌ 깨진 이미지: %s개", len(broken_images))
+            logger.info("📊 전체 검사율: %.1f%%", (len(valid_images) + len(broken_images)) / total_images * 100)
             logger.info("=" * 60)
 
             return broken_images
@@ -267,7 +594,60 @@ class BasePage:
             logger.error(f"❌ 이미지 검증 실패: {e}", exc_info=True)
             return []
 
-    def find_broken_images_with_scroll(self, max_scrolls: int = 5, scroll_pause: int = 1) -> List[Dict[str, Any]]:
+    def _collect_images_from_snapshot(self) -> Tuple[List[Dict[str, Any]], int, str]:
+        """
+        page_source 1회 조회 후 로컬 파싱으로 ImageView 정보 수집 (원격 호출 1회)
+        같은 스냅샷의 계층 지문도 함께 반환 (스크롤 끝 감지용)
+        """
+        # 직전 안정화 대기에서 받은 스냅샷이 유효하면 재사용
+        snapshot = self.hierarchy_cache.snapshot()
+        return find_image_views(snapshot.root), 1, snapshot.fingerprint
+
+    def _analyze_image_pixels(self, images: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        스크린샷 1장을 찍어 모든 이미지 영역의 픽셀 통계 분석
+
+        Returns:
+            이미지별 분석 결과 (images 순서, 분석 불가/에러 이미지는 None)
+        """
+        png = self.driver.get_screenshot_as_png()
+        # 계층 기준 화면 크기 (스크린샷 해상도와 다르면 bounds 비율 보정)
+        screen_size = self._screen_size(self.hierarchy_cache.peek())
+        bounds_list = [img.get('bounds') for img in images]
+        results = analyze_image_regions(png, bounds_list, screen_size)
+        analyzed = sum(1 for result in results if result is not None)
+        logger.info("🔍 픽셀 검사: %s/%s개 영역 분석 (스크린샷 1회)", analyzed, len(images))
+        return results
+
+    def _collect_images_from_elements(self) -> Tuple[List[Dict[str, Any]], int]:
+        """ImageView 요소마다 속성을 원격 조회 (원격 호출 1 + 이미지당 4회)"""
+        elements = self.driver.find_elements(
+            AppiumBy.XPATH,
+            f"//{IMAGE_VIEW_CLASS}"
+        )
+        round_trips = 1
+        images = []
+        for idx, img in enumerate(elements):
+            try:
+                bounds = img.get_attribute('bounds')
+                resource_id = img.get_attribute('resource-id') or "Unknown"
+                content_desc = img.get_attribute('content-desc') or ""
+                images.append({
+                    'index': idx,
+                    'size': img.size,
+                    'bounds': bounds,
+                    'resource_id': resource_id,
+                    'content_desc': content_desc,
+                    'identity': image_identity(resource_id, content_desc),
+                    'anchor': None,
+                })
+                round_trips += 4
+            except Exception as e:
+                images.append({'index': idx, 'error': str(e)})
+        return images, round_trips
+
+    def find_broken_images_with_scroll(self, max_scrolls: int = 5, scroll_pause: int = 1, use_snapshot: bool = True,
+                                       pixel_check: bool = AppConfig.PIXEL_CHECK) -> List[Dict[str, Any]]:
         """
         스크롤하며 전체 페이지의 깨진 이미지 찾기
         실무용: 긴 리스트 페이지에서 모든 상품 확인
@@ -275,47 +655,92 @@ class BasePage:
         Args:
             max_scrolls: 최대 스크롤 횟수
             scroll_pause: 스크롤 간 대기 시간(초)
+            use_snapshot: page_source 스냅샷 모드 사용 여부
+            pixel_check: 화면마다 스크린샷 1장으로 빈/플레이스홀더 이미지 검사
         """
         logger.info("=" * 60)
-        logger.info(f"스크롤 이미지 검증 시작 (최대 {max_scrolls}회)")
+        logger.info("스크롤 이미지 검증 시작 (최대 %s회)", max_scrolls)
 
         all_broken_images = []
-        all_valid_images = []
-        previous_page_source = None
+        seen_images = set()
+        duplicate_count = 0
+        unidentified_count = 0  # 식별 키가 없거나 기준 텍스트가 고정된 이미지 (중복 판정 없이 매번 집계)
+        previous_anchors = set()  # 직전 화면의 기준 텍스트 (움직이지 않은 기준은 중복 판정 제외)
+        previous_fingerprint = None
         scroll_count = 0
+        total_round_trips = 0
+        total_legacy_round_trips = 0
 
         for scroll_num in range(max_scrolls + 1):  # 0번째(현재 화면) 포함
-            logger.info(f"\n[스크롤 {scroll_num}/{max_scrolls}] 이미지 검증 중...")
+            logger.info("\n[스크롤 %s/%s] 이미지 검증 중...", scroll_num, max_scrolls)
 
             # 현재 화면 이미지 검증 (대기 없이)
-            broken_images = self.find_broken_images(wait_for_load=False)
-            all_broken_images.extend(broken_images)
-
-            # 페이지 소스로 스크롤 끝 감지
-            current_page_source = self.driver.page_source
-
-            if previous_page_source == current_page_source:
-                logger.info(f"⚠️ 페이지 끝 도달 (스크롤 {scroll_num}회 후)")
+            broken_images = self.find_broken_images(wait_for_load=False, use_snapshot=use_snapshot,
+                                                    pixel_check=pixel_check)
+            scan_stats = self.last_image_scan_stats
+            total_round_trips += scan_stats.get('round_trips', 0)
+            # 기존 방식은 스크롤 끝 감지를 위해 page_source 추가 조회
+            total_legacy_round_trips += scan_stats.get('legacy_round_trips', 0) + 1
+
+            # 스크롤 겹침으로 다시 보이는 이미지는 한 번만 집계 (식별 키가 확실한 경우만)
+            for img in broken_images:
+                if is_duplicate_candidate(img, previous_anchors) and img['identity'] in seen_images:
+                    continue
+                all_broken_images.append(img)
+            image_keys = scan_stats.get('image_keys', [])
+            for identity, anchor in image_keys:
+                if not is_duplicate_candidate({'identity': identity, 'anchor': anchor}, previous_anchors):
+                    unidentified_count += 1
+                    continue
+                if identity in seen_images:
+                    duplicate_count += 1
+                seen_images.add(identity)
+            previous_anchors = {anchor for _, anchor in image_keys if anchor is not None}
+
+            # 계층 지문으로 스크롤 끝 감지 (스냅샷 모드는 추가 조회 없음)
+            current_fingerprint = scan_stats.get('fingerprint')
+            if current_fingerprint is None:
+                current_fingerprint = self.hierarchy_cache.refresh().fingerprint
+                total_round_trips += 1
+
+            if previous_fingerprint == current_fingerprint:
+                logger.info("⚠️ 페이지 끝 도달 (스크롤 %s회 후)", scroll_num)
                 break
 
-            previous_page_source = current_page_source
+            previous_fingerprint = current_fingerprint
 
             # 마지막 스크롤이 아니면 계속 스크롤
             if scroll_num < max_scrolls:
-                logger.info(f"📜 스크롤 UP 실행...")
-                self.swipe_up()
-                time.sleep(scroll_pause)
+                logger.info("📜 스크롤 UP 실행...")
+                fetches_before = self.hierarchy_cache.fetches
+                self.swipe_up(settle=scroll_pause)
+                # 스와이프 1회 + 안정화 대기가 실제로 조회한 page_source 횟수 (기존 방식은 고정 sleep)
+                total_round_trips += 1 + self.hierarchy_cache.fetches - fetches_before
+                total_legacy_round_trips += 1
                 scroll_count += 1
 
         # 결과 요약
         logger.info("=" * 60)
-        logger.info(f"✅ 총 스크롤 횟수: {scroll_count}회")
-        logger.info(f"❌ 전체 깨진 이미지: {len(all_broken_images)}개")
+        logger.info("✅ 총 스크롤 횟수: %s회", scroll_count)
+        logger.info("🖼️ 고유 이미지: %s개 (중복 제외: %s회, 식별 불가로 중복 판정 안 함: %s개)",
+                    len(seen_images) + unidentified_count, duplicate_count, unidentified_count)
+        logger.info("❌ 전체 깨진 이미지: %s개", len(all_broken_images))
+        logger.info("🌐 전체 원격 호출: %s회 (기존 방식: %s회)", total_round_trips, total_legacy_round_trips)
         logger.info("=" * 60)
 
+        self.last_image_scan_stats = {
+            'mode': 'snapshot' if use_snapshot else 'elements',
+            'scrolls': scroll_count,
+            'images': len(seen_images) + unidentified_count,
+            'duplicates': duplicate_count,
+            'unidentified': unidentified_count,
+            'round_trips': total_round_trips,
+            'legacy_round_trips': total_legacy_round_trips,
+        }
         return all_broken_images
 
-    def save_broken_images_report(self, report_filename: str = "broken_images_report.txt", wait_for_load: bool = True, with_scroll: bool = False, max_scrolls: int = 5) -> Tuple[str, List[Dict[str, Any]]]:
+    def save_broken_images_report(self, report_filename: str = "broken_images_report.txt", wait_for_load: bool = True, with_scroll: bool = False, max_scrolls: int = 5, use_snapshot: bool = True,
+                                  pixel_check: bool = AppConfig.PIXEL_CHECK) -> Tuple[str, List[Dict[str, Any]]]:
         """
         깨진 이미지 리포트 저장
 
@@ -324,18 +749,23 @@ class BasePage:
             wait_for_load: 이미지 로딩 대기 여부
             with_scroll: 스크롤하며 전체 확인 여부 (실무용)
             max_scrolls: 스크롤 최대 횟수
+            use_snapshot: page_source 스냅샷 모드 사용 여부 (원격 호출 최소화)
+            pixel_check: 스크린샷 픽셀 분석으로 빈/플레이스홀더 이미지 검사 (사유 코드 BLANK_PIXELS, PLACEHOLDER_PIXELS)
         """
         from datetime import datetime
 
         AppConfig.ensure_directories()
 
-        logger.info(f"이미지 리포트 생성 시작: {report_filename}")
+        logger.info("이미지 리포트 생성 시작: %s", report_filename)
 
         if with_scroll:
-            logger.info(f"🔄 스크롤 모드: 최대 {max_scrolls}회 스크롤하며 확인")
-            broken_images = self.find_broken_images_with_scroll(max_scrolls=max_scrolls)
+            logger.info("🔄 스크롤 모드: 최대 %s회 스크롤하며 확인", max_scrolls)
+            broken_images = self.find_broken_images_with_scroll(max_scrolls=max_scrolls, use_snapshot=use_snapshot,
+                                                                pixel_check=pixel_check)
         else:
-            broken_images = self.find_broken_images(wait_for_load=wait_for_load)
+            broken_images = self.find_broken_images(wait_for_load=wait_for_load, use_snapshot=use_snapshot,
+                                                    pixel_check=pixel_check)
+        scan_stats = self.last_image_scan_stats
 
         report_path = f"{AppConfig.SCREENSHOT_DIR}/{report_filename}"
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -347,6 +777,21 @@ class BasePage:
             if with_scroll:
                 f.write(f"최대 스크롤: {max_scrolls}회\n")
             f.write(f"깨진 이미지 발견: {len(broken_images)}개\n")
+            if pixel_check:
+                f.write("픽셀 검사: 사용 (스크린샷 1장으로 빈/플레이스홀더 이미지 확인)\n")
+            reason_counts: Dict[str, int] = {}
+            for img in broken_images:
+                code = img.get('reason_code', 'UNKNOWN')
+                reason_counts[code] = reason_counts.get(code, 0) + 1
+            if reason_counts:
+                f.write(f"사유별: {', '.join(f'{code} {count}개' for code, count in reason_counts.items())}\n")
+            if scan_stats.get('images') is not None:
+                f.write(f"검사한 고유 이미지: {scan_stats['images']}개\n")
+            if scan_stats:
+                f.write(
+                    f"원격 호출: {scan_stats.get('round_trips')}회 "
+                    f"(기존 방식: {scan_stats.get('legacy_round_trips')}회)\n"
+                )
             f.write("=" * 70 + "\n\n")
 
             if broken_images:
@@ -356,10 +801,11 @@ class BasePage:
                     f.write(f"Content-Desc: {img.get('content_desc', 'N/A')}\n")
                     f.write(f"Bounds: {img.get('bounds', 'N/A')}\n")
                     f.write(f"Size: {img.get('size', 'N/A')}\n")
+                    f.write(f"Reason Code: {img.get('reason_code', 'N/A')}\n")
                     f.write(f"Reason: {img.get('reason')}\n")
                     f.write("-" * 70 + "\n")
             else:
                 f.write("✅ 깨진 이미지 없음!\n")
 
-        logger.info(f"📄 리포트 저장 완료: {report_path}")
+        logger.info("📄 리포트 저장 완료: %s", report_path)
         return report_path, broken_images
\ No newline at end of file
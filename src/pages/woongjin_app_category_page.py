@@ -5,7 +5,9 @@ from pages.base_page import BasePage
 
 
 class WoongjinAppCategoryPage(BasePage):
+
+    CATEGORY_PAGE_TITLE = (AppiumBy.XPATH, "//android.widget.TextView[@text='카테고리']")
+
     def is_category_page_visible(self) -> bool:
         """카테고리 페이지가 보이는지 확인"""
-        CATEGORY_PAGE_TITLE = (AppiumBy.XPATH, "//android.widget.TextView[@text='카테고리']")
-        return self.is_element_visible(CATEGORY_PAGE_TITLE)
\ No newline at end of file
+        return self.is_element_visible(self.CATEGORY_PAGE_TITLE)
\ No newline at end of file
@@ -1,5 +1,11 @@
+from typing import Optional
 from appium.webdriver.common.appiumby import AppiumBy
 from pages.base_page import BasePage
+from pages.woongjin_app_category_page import WoongjinAppCategoryPage
+from pages.woongjin_app_like_page import WoongjinAppLikePage
+from pages.woongjin_app_login_page import WoongjinAppLoginPage
+from pages.woongjin_app_my_tab import WoongjinAppMyTabPage
+from pages.woongjin_app_search_page import WoongjinAppSearchPage
 
 
 class WoongjinAppHomePage(BasePage):
@@ -16,10 +22,47 @@ class WoongjinAppHomePage(BasePage):
     # 홈 화면 확인용 로케이터
     HOME_LOGO = (AppiumBy.XPATH, "//android.widget.TextView[@text='웅진마켓로고']")
 
+    # 시각 비교 제외 영역 (자동으로 넘어가는 배너 컨테이너만 - 나머지 이미지는 비교 대상)
+    DYNAMIC_REGIONS = [
+        (AppiumBy.ID, "groobeeWrap"),                                   # 이벤트 배너
+        (AppiumBy.XPATH, "//*[contains(@resource-id, 'banner')]"),      # 메인 롤링 배너
+        (AppiumBy.XPATH, "//androidx.viewpager.widget.ViewPager"),      # 슬라이드 배너
+    ]
+
     def home_page_is_visible(self) -> bool:
         """홈 페이지가 보이는지 확인"""
         return self.is_element_visible(self.HOME_LOGO)
 
+    # 화면 식별용 로케이터 (동시에 보이면 먼저 적힌 화면 우선)
+    SCREEN_MARKERS = {
+        "home": HOME_LOGO,
+        "login": WoongjinAppLoginPage.LOGIN_PAGE_TITLE,
+        "category": WoongjinAppCategoryPage.CATEGORY_PAGE_TITLE,
+        "search": WoongjinAppSearchPage.SEARCH_PAGE_TITLE,
+        "like": WoongjinAppLikePage.LIKE_PAGE_TITLE,
+        "my": WoongjinAppMyTabPage.MY_TAB_PAGE_TITLE,
+    }
+
+    def identify_screen(self, timeout: int = 5) -> Optional[str]:
+        """현재 화면 식별 (모든 화면 마커를 함께 대기), 알 수 없으면 None"""
+        name, _ = self.wait_for_any(self.SCREEN_MARKERS, timeout=timeout)
+        return name
+
+    def check_login_state(self, timeout: int = 5) -> Optional[str]:
+        """
+        마이탭으로 로그인 상태 확인 (탭 클릭 1회 + 두 화면 함께 대기)
+
+        Returns:
+            'logged_in' (마이페이지 노출), 'logged_out' (로그인 페이지 노출), 알 수 없으면 None
+            확인 후 화면은 마이페이지 또는 로그인 페이지
+        """
+        self.click_my_page_tab()
+        state, _ = self.wait_for_any({
+            "logged_in": WoongjinAppMyTabPage.MY_TAB_PAGE_TITLE,
+            "logged_out": WoongjinAppLoginPage.LOGIN_PAGE_TITLE,
+        }, timeout=timeout)
+        return state
+
 
     def click_search(self):
         """검색 버튼 클릭"""
@@ -45,11 +88,11 @@ class WoongjinAppHomePage(BasePage):
         """검색 탭 클릭"""
         self.click(self.SEARCH_TAB)
 
-    def swipe_down(self, start_x = 500, start_y = 500, end_x = 500, end_y = 1500, duration = 500):
-        return super().swipe_down(start_x, start_y, end_x, end_y, duration)
+    def swipe_down(self, start_x = 500, start_y = 500, end_x = 500, end_y = 1500, duration = 500, settle = 0.5):
+        return super().swipe_down(start_x, start_y, end_x, end_y, duration, settle)
     
-    def swipe_up(self, start_x = 500, start_y = 1500, end_x = 500, end_y = 500, duration = 500):
-        return super().swipe_up(start_x, start_y, end_x, end_y, duration)
+    def swipe_up(self, start_x = 500, start_y = 1500, end_x = 500, end_y = 500, duration = 500, settle = 0.5):
+        return super().swipe_up(start_x, start_y, end_x, end_y, duration, settle)
     
 
     def is_category_page_loaded(self) -> bool:
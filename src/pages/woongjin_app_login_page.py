@@ -67,17 +67,16 @@ class WoongjinAppLoginPage(BasePage):
         """이메일 로그인 수행"""
         self.enter_username(username)
         self.enter_password(password)
-        self.driver.hide_keyboard()
+        self.hide_keyboard()
         self.click_login_button()
 
     def get_error_message(self) -> str:
-        """오류 메시지 가져오기"""
-        if self.is_element_visible(self.INVALID_ACCOUNT_MESSAGE):
-            return self.get_element_text(self.INVALID_ACCOUNT_MESSAGE)
-        elif self.is_element_visible(self.INVALID_CREDENTIALS_MESSAGE):
-            return self.get_element_text(self.INVALID_CREDENTIALS_MESSAGE)
-        else:
-            return ""
+        """오류 메시지 가져오기 (두 메시지를 함께 대기)"""
+        _, element = self.wait_for_any({
+            "invalid_account": self.INVALID_ACCOUNT_MESSAGE,
+            "invalid_credentials": self.INVALID_CREDENTIALS_MESSAGE,
+        })
+        return element.text if element else ""
         
     def close_error_popup(self) -> None:
         """오류 팝업 닫기"""
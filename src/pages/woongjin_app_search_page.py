@@ -13,6 +13,11 @@ class WoongjinAppSearchPage(BasePage):
     SEARCH_PAGE_TITLE =(AppiumBy.XPATH, "//android.widget.TextView[@text='급상승 검색어']")
     BACK_BUTTON = (AppiumBy.XPATH, "//android.widget.Button[@text='뒤로가기']")
     SEARCH_RESULT_ITEMS = (AppiumBy.XPATH, "//android.widget.TextView[@resource-id='product_name']")
+
+    # 검색 결과는 네트워크 응답 후 그려지므로 안정화 간격을 길게
+    ABSENCE_SETTLE = 1.0
+    ABSENCE_TIMEOUT = 5.0
+
     def search_page_is_visible(self) -> bool:
         """검색 페이지에 진입 했는지 확인"""
         return self.is_element_visible(self.SEARCH_PAGE_TITLE)
@@ -30,7 +35,7 @@ class WoongjinAppSearchPage(BasePage):
 
     def submit_search(self):
         """검색어 제출"""
-        self.driver.press_keycode(66)  # Android의 Enter 키 코드
+        self.press_keycode(66)  # Android의 Enter 키 코드
 
     def get_search_results(self) -> List[str]:
         """검색 결과 가져오기"""
@@ -52,6 +57,10 @@ class WoongjinAppSearchPage(BasePage):
         return filtered_results
     
     
+    def has_no_results(self) -> bool:
+        """검색 결과가 없는지 확인 (화면 안정화 후 즉시 판정)"""
+        return self.is_absent(self.SEARCH_RESULT_ITEMS)
+
     def is_result_present(self, keyword: str) -> bool:
         """특정 키워드가 검색 결과에 존재하는지 확인"""
         results = self.get_search_results()
@@ -0,0 +1,127 @@
+"""
+디바이스 풀 테스트 (실제 디바이스/Appium 서버 없이 가짜 디바이스 + 가짜 /status 서버 사용)
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import allure
+import pytest
+from utils import device_pool
+from utils.device_pool import DevicePool, load_device_pool, worker_index
+from utils.exceptions import DeviceUnavailableError
+
+
+class _FakeAppiumHandler(BaseHTTPRequestHandler):
+    """GET /status 만 응답하는 가짜 Appium 서버"""
+
+    def do_GET(self):
+        body = json.dumps({"value": {"ready": self.path == "/status"}}).encode("utf-8")
+        self.send_response(200 if self.path == "/status" else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_appium_url():
+    server = HTTPServer(("127.0.0.1", 0), _FakeAppiumHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_devices(fake_appium_url):
+    return [
+        {"udid": "emulator-5554", "appium_url": fake_appium_url},
+        {"udid": "emulator-5556", "appium_url": fake_appium_url},
+    ]
+
+
+@allure.feature("디바이스 풀")
+@allure.story("워커별 디바이스/포트 할당")
+def test_workers_get_distinct_devices_and_ports(fake_devices, tmp_path):
+    """워커마다 다른 디바이스와 겹치지 않는 포트 할당"""
+    pool_gw0 = DevicePool(fake_devices, lock_dir=str(tmp_path))
+    pool_gw1 = DevicePool(fake_devices, lock_dir=str(tmp_path))
+
+    with allure.step("워커 2개가 각각 디바이스 할당"):
+        lease_gw0 = pool_gw0.acquire(worker_id="gw0", timeout=0)
+        lease_gw1 = pool_gw1.acquire(worker_id="gw1", timeout=0)
+
+    with allure.step("디바이스/포트 중복 없음 확인"):
+        assert {lease_gw0.udid, lease_gw1.udid} == {"emulator-5554", "emulator-5556"}
+        assert lease_gw0.system_port != lease_gw1.system_port
+        assert lease_gw0.mjpeg_server_port != lease_gw1.mjpeg_server_port
+
+        caps = lease_gw1.capabilities({"platformName": "Android", "deviceName": "R3CX70ALSLB"})
+        assert caps["udid"] == lease_gw1.udid
+        assert caps["deviceName"] == lease_gw1.udid
+        assert caps["systemPort"] == lease_gw1.system_port
+
+    with allure.step("빈 디바이스가 없으면 에러"):
+        with pytest.raises(DeviceUnavailableError):
+            DevicePool(fake_devices, lock_dir=str(tmp_path)).acquire(worker_id="gw2", timeout=0)
+
+    with allure.step("반환한 디바이스는 다시 할당 가능"):
+        pool_gw0.release(lease_gw0)
+        lease_gw2 = DevicePool(fake_devices, lock_dir=str(tmp_path)).acquire(worker_id="gw2", timeout=0)
+        assert lease_gw2.udid == lease_gw0.udid
+
+
+@allure.feature("디바이스 풀")
+@allure.story("비정상 종료 워커의 디바이스 회수")
+def test_device_of_crashed_worker_is_reclaimed(fake_devices, tmp_path):
+    """잠금을 잡은 채 종료된 프로세스의 디바이스는 다른 워커가 회수"""
+    devices = fake_devices[:1]
+
+    with allure.step("다른 프로세스가 디바이스를 잡은 채 비정상 종료"):
+        script = (
+            "import sys, os; sys.path.insert(0, sys.argv[1]);"
+            "from utils.device_pool import DevicePool;"
+            "pool = DevicePool([{'udid': 'emulator-5554'}], lock_dir=sys.argv[2], check_server=False);"
+            "pool.acquire(worker_id='gw0', timeout=0); os._exit(1)"
+        )
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(device_pool.__file__)))
+        subprocess.run([sys.executable, "-c", script, src_dir, str(tmp_path)], check=False)
+        assert (tmp_path / "emulator-5554.lock").exists()
+
+    with allure.step("다른 워커가 디바이스 회수"):
+        lease = DevicePool(devices, lock_dir=str(tmp_path)).acquire(worker_id="gw1", timeout=0)
+        assert lease.udid == "emulator-5554"
+
+
+@allure.feature("디바이스 풀")
+@allure.story("Appium 서버 확인")
+def test_device_without_appium_server_is_skipped(fake_devices, tmp_path):
+    """Appium 서버가 응답하지 않는 디바이스는 건너뜀"""
+    devices = [{"udid": "emulator-5560", "appium_url": "http://127.0.0.1:9"}] + fake_devices[:1]
+
+    lease = DevicePool(devices, lock_dir=str(tmp_path)).acquire(worker_id="gw0", timeout=0)
+    assert lease.udid == "emulator-5554"
+    assert not (tmp_path / "emulator-5560.lock").exists()
+
+    with pytest.raises(DeviceUnavailableError):
+        DevicePool(devices[:1], lock_dir=str(tmp_path)).acquire(worker_id="gw0", timeout=5)
+
+
+@allure.feature("디바이스 풀")
+@allure.story("풀 설정 읽기")
+def test_load_device_pool_sources(tmp_path):
+    """풀 설정: 파일 → 환경 변수 순"""
+    pool_file = tmp_path / "devices.json"
+    pool_file.write_text(json.dumps(["emulator-5554", {"udid": "emulator-5556"}]), encoding="utf-8")
+
+    assert [d["udid"] for d in load_device_pool(str(pool_file), "")] == ["emulator-5554", "emulator-5556"]
+    assert [d["udid"] for d in load_device_pool(str(tmp_path / "missing.json"), "a, b")] == ["a", "b"]
+    assert worker_index("gw3") == 3
+    assert worker_index("master") == 0
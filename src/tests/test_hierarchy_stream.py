@@ -0,0 +1,69 @@
+"""
+대용량 덤프 스트리밍 추출 테스트 (디바이스 없이 window_dump.xml 사용)
+iterparse 결과가 전체 트리(UiTree) 기준 결과와 같은지 확인
+"""
+import gzip
+import os
+import shutil
+import allure
+import pytest
+from utils.gnb_page_source_helper import find_gnb_container
+from utils.hierarchy_stream import IMAGE_TARGET, find_gnb_subtree, iter_subtrees, scan_dumps
+from utils.ui_hierarchy import IMAGE_VIEW_CLASS
+from utils.ui_tree import UiTree
+
+WINDOW_DUMP = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "window_dump.xml")
+
+
+@pytest.fixture(scope="module")
+def dump_tree():
+    if not os.path.exists(WINDOW_DUMP):
+        pytest.skip("window_dump.xml 없음")
+    return UiTree.from_file(WINDOW_DUMP)
+
+
+@allure.feature("덤프 스트리밍 분석")
+@allure.story("GNB 서브트리")
+def test_find_gnb_subtree_matches_tree(dump_tree):
+    """스트리밍으로 찾은 GNB 컨테이너 = 전체 트리에서 GNB_SELECTORS 로 찾은 컨테이너"""
+    match = find_gnb_subtree(WINDOW_DUMP)
+    expected = find_gnb_container(dump_tree)
+
+    assert match is not None and expected is not None
+    assert match.order == expected.order
+    assert match.element.get('resource-id') == expected.resource_id
+    # 떼어낸 서브트리에도 하위 노드가 그대로 남아 있음
+    assert sum(1 for _ in match.element.iter()) == 1 + sum(1 for _ in expected.iter_descendants())
+
+
+@allure.feature("덤프 스트리밍 분석")
+@allure.story("ImageView 추출")
+def test_image_subtrees_match_tree(dump_tree, tmp_path):
+    """ImageView 추출 수/순서가 UiTree 와 같음 (gzip 덤프 포함)"""
+    expected = [node.order for node in dump_tree.by_class(IMAGE_VIEW_CLASS)]
+    assert expected
+
+    compressed = tmp_path / "window_dump.xml.gz"
+    with open(WINDOW_DUMP, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
+    for path in (WINDOW_DUMP, str(compressed)):
+        assert [match.order for match in iter_subtrees(path, (IMAGE_TARGET,))] == expected
+
+
+@allure.feature("덤프 스트리밍 분석")
+@allure.story("깨진 덤프")
+def test_scan_dumps_skips_truncated_dump(dump_tree, tmp_path):
+    """잘린 덤프는 errors 에 기록하고 다음 덤프 계속 분석"""
+    truncated = tmp_path / "truncated.xml"
+    with open(WINDOW_DUMP, encoding='utf-8') as f:
+        truncated.write_text(f.read()[:2000], encoding='utf-8')
+
+    errors = []
+    matches = list(scan_dumps([str(truncated), WINDOW_DUMP], (IMAGE_TARGET,), errors))
+
+    assert [path for path, _ in errors] == [str(truncated)]
+    assert {match.path for match in matches} <= {str(truncated), WINDOW_DUMP}
+    complete = [match for match in matches if match.path == WINDOW_DUMP]
+    assert len(complete) == len(dump_tree.by_class(IMAGE_VIEW_CLASS))
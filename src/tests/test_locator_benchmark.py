@@ -0,0 +1,52 @@
+"""
+로케이터 조회 마이크로 벤치마크
+서버 측(UiAutomator2) 조회 vs 로컬 로케이터 엔진 조회 비교
+측정값은 리포트/로그에만 남김 (벽시계 시간이라 합격 기준으로 쓰지 않음)
+BENCHMARK=1 또는 -m slow 로 실행할 때만 동작
+"""
+import re
+import pytest
+import allure
+from config.app_config import AppConfig
+from pages.woongjin_app_home_page import WoongjinAppHomePage
+from utils.locator_engine import benchmark_locators
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.fixture
+def benchmark_enabled(request):
+    """기본 실행에서는 건너뜀 (디바이스 필요 + 측정값이 환경에 따라 흔들림)"""
+    markexpr = request.config.getoption("markexpr") or ""
+    if not (AppConfig.BENCHMARK or re.search(r"(?<!not )\bslow\b", markexpr)):
+        pytest.skip("벤치마크는 BENCHMARK=1 또는 -m slow 로 실행")
+
+
+@pytest.mark.slow
+@allure.feature("성능")
+@allure.story("로케이터 조회 벤치마크")
+def test_locator_engine_benchmark(benchmark_enabled, home_page):
+    """홈 화면 로케이터 조회 시간 비교"""
+    locators = [
+        WoongjinAppHomePage.HOME_LOGO,
+        WoongjinAppHomePage.SEARCH_BUTTON,
+        WoongjinAppHomePage.CATEGORY_TAB,
+        WoongjinAppHomePage.SEARCH_TAB,
+        WoongjinAppHomePage.LIKE_TAB,
+        WoongjinAppHomePage.HOME_TAB,
+        WoongjinAppHomePage.MY_PAGE_TAB,
+    ]
+
+    with allure.step("홈 화면 확인"):
+        assert home_page.home_page_is_visible(), "홈 화면이 로드되지 않음"
+
+    with allure.step(f"로케이터 {len(locators)}개 조회 시간 측정"):
+        result = benchmark_locators(home_page.driver, locators, rounds=3)
+        summary = (
+            f"서버 조회: {result['server'] * 1000:.1f}ms\n"
+            f"로컬 엔진: {result['local'] * 1000:.1f}ms\n"
+            f"속도 향상: {result['speedup']:.1f}배"
+        )
+        allure.attach(summary, name="로케이터 벤치마크", attachment_type=allure.attachment_type.TEXT)
+        logger.info("⏱️ 로케이터 벤치마크: " + summary.replace("\n", ", "))
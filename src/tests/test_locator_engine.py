@@ -0,0 +1,115 @@
+"""
+로컬 로케이터 엔진 정확도 테스트 (디바이스 없이 window_dump.xml 사용)
+resolve_locator 결과를 lxml XPath(서버 XPath 와 같은 XPath 1.0) 결과와 비교
+"""
+import os
+import xml.etree.ElementTree as ET
+import allure
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from pages.base_page import BasePage
+from pages.woongjin_app_category_page import WoongjinAppCategoryPage
+from pages.woongjin_app_home_page import WoongjinAppHomePage
+from pages.woongjin_app_like_page import WoongjinAppLikePage
+from pages.woongjin_app_login_page import WoongjinAppLoginPage
+from pages.woongjin_app_my_tab import WoongjinAppMyTabPage
+from pages.woongjin_app_search_page import WoongjinAppSearchPage
+from utils.locator_engine import UnsupportedXPathError, compile_xpath, resolve_locator
+from utils.ui_tree import UiTree
+
+etree = pytest.importorskip("lxml.etree")
+
+WINDOW_DUMP = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "window_dump.xml")
+
+PAGE_CLASSES = [
+    BasePage,
+    WoongjinAppHomePage,
+    WoongjinAppCategoryPage,
+    WoongjinAppLikePage,
+    WoongjinAppLoginPage,
+    WoongjinAppMyTabPage,
+    WoongjinAppSearchPage,
+]
+
+
+def _appium_source(path: str) -> str:
+    """uiautomator 덤프(<node class=...>)를 UiAutomator2 page_source 형식(태그 = class)으로 변환"""
+    root = ET.parse(path).getroot()
+    for element in root.iter():
+        if element.get('class'):
+            element.tag = element.get('class')
+    return ET.tostring(root, encoding='unicode')
+
+
+def _page_xpaths():
+    """페이지 객체에 정의된 XPath 로케이터 (클래스 속성 + DYNAMIC_REGIONS 등 목록 속성)"""
+    xpaths = set()
+    for page in PAGE_CLASSES:
+        for value in vars(page).values():
+            candidates = value if isinstance(value, list) else [value]
+            for candidate in candidates:
+                if isinstance(candidate, tuple) and len(candidate) == 2 and candidate[0] == AppiumBy.XPATH:
+                    xpaths.add(candidate[1])
+    return sorted(xpaths)
+
+
+def _dump_xpaths(tree: UiTree):
+    """덤프 내용으로 만든 XPath (실제로 매칭되는 식 - 인덱스/위치/함수 경로 모두 확인)"""
+    xpaths = ["//*", "/hierarchy/*", "//*[@content-desc and @content-desc!='']", "//*[@text!='']"]
+    for node in tree.nodes[1:]:
+        if node.resource_id:
+            short_id = node.resource_id.split(":id/")[-1]
+            xpaths.append(f"//{node.cls}[@resource-id='{node.resource_id}']")
+            xpaths.append(f"//*[contains(@resource-id, '{short_id}')]")
+            xpaths.append(f"//*[@resource-id='{node.resource_id}']//*")
+        if node.text:
+            xpaths.append(f"//*[@text='{node.text}' or @content-desc='{node.text}']")
+        if node.content_desc:
+            xpaths.append(f"//{node.cls}[starts-with(@content-desc, '{node.content_desc[:2]}')]")
+        xpaths.append(f"//{node.cls}[2]")
+        xpaths.append(f"//{node.cls}[not(@clickable='true')]")
+    return sorted(set(xpaths))
+
+
+@pytest.fixture(scope="module")
+def dump_source():
+    if not os.path.exists(WINDOW_DUMP):
+        pytest.skip("window_dump.xml 없음")
+    return _appium_source(WINDOW_DUMP)
+
+
+@allure.feature("로케이터 엔진")
+@allure.story("서버 XPath 와 결과 일치")
+def test_resolve_locator_matches_xpath(dump_source):
+    """페이지 객체 로케이터 + 덤프 기반 로케이터의 로컬 결과가 lxml 결과와 같은지 확인"""
+    tree = UiTree.from_source(dump_source)
+    document = etree.fromstring(dump_source.encode('utf-8'))
+    # lxml 요소 → 문서 순서 (UiTree 노드 순서와 동일)
+    order = {element: index for index, element in enumerate(document.iter())}
+
+    xpaths = _page_xpaths() + _dump_xpaths(tree)
+    mismatches = []
+    with allure.step(f"XPath {len(xpaths)}개 비교"):
+        for xpath in xpaths:
+            local = resolve_locator(tree, (AppiumBy.XPATH, xpath))
+            if local is None:
+                continue  # 로컬 미지원 → 서버 조회 (비교 대상 아님)
+            expected = [order[element] for element in document.xpath(xpath)]
+            if [node.order for node in local] != expected:
+                mismatches.append(xpath)
+
+    assert not mismatches, f"로컬 결과가 다른 XPath: {mismatches}"
+
+
+@allure.feature("로케이터 엔진")
+@allure.story("서버와 의미가 다른 식 거부")
+def test_text_function_is_rejected(dump_source):
+    """text() 는 서버에서 항상 빈 값이므로 로컬 해석하지 않고 서버로 위임"""
+    tree = UiTree.from_source(dump_source)
+    xpath = "//*[text()='1월 29일 목요일']"
+
+    with pytest.raises(UnsupportedXPathError):
+        compile_xpath(xpath)
+    assert resolve_locator(tree, (AppiumBy.XPATH, xpath)) is None
+    assert etree.fromstring(dump_source.encode('utf-8')).xpath(xpath) == []
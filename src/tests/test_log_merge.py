@@ -0,0 +1,68 @@
+"""
+워커별 로그 병합 테스트 (디바이스 없이 임시 로그 파일 사용)
+"""
+import gzip
+import io
+import allure
+from utils.log_merge import find_logs, log_segments, merge_logs, write_merged
+
+GW0_LOG = "test_20260101_090000_gw0_111.log"
+GW1_LOG = "test_20260101_090000_gw1_222.log"
+
+
+def _record(timestamp: str, message: str) -> str:
+    return f"2026-01-01 {timestamp} | INFO     | {message}\n"
+
+
+def _write_worker_logs(directory):
+    """gw0: 회전본(.1.gz) + 현재 파일, gw1: 현재 파일만"""
+    gw0 = directory / GW0_LOG
+    with gzip.open(f"{gw0}.1.gz", 'wt', encoding='utf-8') as f:
+        f.write(_record("09:00:01,000", "gw0 회전본 1"))
+        f.write(_record("09:00:03,000", "gw0 회전본 2"))
+    gw0.write_text(
+        _record("09:00:05,000", "gw0 현재 1")
+        + "Traceback (most recent call last):\n"
+        + "AssertionError: 홈 페이지가 보이지 않음\n"
+        + _record("09:00:07,000", "gw0 현재 2"),
+        encoding='utf-8'
+    )
+    (directory / GW1_LOG).write_text(
+        _record("09:00:02,000", "gw1 1")
+        + _record("09:00:05,000", "gw1 2")
+        + _record("09:00:06,000", "gw1 3"),
+        encoding='utf-8'
+    )
+    return [str(gw0), str(directory / GW1_LOG)]
+
+
+@allure.feature("로그 병합")
+@allure.story("회전본 포함 시각 순 병합")
+def test_merge_logs_orders_rotated_and_live_segments(tmp_path):
+    """회전본(.1.gz) → 현재 파일 순으로 읽고 워커 간에는 시각 순으로 병합"""
+    paths = _write_worker_logs(tmp_path)
+
+    assert log_segments(paths[0]) == [f"{paths[0]}.1.gz", paths[0]]
+
+    records = list(merge_logs(paths))
+    messages = [text.splitlines()[0].rsplit("| ", 1)[1] for _, _, text in records]
+    assert messages == [
+        "gw0 회전본 1", "gw1 1", "gw0 회전본 2", "gw0 현재 1", "gw1 2", "gw1 3", "gw0 현재 2",
+    ]
+    assert [label for _, label, _ in records[:2]] == ["gw0:111", "gw1:222"]
+    # 같은 시각이면 paths 순서, 시각 없는 줄(traceback)은 이전 레코드에 포함
+    assert records[3][2].endswith("AssertionError: 홈 페이지가 보이지 않음\n")
+
+
+@allure.feature("로그 병합")
+@allure.story("회전본만 남은 로그")
+def test_find_logs_includes_rotated_only_logs(tmp_path):
+    """현재 파일 없이 회전본만 남은 워커 로그도 병합 대상"""
+    paths = _write_worker_logs(tmp_path)
+    (tmp_path / GW1_LOG).rename(tmp_path / f"{GW1_LOG}.1")
+
+    assert find_logs(str(tmp_path)) == sorted(paths)
+
+    output = io.StringIO()
+    assert write_merged(find_logs(str(tmp_path)), output) == 7
+    assert output.getvalue().startswith("[gw0:111] 2026-01-01 09:00:01,000")
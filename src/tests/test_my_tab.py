@@ -18,25 +18,17 @@ def test_my_tab_requires_login(home_page, login_page):
 
     with allure.step("로그인 페이지 노출 확인"):
         assert login_page.is_login_page_visible(), "로그인 페이지가 보이지 않음"
-        login_page.take_screenshot("my_tab_login_required")
+        login_page.take_screenshot("my_tab_login_required", baseline=True)
 
 
 @allure.feature("마이탭")
 @allure.story("마이탭 페이지 진입 (로그인)")
-def test_my_tab_after_login(home_page, login_page, my_tab_page, test_user_credentials):
-    """로그인 후 마이탭 페이지 진입 테스트"""
+def test_my_tab_after_login(logged_in, my_tab_page):
+    """로그인 후 마이탭 페이지 진입 테스트 (로그인 상태 재사용)"""
 
-    user_id = test_user_credentials["user_id"]
-    password = test_user_credentials["password"]
-
-    with allure.step("마이탭 클릭 → 로그인 페이지"):
-        home_page.click_my_page_tab()
-        assert login_page.is_login_page_visible(), "로그인 페이지가 보이지 않음"
-
-    with allure.step("이메일 로그인 수행"):
-        login_page.click_email_login()
-        login_page.email_login(user_id, password)
+    with allure.step("마이탭 클릭"):
+        logged_in.click_my_page_tab()
 
     with allure.step("마이탭 페이지 확인"):
         assert my_tab_page.is_my_tab_page_visible(), "마이탭 페이지가 보이지 않음"
-        my_tab_page.take_screenshot("my_tab_page_logged_in")
+        my_tab_page.take_screenshot("my_tab_page_logged_in", baseline=True)
@@ -11,12 +11,12 @@ def test_gnb_full_navigation(home_page, category_page, search_page):
 
     with allure.step("1. 홈 페이지 확인"):
         assert home_page.home_page_is_visible(), "홈 페이지가 보이지 않음"
-        home_page.take_screenshot("nav_01_home")
+        home_page.take_screenshot("nav_01_home", baseline=True)
 
     with allure.step("2. 카테고리 탭 이동"):
         home_page.click_category_tab()
         assert category_page.is_category_page_visible(), "카테고리 페이지가 보이지 않음"
-        category_page.take_screenshot("nav_02_category")
+        category_page.take_screenshot("nav_02_category", baseline=True)
 
     with allure.step("3. 검색 탭 이동"):
         home_page.click_search_tab()
@@ -26,7 +26,7 @@ def test_gnb_full_navigation(home_page, category_page, search_page):
     with allure.step("4. 홈 탭 복귀"):
         home_page.click_home_tab()
         assert home_page.home_page_is_visible(), "홈 페이지로 복귀하지 않음"
-        home_page.take_screenshot("nav_04_home_return")
+        home_page.take_screenshot("nav_04_home_return", baseline=True)
 
 
 @allure.feature("네비게이션")
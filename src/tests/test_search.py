@@ -27,6 +27,5 @@ def test_search_no_results(navigate_to_search_tab):
         search_page.submit_search()
 
     with allure.step("검색 결과 없음 확인"):
-        results = search_page.get_search_results()
-        assert len(results) == 0, "❌ 예상과 달리 검색 결과가 존재함"
+        assert search_page.has_no_results(), "❌ 예상과 달리 검색 결과가 존재함"
         search_page.take_screenshot("woongjin_search_no_results.png")
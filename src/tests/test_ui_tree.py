@@ -0,0 +1,66 @@
+"""
+UiTree 인덱스 조회 테스트 (디바이스 없이 window_dump.xml / 직접 만든 page_source 사용)
+"""
+import gzip
+import os
+import shutil
+import allure
+import pytest
+from utils.ui_tree import UiTree
+
+WINDOW_DUMP = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "window_dump.xml")
+
+PAGE_SOURCE = (
+    '<hierarchy rotation="0">'
+    '<android.widget.FrameLayout resource-id="com.wjthinkbig.woongjinbooks:id/ll_gnb" bounds="[0,2900][1440,3120]">'
+    '<android.widget.TextView resource-id="com.wjthinkbig.woongjinbooks:id/tv_title" text="홈" bounds="[0,2900][288,3120]"/>'
+    '</android.widget.FrameLayout>'
+    '<android.widget.TextView resource-id="com.android.systemui:id/tv_title" text="시계" bounds="[0,0][200,80]"/>'
+    '<android.view.View resource-id="tv_title" bounds="[0,80][200,160]"/>'
+    '</hierarchy>'
+)
+
+
+@pytest.fixture(scope="module")
+def dump_tree():
+    if not os.path.exists(WINDOW_DUMP):
+        pytest.skip("window_dump.xml 없음")
+    return UiTree.from_file(WINDOW_DUMP)
+
+
+@allure.feature("UI 계층 트리")
+@allure.story("짧은 resource-id 조회")
+def test_by_resource_id_short_id(dump_tree):
+    """패키지 접두어 없는 ID 는 UiAutomator2 By.ID 처럼 '<package>:id/<값>' 과 매칭"""
+    full = dump_tree.by_resource_id("com.samsung.android.app.aodservice:id/common_date")
+    short = dump_tree.by_resource_id("common_date")
+
+    assert len(full) == 1 and full[0].text == "1월 29일 목요일"
+    assert short == full
+    assert dump_tree.by_resource_id("aodservice:id/common_date") == []
+
+
+@allure.feature("UI 계층 트리")
+@allure.story("짧은 resource-id 조회")
+def test_by_resource_id_short_id_across_packages():
+    """짧은 ID 는 모든 패키지 + 접두어 없는 ID 를 포함, 전체 ID 는 해당 패키지만"""
+    tree = UiTree.from_source(PAGE_SOURCE)
+
+    assert sorted(node.order for node in tree.by_resource_id("tv_title")) == [2, 3, 4]
+    assert [node.text for node in tree.by_resource_id("com.wjthinkbig.woongjinbooks:id/tv_title")] == ["홈"]
+    assert [node.order for node in tree.lookup('resource-id', "tv_title")] == [4]  # 정확히 일치만
+    assert [node.order for node in tree.with_attribute('resource-id')] == [1, 2, 3, 4]
+
+
+@allure.feature("UI 계층 트리")
+@allure.story("저장된 덤프 로드")
+def test_from_file_gzip_matches_plain(dump_tree, tmp_path):
+    """gzip 압축 덤프도 같은 트리로 로드"""
+    compressed = tmp_path / "window_dump.xml.gz"
+    with open(WINDOW_DUMP, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
+    tree = UiTree.load(str(compressed))
+    assert len(tree) == len(dump_tree)
+    assert [node.resource_id for node in tree.nodes] == [node.resource_id for node in dump_tree.nodes]
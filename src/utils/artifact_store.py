@@ -0,0 +1,245 @@
+"""
+내용 주소 기반(content-addressed) 스크린샷 저장소
+실무용: 같은 이미지는 한 번만 저장하고, 이름 붙은 스크린샷은 인덱스로 참조
+
+구조:
+    {SCREENSHOT_DIR}/objects/ab/ab12....png   실제 이미지 (해시별 1개)
+    {SCREENSHOT_DIR}/index.jsonl              이름 → 해시 참조 (append-only, 로드 시 주기적으로 압축)
+
+Usage:
+    store = get_artifact_store()
+    path = store.put("home_page_loaded", png_bytes)
+    store.resolve("home_page_loaded")  # → 실제 이미지 경로
+"""
+from typing import Dict, Optional
+import hashlib
+import io
+import json
+import os
+import threading
+from datetime import datetime
+from config.app_config import AppConfig
+from utils.logger import get_logger
+from utils.screenshot_writer import ScreenshotWriter, image_extension, write_image
+
+logger = get_logger(__name__)
+
+# 인덱스 줄 수가 이 값 이상이고 유효 항목의 2배를 넘으면 로드 시 압축
+INDEX_COMPACT_MIN_LINES = 1000
+
+
+def content_hash(data: bytes) -> str:
+    """빠른 내용 해시 (blake2b 128bit)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def perceptual_hash(png: bytes) -> int:
+    """
+    지각 해시 (dHash 64bit)
+    픽셀 값이 조금 달라도 (인코딩 차이, 깜빡이는 커서 등) 같은 화면이면 같은/가까운 값
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        small = image.convert("L").resize((9, 8), Image.BILINEAR)
+        pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+class ArtifactStore:
+    """해시 기반 스크린샷 저장소 (스레드 안전)"""
+
+    def __init__(self, root: str = AppConfig.SCREENSHOT_DIR,
+                 perceptual: bool = AppConfig.SCREENSHOT_PHASH,
+                 phash_distance: int = AppConfig.SCREENSHOT_PHASH_DISTANCE) -> None:
+        self.root: str = root
+        self.objects_dir: str = os.path.join(root, "objects")
+        self.index_path: str = os.path.join(root, "index.jsonl")
+        self.perceptual: bool = perceptual
+        self.phash_distance: int = phash_distance
+        self._lock = threading.Lock()
+        self._names: Dict[str, str] = {}      # 이름 → 해시
+        self._objects: Dict[str, str] = {}    # 해시 → 이미지 경로
+        self._aliases: Dict[str, str] = {}    # 해시 → 지각적으로 같은 기존 해시
+        self._phashes: Dict[int, str] = {}    # 지각 해시 → 해시
+        self.stored: int = 0
+        self.deduplicated: int = 0
+        self.bytes_saved: int = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """기존 인덱스 로드 (이전 실행에서 저장한 이미지도 중복 제거 대상)"""
+        if not os.path.exists(self.index_path):
+            return
+        loaded_size = os.path.getsize(self.index_path)
+        latest: Dict[str, Dict] = {}    # 이름 → 마지막 기록
+        aliases: Dict[str, Dict] = {}   # 별칭 해시 → 기록
+        lines = 0
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if 'alias' in record:
+                    self._aliases[record['alias']] = record['hash']
+                    aliases[record['alias']] = record
+                    continue
+                self._names[record['name']] = record['hash']
+                latest[record['name']] = record
+                if os.path.exists(record['path']):
+                    self._objects[record['hash']] = record['path']
+                if record.get('phash') is not None:
+                    self._phashes[record['phash']] = record['hash']
+        if lines >= INDEX_COMPACT_MIN_LINES and lines > 2 * (len(latest) + len(aliases)):
+            self._compact_index(latest, aliases, loaded_size)
+
+    def _compact_index(self, latest: Dict[str, Dict], aliases: Dict[str, Dict], loaded_size: int) -> None:
+        """
+        이름별 마지막 기록 + 유효한 별칭만 남기고 인덱스 재작성 (이미지가 지워진 기록은 제거)
+        읽은 뒤 다른 워커가 기록을 추가했으면 (파일 크기 변경) 압축하지 않음 - 다음 실행에서 재시도
+        """
+        records = [record for record in aliases.values() if record['hash'] in self._objects]
+        records += [record for record in latest.values() if record['hash'] in self._objects]
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode('utf-8')
+        tmp_path = f"{self.index_path}.{os.getpid()}.compact"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            if os.path.getsize(self.index_path) != loaded_size:
+                os.remove(tmp_path)
+                return
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"스크린샷 인덱스 압축 실패 (무시): {e}")
+            return
+        logger.info(f"🗃️ 스크린샷 인덱스 압축: {loaded_size / 1024:.0f}KB → {len(data) / 1024:.0f}KB ({len(records)}개 기록)")
+
+    def _append_index(self, record: Dict) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        # 한 줄 append는 워커 프로세스 간에도 섞이지 않음
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def object_path(self, digest: str) -> str:
+        """해시별 이미지 경로"""
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.{image_extension()}")
+
+    def _canonical(self, digest: str) -> str:
+        return self._aliases.get(digest, digest)
+
+    def put(self, name: str, png: bytes, writer: Optional[ScreenshotWriter] = None) -> str:
+        """
+        스크린샷 저장 (같은 내용이면 기존 이미지 참조만 추가)
+
+        지각 해시 사용 시 (SCREENSHOT_PHASH) 반환 경로를 정하기 위해 해시 계산은 호출 스레드에서 수행
+
+        Args:
+            name: 스크린샷 이름
+            png: PNG bytes
+            writer: 지정 시 파일 저장을 백그라운드에서 처리
+
+        Returns:
+            이미지 경로 (중복이면 기존 이미지 경로)
+        """
+        digest = content_hash(png)
+        with self._lock:
+            known = self._canonical(digest) in self._objects
+        phash = perceptual_hash(png) if self.perceptual and not known else None
+
+        aliased = False
+        with self._lock:
+            canonical = self._canonical(digest)
+            if canonical not in self._objects and phash is not None:
+                similar = self._find_similar(phash)
+                if similar is not None and similar != digest and similar in self._objects:
+                    # 지각적으로 같은 기존 이미지를 참조 (새 이미지는 저장하지 않음)
+                    self._aliases[digest] = similar
+                    canonical = similar
+                    aliased = True
+                else:
+                    self._phashes[phash] = digest
+            self._names[name] = canonical
+            duplicate = canonical in self._objects
+            if duplicate:
+                self.deduplicated += 1
+                self.bytes_saved += len(png)
+                path = self._objects[canonical]
+            else:
+                path = self.object_path(digest)
+                self._objects[digest] = path
+
+        if aliased:
+            self._append_index({'alias': digest, 'hash': canonical})
+        if duplicate:
+            logger.debug(f"중복 스크린샷 참조: {name} → {path}")
+            self._append_index(self._record(name, canonical, path))
+            return path
+
+        if writer is not None:
+            writer.submit_task(self._store_object, name, digest, png, path, phash)
+        else:
+            self._store_object(name, digest, png, path, phash)
+        return path
+
+    def _store_object(self, name: str, digest: str, png: bytes, path: str, phash: Optional[int] = None) -> None:
+        """새 이미지 저장"""
+        write_image(png, path)
+        with self._lock:
+            self.stored += 1
+        self._append_index(self._record(name, digest, path, phash))
+
+    def _find_similar(self, phash: int) -> Optional[str]:
+        if phash in self._phashes:
+            return self._phashes[phash]
+        for known, digest in self._phashes.items():
+            if bin(known ^ phash).count("1") <= self.phash_distance:
+                return digest
+        return None
+
+    @staticmethod
+    def _record(name: str, digest: str, path: str, phash: Optional[int] = None) -> Dict:
+        return {
+            'name': name,
+            'hash': digest,
+            'path': path,
+            'phash': phash,
+            'created': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def resolve(self, name_or_path: str) -> Optional[str]:
+        """이름(또는 put()이 반환한 경로)으로 실제 이미지 경로 조회"""
+        with self._lock:
+            digest = self._names.get(name_or_path)
+            if digest is None:
+                digest = os.path.splitext(os.path.basename(name_or_path))[0]
+            return self._objects.get(self._canonical(digest))
+
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """세션 공용 스크린샷 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore()
+        return _store
+
+
+def log_artifact_store_summary() -> None:
+    """세션 종료 시 중복 제거 효과 기록"""
+    if _store is None:
+        return
+    logger.info(
+        f"🗃️ 스크린샷 저장소: 저장 {_store.stored}개, 중복 참조 {_store.deduplicated}개 "
+        f"(절약 {_store.bytes_saved / 1024 / 1024:.1f}MB)"
+    )
+
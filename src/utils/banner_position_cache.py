@@ -0,0 +1,162 @@
+"""
+위치 기반 배너 닫기 좌표 캐시
+실무용: 배너가 실제로 사라진 좌표를 디바이스/해상도/앱 버전별로 기록
+       → 다음 세션부터 화면 크기 조회 없이 학습된 좌표를 먼저 탭 (후보 좌표 순회 X)
+       학습된 좌표로 닫히지 않으면 (배너 개편, 앱 업데이트) 항목 삭제 후 다시 학습
+       앱 버전: APP_VERSION 환경변수 → 디바이스 dumpsys versionName (드라이버당 1회) → "unknown"
+
+파일 형식 (AppConfig.BANNER_POSITION_CACHE):
+    {
+      "{udid}|{deviceScreenSize}|{앱 버전}": {
+        "window": [1080, 2220], "position": [955, 688], "hits": 12, "updated": 1700000000.0
+      }
+    }
+"""
+from typing import Any, Dict, Optional, Tuple
+import json
+import re
+import threading
+import time
+import weakref
+from selenium.common.exceptions import WebDriverException
+from appium.webdriver.webdriver import WebDriver
+from config.app_config import AppConfig
+from utils.logger import get_logger
+from utils.screenshot_writer import write_file
+
+logger = get_logger(__name__)
+
+VERSION_NAME_PATTERN = re.compile(r"versionName=(\S+)")
+
+# 드라이버별 설치된 앱 버전 (세션 중 바뀌지 않음 - 조회 실패도 "unknown" 으로 기록해 재시도하지 않음)
+_app_versions: "weakref.WeakKeyDictionary[WebDriver, str]" = weakref.WeakKeyDictionary()
+
+
+def app_version(driver: WebDriver) -> str:
+    """
+    설치된 앱 버전 (APP_VERSION 우선, 없으면 디바이스에서 드라이버당 1회 조회)
+
+    mobile: shell 은 Appium 서버가 --allow-insecure adb_shell 로 실행된 경우에만 동작
+    → 조회 실패 시 "unknown" (버전 구분 없이 디바이스/해상도별 학습)
+    """
+    if AppConfig.APP_VERSION:
+        return AppConfig.APP_VERSION
+    version = _app_versions.get(driver)
+    if version is None:
+        version = "unknown"
+        package = (driver.capabilities or {}).get('appPackage') or AppConfig.WOONGJIN_APP['appPackage']
+        try:
+            output = driver.execute_script("mobile: shell", {"command": "dumpsys", "args": ["package", package]})
+            match = VERSION_NAME_PATTERN.search(output or "")
+            if match:
+                version = match.group(1)
+        except WebDriverException as e:
+            logger.debug(f"앱 버전 조회 실패 (unknown 사용): {e}")
+        _app_versions[driver] = version
+    return version
+
+
+class BannerPositionCache:
+    """
+    디바이스별 배너 닫기 좌표 (JSON 파일, 워커 간 공유)
+
+    Usage:
+        cache = get_banner_position_cache()
+        key = cache.device_key(driver)
+        entry = cache.get(key)            # {'window': [w, h], 'position': [x, y], ...}
+        cache.record_success(key, (w, h), (x, y))
+        cache.invalidate(key, "배너가 닫히지 않음")
+    """
+
+    def __init__(self, path: str = AppConfig.BANNER_POSITION_CACHE) -> None:
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.hits: int = 0
+        self.misses: int = 0
+        self.learned: int = 0
+        self.invalidations: int = 0
+
+    @staticmethod
+    def device_key(driver: WebDriver) -> str:
+        """디바이스/해상도/앱 버전 키 (세션 capabilities + 드라이버당 1회 앱 버전 조회)"""
+        caps = driver.capabilities or {}
+        udid = caps.get('udid') or caps.get('deviceUDID') or caps.get('deviceName') or "unknown"
+        screen = caps.get('deviceScreenSize') or "unknown"
+        return f"{udid}|{screen}|{app_version(driver)}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """캐시 파일 읽기 (없거나 깨졌으면 빈 캐시)"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"배너 좌표 캐시 읽기 실패 - 새로 학습: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _update(self, key: str, entry: Optional[Dict[str, Any]]) -> None:
+        """항목 갱신 후 저장 (다른 워커가 쓴 항목을 덮어쓰지 않도록 파일을 다시 읽어 병합)"""
+        with self._lock:
+            entries = self._load()
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+            self._entries = entries
+            try:
+                write_file(json.dumps(entries, ensure_ascii=False, indent=2).encode('utf-8'), self.path)
+            except OSError as e:
+                logger.warning(f"배너 좌표 캐시 저장 실패 (무시): {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """학습된 좌표 (없으면 None)"""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        return entry
+
+    def record_hit(self, key: str, entry: Dict[str, Any]) -> None:
+        """학습된 좌표로 배너 닫기 성공"""
+        self.hits += 1
+        self._update(key, dict(entry, hits=entry.get('hits', 0) + 1, updated=time.time()))
+
+    def record_success(self, key: str, window: Tuple[int, int], position: Tuple[int, int]) -> None:
+        """후보 좌표 중 배너를 닫은 좌표 학습"""
+        self.learned += 1
+        self._update(key, {'window': list(window), 'position': list(position), 'hits': 0, 'updated': time.time()})
+        logger.info(f"📌 배너 닫기 좌표 학습: {position} (화면 {window[0]}x{window[1]}, {key})")
+
+    def invalidate(self, key: str, reason: str = "") -> None:
+        """더 이상 동작하지 않는 좌표 삭제"""
+        self.invalidations += 1
+        self._update(key, None)
+        logger.warning(f"📌 배너 닫기 좌표 무효화: {key} ({reason})")
+
+
+_cache: Optional[BannerPositionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_banner_position_cache() -> BannerPositionCache:
+    """프로세스 공용 배너 좌표 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = BannerPositionCache()
+        return _cache
+
+
+def log_banner_position_summary() -> None:
+    """세션 종료 시 배너 좌표 캐시 현황"""
+    if _cache is None or not (_cache.hits or _cache.misses):
+        return
+    logger.info(
+        f"📌 배너 좌표 캐시: 학습 좌표 사용 {_cache.hits}회, 미학습 {_cache.misses}회, "
+        f"새로 학습 {_cache.learned}회, 무효화 {_cache.invalidations}회"
+    )
@@ -0,0 +1,276 @@
+"""
+디바이스 풀 (pytest-xdist 워커별 디바이스 할당)
+실무용: 워커마다 다른 디바이스 + 겹치지 않는 systemPort/mjpegServerPort 사용
+       에뮬레이터 수만큼 병렬 실행 (pytest -n 4)
+
+풀 설정 (우선순위 순):
+    DEVICE_POOL_FILE  JSON 파일 [{"udid": "emulator-5554", "appium_url": "http://127.0.0.1:4723"}, ...]
+    DEVICE_POOL       쉼표 구분 UDID 목록 "emulator-5554,emulator-5556"
+    DEVICE_NAME       단일 디바이스 (기존 방식)
+
+잠금:
+    {DEVICE_LOCK_DIR}/{udid}.lock 을 O_EXCL 로 생성 (프로세스 간 원자적)
+    잠금 파일의 pid 가 종료된 프로세스면 (워커 비정상 종료) 회수 후 재할당
+"""
+from typing import Any, Dict, List, Optional
+import atexit
+import json
+import os
+import threading
+import time
+import urllib.request
+from config.app_config import AppConfig
+from utils.exceptions import DeviceUnavailableError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 내용 없는 잠금 파일을 비정상 종료로 볼 때까지의 시간 (초)
+_EMPTY_LOCK_GRACE: float = 10.0
+
+# _try_lock 결과: Appium 서버 응답 없음
+_UNREACHABLE = object()
+
+
+class DeviceLease:
+    """할당된 디바이스 (release() 전까지 다른 워커가 사용하지 않음)"""
+
+    def __init__(self, udid: str, slot: int, appium_url: str, lock_path: str,
+                 extra_capabilities: Optional[Dict[str, Any]] = None) -> None:
+        self.udid: str = udid
+        self.slot: int = slot  # 풀 안의 순번 (포트 계산 기준)
+        self.appium_url: str = appium_url
+        self.lock_path: str = lock_path
+        self.system_port: int = AppConfig.SYSTEM_PORT_BASE + slot
+        self.mjpeg_server_port: int = AppConfig.MJPEG_PORT_BASE + slot
+        self.extra_capabilities: Dict[str, Any] = extra_capabilities or {}
+
+    def capabilities(self, base: Dict[str, Any]) -> Dict[str, Any]:
+        """기본 capabilities 에 디바이스/포트 설정을 덮어쓴 사본"""
+        caps = dict(base)
+        caps.update(self.extra_capabilities)
+        caps.update({
+            "deviceName": self.udid,
+            "udid": self.udid,
+            "systemPort": self.system_port,
+            "mjpegServerPort": self.mjpeg_server_port,
+        })
+        return caps
+
+    def __repr__(self) -> str:
+        return f"DeviceLease({self.udid}, systemPort={self.system_port}, mjpegServerPort={self.mjpeg_server_port})"
+
+
+def load_device_pool(pool_file: Optional[str] = None, pool_env: Optional[str] = None) -> List[Dict[str, Any]]:
+    """풀 설정 읽기 (파일 → 환경 변수 → DEVICE_NAME 순)"""
+    pool_file = pool_file if pool_file is not None else AppConfig.DEVICE_POOL_FILE
+    pool_env = pool_env if pool_env is not None else os.getenv("DEVICE_POOL", "")
+
+    if pool_file and os.path.exists(pool_file):
+        with open(pool_file, encoding='utf-8') as f:
+            devices = json.load(f)
+        return [{'udid': device} if isinstance(device, str) else device for device in devices]
+    if pool_env:
+        return [{'udid': udid.strip()} for udid in pool_env.split(",") if udid.strip()]
+    return [{'udid': AppConfig.WOONGJIN_APP["deviceName"]}]
+
+
+def worker_index(worker_id: Optional[str] = None) -> int:
+    """pytest-xdist 워커 번호 (gw0 → 0, xdist 미사용 시 0)"""
+    worker_id = worker_id if worker_id is not None else os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    digits = "".join(ch for ch in worker_id if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _pid_alive(pid: int) -> bool:
+    """프로세스 생존 여부 (signal 0 - 실제 시그널은 보내지 않음)"""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # 다른 사용자의 살아있는 프로세스
+    except OSError:
+        return False
+    return True
+
+
+def appium_server_ready(url: str, timeout: float = 2.0) -> bool:
+    """Appium 서버 /status 응답 확인"""
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/status", timeout=timeout) as response:
+            payload = json.loads(response.read().decode('utf-8'))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Appium 서버 응답 없음: {url} - {e}")
+        return False
+    return bool(payload.get('value', {}).get('ready', True))
+
+
+class DevicePool:
+    """
+    프로세스 간 공유되는 디바이스 풀
+
+    Usage:
+        pool = DevicePool()
+        lease = pool.acquire()
+        caps = lease.capabilities(AppConfig.get_capabilities("woongjin"))
+        ...
+        pool.release(lease)
+    """
+
+    def __init__(self, devices: Optional[List[Dict[str, Any]]] = None,
+                 lock_dir: str = AppConfig.DEVICE_LOCK_DIR,
+                 check_server: bool = AppConfig.DEVICE_POOL_CHECK_SERVER) -> None:
+        self.devices: List[Dict[str, Any]] = devices if devices is not None else load_device_pool()
+        self.lock_dir: str = lock_dir
+        self.check_server: bool = check_server
+        self._leases: List[DeviceLease] = []
+        self._lock = threading.Lock()
+
+    def lock_path(self, udid: str) -> str:
+        safe_udid = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in udid)
+        return os.path.join(self.lock_dir, f"{safe_udid}.lock")
+
+    def acquire(self, worker_id: Optional[str] = None,
+                timeout: float = AppConfig.DEVICE_ACQUIRE_TIMEOUT,
+                poll_interval: float = 1.0) -> DeviceLease:
+        """
+        빈 디바이스 할당 (워커 번호에 해당하는 디바이스부터 시도)
+
+        Raises:
+            DeviceUnavailableError: timeout 동안 빈 디바이스가 없음
+        """
+        if not self.devices:
+            raise DeviceUnavailableError(0)
+        os.makedirs(self.lock_dir, exist_ok=True)
+        worker_id = worker_id if worker_id is not None else os.getenv("PYTEST_XDIST_WORKER", "gw0")
+        start = worker_index(worker_id) % len(self.devices)
+        order = list(range(start, len(self.devices))) + list(range(start))
+        deadline = time.monotonic() + timeout
+
+        while True:
+            unreachable = 0
+            for slot in order:
+                lease = self._try_lock(slot, worker_id)
+                if lease is _UNREACHABLE:
+                    unreachable += 1
+                elif lease is not None:
+                    logger.info(f"📱 디바이스 할당 [{worker_id}]: {lease}")
+                    return lease
+            # 모든 디바이스의 Appium 서버가 응답하지 않으면 기다려도 소용없음
+            if unreachable == len(order) or time.monotonic() >= deadline:
+                raise DeviceUnavailableError(len(self.devices), timeout, worker_id)
+            time.sleep(poll_interval)
+
+    def _try_lock(self, slot: int, worker_id: str) -> Optional[DeviceLease]:
+        """디바이스 잠금 시도 (사용 중이면 None, Appium 서버 응답 없으면 _UNREACHABLE)"""
+        device = self.devices[slot]
+        udid = device['udid']
+        appium_url = device.get('appium_url', AppConfig.APPIUM_SERVER_URL)
+        path = self.lock_path(udid)
+
+        if not self._create_lock(path, udid, worker_id):
+            if not self._reclaim_stale(path):
+                return None
+            if not self._create_lock(path, udid, worker_id):
+                return None
+
+        if self.check_server and not appium_server_ready(appium_url):
+            logger.warning(f"Appium 서버 준비 안 됨 - 건너뜀: {udid} ({appium_url})")
+            self._remove_lock(path)
+            return _UNREACHABLE
+
+        lease = DeviceLease(udid, slot, appium_url, path, device.get('capabilities'))
+        with self._lock:
+            self._leases.append(lease)
+        return lease
+
+    def _create_lock(self, path: str, udid: str, worker_id: str) -> bool:
+        """잠금 파일 원자적 생성 (이미 있으면 False)"""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'udid': udid, 'pid': os.getpid(), 'worker': worker_id, 'acquired': time.time()}, f)
+        return True
+
+    def _reclaim_stale(self, path: str) -> bool:
+        """소유 프로세스가 종료된 잠금 회수 (비정상 종료한 워커의 디바이스 반환)"""
+        owner = self._read_lock(path)
+        if owner is None:
+            return not os.path.exists(path)  # 그 사이 반환됐으면 재시도
+        if owner and _pid_alive(int(owner.get('pid', 0))):
+            return False
+        if not owner and time.time() - os.path.getmtime(path) < _EMPTY_LOCK_GRACE:
+            return False  # 생성 직후 내용을 쓰기 전일 수 있음
+
+        # 다른 워커와 동시에 회수해도 한 쪽만 성공하도록 rename 후 내용 확인
+        stale_path = f"{path}.{os.getpid()}.stale"
+        try:
+            os.rename(path, stale_path)
+        except FileNotFoundError:
+            return True
+        if self._read_lock(stale_path) != owner:
+            # 그 사이 다른 워커가 새로 잡은 잠금 - 되돌림 (이미 새 잠금이 있으면 유지)
+            try:
+                os.link(stale_path, path)
+            except FileExistsError:
+                pass
+            self._remove_lock(stale_path)
+            return False
+        self._remove_lock(stale_path)
+        logger.warning(f"♻️ 종료된 워커의 디바이스 회수: {owner.get('udid')} (pid {owner.get('pid')}, {owner.get('worker')})")
+        return True
+
+    @staticmethod
+    def _read_lock(path: str) -> Optional[Dict[str, Any]]:
+        """잠금 파일 내용 (파일 없으면 None, 내용이 비었거나 깨졌으면 {})"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.loads(f.read() or "{}")
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return {}
+
+    @staticmethod
+    def _remove_lock(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def release(self, lease: DeviceLease) -> None:
+        """디바이스 반환 (자신의 잠금일 때만 삭제)"""
+        with self._lock:
+            if lease not in self._leases:
+                return
+            self._leases.remove(lease)
+        owner = self._read_lock(lease.lock_path)
+        if owner and owner.get('pid') == os.getpid():
+            self._remove_lock(lease.lock_path)
+            logger.info(f"📱 디바이스 반환: {lease.udid}")
+
+    def release_all(self) -> None:
+        """보유 중인 모든 디바이스 반환 (프로세스 종료 시)"""
+        with self._lock:
+            leases = list(self._leases)
+        for lease in leases:
+            self.release(lease)
+
+
+_pool: Optional[DevicePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_device_pool() -> DevicePool:
+    """프로세스 공용 디바이스 풀 (종료 시 자동 반환)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DevicePool()
+            atexit.register(_pool.release_all)
+        return _pool
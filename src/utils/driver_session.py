@@ -0,0 +1,255 @@
+"""
+Appium 세션 재사용 관리
+실무용: 세션 생성 + 앱 실행 + 초기 팝업 처리(테스트당 20~40초)를 한 번만 하고,
+       테스트 사이에는 설정된 방식으로 앱 상태만 초기화
+
+초기화 방식 (AppConfig.APP_RESET_STRATEGY):
+    none     초기화 없음 (앱이 포그라운드가 아니면 실행만)
+    restart  terminate_app → activate_app (로그인 등 앱 데이터 유지)
+    clear    mobile: clearApp → activate_app (앱 데이터 삭제, 새 세션과 같은 상태)
+
+성능 프로필 (AppConfig.CAPABILITY_PROFILE):
+    capabilities + Appium settings 묶음 (default | fast | debug)
+    세션 생성 시간 / 홈 화면 도달 시간을 프로필별로 AppConfig.PROFILE_TIMING_LOG 에 기록 (JSON lines)
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import os
+import statistics
+import time
+from selenium.common.exceptions import WebDriverException
+from appium import webdriver
+from appium.webdriver.webdriver import WebDriver
+from appium.options.android import UiAutomator2Options
+from config.app_config import AppConfig
+from utils.hierarchy_cache import get_hierarchy_cache, log_cache_stats
+from utils.logger import get_logger
+from utils.phase_timer import timed_phase
+from utils.popup_handler import handle_woongjin_popups
+
+logger = get_logger(__name__)
+
+RESET_STRATEGIES = ("none", "restart", "clear")
+
+
+class DriverSession:
+    """
+    테스트 간 공유하는 Appium 세션 (pytest-xdist 워커당 1개)
+
+    Usage:
+        session = DriverSession()
+        driver = session.acquire()   # 테스트 시작 - 상태 확인/초기화
+        session.release()            # 테스트 종료
+        session.close()              # 세션 종료
+    """
+
+    def __init__(self, capabilities: Optional[Dict[str, Any]] = None,
+                 server_url: str = AppConfig.APPIUM_SERVER_URL,
+                 reset_strategy: str = AppConfig.APP_RESET_STRATEGY,
+                 reuse: bool = AppConfig.DRIVER_SCOPE == "session",
+                 profile: str = AppConfig.CAPABILITY_PROFILE) -> None:
+        if reset_strategy not in RESET_STRATEGIES:
+            raise ValueError(f"Unknown reset strategy: {reset_strategy} (사용 가능: {', '.join(RESET_STRATEGIES)})")
+        self.profile: str = profile
+        self.settings: Dict[str, Any] = AppConfig.get_settings(profile)
+        self.capabilities: Dict[str, Any] = capabilities or AppConfig.get_capabilities("woongjin", profile)
+        self.server_url: str = server_url
+        self.app_package: str = self.capabilities["appPackage"]
+        self.reset_strategy: str = reset_strategy
+        self.reuse: bool = reuse
+        self.driver: Optional[WebDriver] = None
+        self.sessions_created: int = 0
+        self.sessions_recovered: int = 0
+        self.setup_timings: List[Tuple[str, float]] = []  # (준비 방식, 소요 시간)
+        # 로그인된 계정 (앱 데이터가 유지되는 동안 재사용, 세션 재생성/데이터 삭제 시 초기화)
+        self.authenticated_user: Optional[str] = None
+        self.logins: int = 0         # UI 로그인 수행 횟수
+        self.login_reuses: int = 0   # 기존 로그인 상태 재사용 횟수
+
+    def acquire(self, reset_strategy: Optional[str] = None) -> WebDriver:
+        """
+        테스트용 드라이버 준비 (세션이 없거나 죽었으면 새로 생성, 있으면 상태 초기화)
+
+        Args:
+            reset_strategy: 이번 테스트에만 적용할 초기화 방식 (로그인 유지가 필요한 테스트 등)
+        """
+        reset_strategy = reset_strategy or self.reset_strategy
+        if reset_strategy not in RESET_STRATEGIES:
+            raise ValueError(f"Unknown reset strategy: {reset_strategy} (사용 가능: {', '.join(RESET_STRATEGIES)})")
+        started = time.monotonic()
+        if self.driver is not None and not self._check_health():
+            logger.warning("⚠️ Appium 세션 응답 없음 - 세션 재생성")
+            self.sessions_recovered += 1
+            self._quit()
+
+        mode = f"reset:{reset_strategy}"
+        if self.driver is not None:
+            try:
+                self._reset(reset_strategy)
+            except WebDriverException as e:
+                logger.warning(f"⚠️ 앱 상태 초기화 실패 - 세션 재생성: {e}")
+                self.sessions_recovered += 1
+                self._quit()
+
+        if self.driver is None:
+            self._create()
+            mode = "new_session"
+
+        elapsed = time.monotonic() - started
+        self.setup_timings.append((mode, elapsed))
+        logger.info(f"⏱️ 테스트 준비: {elapsed:.1f}s ({mode})")
+        return self.driver
+
+    def release(self) -> None:
+        """테스트 종료 (세션 재사용 안 하면 종료)"""
+        if not self.reuse:
+            self._quit()
+
+    def close(self) -> None:
+        """세션 종료 + 준비 시간 요약"""
+        self._quit()
+        self.log_summary()
+
+    def _check_health(self) -> bool:
+        with timed_phase("session.health_check"):
+            return self.is_healthy()
+
+    def is_healthy(self) -> bool:
+        """세션 생존 확인 (가벼운 조회 1회)"""
+        try:
+            return bool(self.driver.current_package)
+        except WebDriverException as e:
+            logger.debug(f"세션 상태 확인 실패: {e}")
+            return False
+
+    def _create(self) -> None:
+        """새 세션 생성 + 프로필 settings 적용 + 앱 초기 팝업 처리 (소요 시간 기록)"""
+        started = time.monotonic()
+        options = UiAutomator2Options().load_capabilities(self.capabilities)
+        with timed_phase("session.create"):
+            self.driver = webdriver.Remote(self.server_url, options=options)
+        session_create = time.monotonic() - started
+        self.sessions_created += 1
+        self.authenticated_user = None
+        if self.settings:
+            try:
+                with timed_phase("session.settings"):
+                    self.driver.update_settings(self.settings)
+            except WebDriverException as e:
+                logger.warning(f"⚠️ Appium settings 적용 실패 ({self.profile}): {e}")
+        popups = handle_woongjin_popups(self.driver, wait_time=AppConfig.POPUP_WAIT)
+        time_to_home = time.monotonic() - started
+
+        logger.info(f"⏱️ 세션 생성 [{self.profile}]: {session_create:.1f}s, 홈 화면까지 {time_to_home:.1f}s")
+        record_profile_timing({
+            'profile': self.profile,
+            'udid': self.capabilities.get('udid') or self.capabilities.get('deviceName'),
+            'worker': os.getenv("PYTEST_XDIST_WORKER", "master"),
+            'session_create': round(session_create, 3),
+            'time_to_home': round(time_to_home, 3),
+            'popups': popups,
+            'timestamp': time.time(),
+        })
+
+    def _reset(self, reset_strategy: str) -> None:
+        """지정된 방식으로 앱 상태 초기화"""
+        driver = self.driver
+        if reset_strategy == "none":
+            with timed_phase("app.activate"):
+                if driver.current_package != self.app_package:
+                    driver.activate_app(self.app_package)
+            get_hierarchy_cache(driver).invalidate("app state check")
+            return
+
+        if reset_strategy == "clear":
+            # 앱 데이터 삭제 (권한 포함) - 권한/배너 팝업이 다시 나타남, 로그인도 해제
+            with timed_phase("app.clear"):
+                driver.execute_script("mobile: clearApp", {"appId": self.app_package})
+            self.authenticated_user = None
+        else:
+            with timed_phase("app.terminate"):
+                driver.terminate_app(self.app_package)
+        with timed_phase("app.activate"):
+            driver.activate_app(self.app_package)
+        get_hierarchy_cache(driver).invalidate(f"app {reset_strategy}")
+        handle_woongjin_popups(driver, wait_time=AppConfig.POPUP_WAIT)
+
+    def _quit(self) -> None:
+        if self.driver is None:
+            return
+        self._log_cache_stats()
+        try:
+            self.driver.quit()
+        except WebDriverException as e:
+            logger.debug(f"세션 종료 중 에러 (무시): {e}")
+        self.driver = None
+
+    def _log_cache_stats(self) -> None:
+        """세션 전체의 계층 캐시 효과 기록 (테스트별 기록은 driver 픽스처)"""
+        log_cache_stats(get_hierarchy_cache(self.driver).stats(), "세션")
+
+    def log_summary(self) -> None:
+        """새 세션 대비 상태 초기화 준비 시간 비교"""
+        if not self.setup_timings:
+            return
+        totals: Dict[str, List[float]] = {}
+        for mode, elapsed in self.setup_timings:
+            totals.setdefault(mode, []).append(elapsed)
+        for mode, values in totals.items():
+            logger.info(f"⏱️ 준비 시간 [{mode}]: {len(values)}회, 평균 {sum(values) / len(values):.1f}s, 합계 {sum(values):.1f}s")
+
+        new_sessions = totals.get("new_session", [])
+        resets = [elapsed for mode, values in totals.items() if mode.startswith("reset:") for elapsed in values]
+        if new_sessions and resets:
+            saved = (sum(new_sessions) / len(new_sessions) - sum(resets) / len(resets)) * len(resets)
+            logger.info(f"⏱️ 세션 재사용으로 절약: 약 {saved:.1f}s (재생성 {self.sessions_recovered}회)")
+        if self.logins or self.login_reuses:
+            logger.info(f"🔑 로그인: UI 로그인 {self.logins}회, 로그인 상태 재사용 {self.login_reuses}회")
+        for profile, summary in summarize_profile_timings().items():
+            logger.info(
+                f"⏱️ 프로필 [{profile}] 누적 {summary['runs']}회: 세션 생성 중앙값 {summary['session_create']:.1f}s, "
+                f"홈 화면까지 중앙값 {summary['time_to_home']:.1f}s"
+            )
+
+
+def record_profile_timing(record: Dict[str, Any], path: str = AppConfig.PROFILE_TIMING_LOG) -> None:
+    """프로필별 세션 준비 시간 1건 추가 (JSON lines, 워커 간 append)"""
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"프로필 소요 시간 기록 실패 (무시): {e}")
+
+
+def summarize_profile_timings(path: str = AppConfig.PROFILE_TIMING_LOG) -> Dict[str, Dict[str, float]]:
+    """
+    프로필별 누적 세션 준비 시간 (프로필 선택 근거)
+
+    Returns:
+        {프로필: {'runs', 'session_create', 'time_to_home'}} - 시간은 중앙값(초)
+    """
+    timings: Dict[str, Dict[str, List[float]]] = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    session_create, time_to_home = record['session_create'], record['time_to_home']
+                except (ValueError, KeyError):
+                    continue
+                values = timings.setdefault(record.get('profile', 'default'), {'session_create': [], 'time_to_home': []})
+                values['session_create'].append(session_create)
+                values['time_to_home'].append(time_to_home)
+    except FileNotFoundError:
+        return {}
+    return {
+        profile: {
+            'runs': len(values['session_create']),
+            'session_create': statistics.median(values['session_create']),
+            'time_to_home': statistics.median(values['time_to_home']),
+        }
+        for profile, values in timings.items()
+    }
@@ -0,0 +1,157 @@
+"""
+대기 유틸리티
+실무용: 여러 후보 로케이터를 폴링 1회당 page_source 1회로 동시에 확인
+       (패턴 N개 × 타임아웃 → 타임아웃 1회)
+       고정 sleep 대신 화면 안정화(계층 지문 일치) 감지
+"""
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple, Any
+import time
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from appium.webdriver.webdriver import WebDriver
+from config.app_config import AppConfig
+from utils.hierarchy_cache import HierarchySnapshot, get_hierarchy_cache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Locator = Tuple[Any, str]
+
+DEFAULT_POLL_INTERVAL: float = 0.5
+
+
+class LocatorMatch(NamedTuple):
+    """find_first_of 결과"""
+    index: int              # 매칭된 로케이터의 우선순위 (0부터)
+    locator: Locator        # 매칭된 로케이터
+    element: WebElement     # 매칭된 요소
+
+
+def _matches(driver: WebDriver, snapshot: HierarchySnapshot, locator: Locator, visible: bool) -> bool:
+    """스냅샷으로 매칭 확인, 로컬 해석 불가 로케이터는 서버에 즉시 조회 (대기 없음)"""
+    nodes = snapshot.find(locator)
+    if nodes is None:
+        return bool(driver.find_elements(*locator))
+    if visible:
+        return any(node.is_visible for node in nodes)
+    return bool(nodes)
+
+
+def find_first_of(driver: WebDriver, locators: Sequence[Locator], timeout: float = 10,
+                  visible: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL) -> Optional[LocatorMatch]:
+    """
+    우선순위 순 로케이터 목록 중 가장 먼저(우선순위 높은) 매칭되는 요소 찾기
+
+    폴링마다 page_source 1회 조회 후 모든 로케이터를 로컬에서 확인하므로
+    fallback 패턴이 많아도 전체 비용은 타임아웃 1회
+
+    Args:
+        driver: WebDriver 인스턴스
+        locators: 우선순위 순 로케이터 목록
+        timeout: 최대 대기 시간 (초), 0이면 1회만 확인
+        visible: True면 보이는 요소만 매칭
+        poll_interval: 폴링 간격 (초)
+
+    Returns:
+        LocatorMatch(index, locator, element), 타임아웃 시 None
+    """
+    cache = get_hierarchy_cache(driver)
+    deadline = time.monotonic() + timeout
+    snapshot = cache.snapshot()
+    ticks = 0
+
+    while True:
+        ticks += 1
+        for index, locator in enumerate(locators):
+            if not _matches(driver, snapshot, locator, visible):
+                continue
+            try:
+                element = driver.find_element(*locator)
+            except (NoSuchElementException, StaleElementReferenceException):
+                # 스냅샷 이후 화면이 바뀌었거나 로컬/서버 해석이 다름 (WebView resource-id 등)
+                # → 다음 후보 확인, 서버에서 찾은 후보가 하나도 없으면 다음 폴링에서 재확인
+                logger.debug(f"find_first_of: 로컬 매칭 후 서버 조회 실패 - {locator}")
+                continue
+            logger.debug(f"find_first_of: 패턴 {index + 1}/{len(locators)} 매칭 ({ticks}회 폴링) - {locator}")
+            return LocatorMatch(index, locator, element)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.debug(f"find_first_of: {timeout}초 동안 매칭 없음 ({ticks}회 폴링, 패턴 {len(locators)}개)")
+            return None
+        time.sleep(min(poll_interval, remaining))
+        snapshot = cache.refresh()
+
+
+
+def wait_for_any(driver: WebDriver, branches: Dict[str, Locator], timeout: float = 10,
+                 visible: bool = True) -> Tuple[Optional[str], Optional[WebElement]]:
+    """
+    여러 결과 분기 중 먼저 나타나는 분기 대기 (모든 분기를 함께 폴링)
+
+    Args:
+        driver: WebDriver 인스턴스
+        branches: {분기 이름: 로케이터} - 동시에 보이면 먼저 적힌 분기 우선
+        timeout: 최대 대기 시간 (초)
+        visible: True면 보이는 요소만 매칭
+
+    Returns:
+        (분기 이름, 요소), 타임아웃 시 (None, None)
+    """
+    names = list(branches)
+    match = find_first_of(driver, [branches[name] for name in names], timeout=timeout, visible=visible)
+    if match is None:
+        return None, None
+    return names[match.index], match.element
+
+
+def wait_until_settled(driver: WebDriver, max_wait: float = 2.0,
+                       quiet_period: float = AppConfig.SETTLE_QUIET_PERIOD) -> bool:
+    """
+    화면이 안정될 때까지 대기 (고정 sleep 대체)
+    quiet_period 간격의 연속 두 계층 지문이 같으면 즉시 반환
+
+    page_source 조회도 max_wait 안에서 계산:
+    - 직전 조회 시간으로 다음 조회가 max_wait 를 넘길 것 같으면 조회하지 않음
+    - 조회 1회가 max_wait 보다 긴 화면(WebView 등)은 고정 대기로 대체 (기존 sleep 보다 느려지지 않도록)
+
+    AppConfig.FIXED_SLEEPS 가 켜져 있으면 (디버깅용) max_wait 만큼 고정 대기
+
+    Args:
+        driver: WebDriver 인스턴스
+        max_wait: 최대 대기 시간 (초) - 대체한 고정 sleep 시간
+        quiet_period: 지문 비교 간격 (초)
+
+    Returns:
+        안정화 여부 (max_wait 안에 확인하지 못하면 False)
+    """
+    cache = get_hierarchy_cache(driver)
+    started = time.monotonic()
+
+    if AppConfig.FIXED_SLEEPS or (cache.fetch_time is not None and cache.fetch_time >= max_wait):
+        time.sleep(max_wait)
+        cache.record_settle(max_wait, max_wait)
+        return AppConfig.FIXED_SLEEPS
+
+    deadline = started + max_wait
+    # 직전 안정화/조회 결과가 충분히 최신이면 재사용 (조회 1회 절약)
+    snapshot = cache.peek()
+    if snapshot is None or snapshot.age > quiet_period:
+        snapshot = cache.refresh()
+    settled = False
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= cache.fetch_time:
+            break  # 다음 조회가 max_wait 를 넘김
+        time.sleep(min(quiet_period, remaining - cache.fetch_time))
+        current = cache.refresh()
+        if current.fingerprint == snapshot.fingerprint:
+            settled = True
+            break
+        snapshot = current
+
+    spent = time.monotonic() - started
+    cache.record_settle(max_wait, spent)
+    logger.debug(f"wait_until_settled: {'안정화' if settled else '시간 초과'} {spent:.2f}s (고정 대기 {max_wait}s)")
+    return settled
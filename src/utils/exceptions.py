@@ -75,3 +75,18 @@ class AppConnectionError(AppiumTestError):
         if activity:
             msg += f"/{activity}"
         super().__init__(msg)
+
+
+class DeviceUnavailableError(AppiumTestError):
+    """할당 가능한 디바이스 없음"""
+
+    def __init__(self, pool_size, timeout=0, worker=""):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.worker = worker
+        msg = f"할당 가능한 디바이스 없음 (풀: {pool_size}대"
+        if timeout:
+            msg += f", 대기: {timeout}초"
+        if worker:
+            msg += f", 워커: {worker}"
+        super().__init__(msg + ")")
@@ -0,0 +1,182 @@
+"""
+테스트 실패 시 증거 수집
+실무용: 스크린샷/page_source/현재 화면 정보를 동시에 요청하고 전체 제한 시간 안에 끝냄
+       (응답 없는 디바이스가 워커 전체를 멈추지 않도록)
+       파일 저장은 백그라운드, XML은 gzip 압축, 세션당 저장 개수/용량 제한
+
+구조:
+    {SCREENSHOT_DIR}/...                         실패 스크린샷 (해시 저장소, 이름 FAILED_...)
+    {PAGE_SOURCE_DIR}/FAILED_{테스트}_{시각}.xml.gz  실패 시점 page_source
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import gzip
+import threading
+import time
+from datetime import datetime
+from appium.webdriver.webdriver import WebDriver
+from config.app_config import AppConfig
+from utils.artifact_store import get_artifact_store
+from utils.logger import get_logger
+from utils.popup_guardian import unguarded
+from utils.screenshot_writer import get_screenshot_writer, write_file
+
+logger = get_logger(__name__)
+
+
+class FailureArtifactBudget:
+    """세션당 실패 증거 저장 한도 (개수 + 용량)"""
+
+    def __init__(self, max_count: int = AppConfig.FAILURE_ARTIFACT_MAX_COUNT,
+                 max_bytes: int = AppConfig.FAILURE_ARTIFACT_MAX_BYTES) -> None:
+        self.max_count: int = max_count
+        self.max_bytes: int = max_bytes
+        self._lock = threading.Lock()
+        self.captures: int = 0
+        self.bytes_used: int = 0
+        self.skipped: int = 0
+        self.timeouts: int = 0
+
+    def reserve(self) -> bool:
+        """저장 가능하면 1건 예약 (한도 초과 시 False)"""
+        with self._lock:
+            if self.captures >= self.max_count or self.bytes_used >= self.max_bytes:
+                self.skipped += 1
+                if self.skipped == 1:
+                    logger.warning(
+                        f"⚠️ 실패 증거 저장 한도 도달 ({self.captures}건, {self.bytes_used / 1024 / 1024:.1f}MB) "
+                        f"- 이후 실패는 로그만 기록"
+                    )
+                return False
+            self.captures += 1
+            return True
+
+    def add_bytes(self, size: int) -> None:
+        with self._lock:
+            self.bytes_used += size
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+def _call_with_deadline(calls: Dict[str, Callable[[], Any]], timeout: float) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    여러 원격 조회를 동시에 실행하고 timeout 까지 끝난 결과만 반환
+    멈춘 조회는 daemon 스레드에 남겨둠 (프로세스 종료를 막지 않음)
+    팝업 감시 잠금은 거치지 않음 (감시 조회가 멈춰도 제한 시간 안에 수집)
+
+    Returns:
+        (결과, 제한 시간 안에 끝나지 않은 조회 이름 목록)
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    def run(name: str, call: Callable[[], Any]) -> None:
+        try:
+            with unguarded():
+                results[name] = call()
+        except Exception as e:
+            errors[name] = str(e)
+
+    threads = [
+        threading.Thread(target=run, args=(name, call), name=f"failure-capture-{name}", daemon=True)
+        for name, call in calls.items()
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(deadline - time.monotonic(), 0))
+
+    pending = [thread.name.rsplit("-", 1)[1] for thread in threads if thread.is_alive()]
+    for name, error in dict(errors).items():
+        logger.error(f"실패 캡처 중 에러 ({name}): {error}")
+    return dict(results), pending
+
+
+def _write_page_source(source: str, path: str, budget: FailureArtifactBudget) -> None:
+    """page_source gzip 압축 저장 (백그라운드 스레드에서 실행)"""
+    data = gzip.compress(source.encode('utf-8'), compresslevel=6)
+    write_file(data, path)
+    budget.add_bytes(len(data))
+
+
+def capture_failure_artifacts(driver: WebDriver, test_name: str,
+                              timeout: float = AppConfig.FAILURE_CAPTURE_TIMEOUT,
+                              budget: Optional[FailureArtifactBudget] = None) -> Dict[str, Any]:
+    """
+    실패 증거 수집 (원격 조회는 동시에, 전체 timeout 초 안에 반환)
+
+    Args:
+        driver: WebDriver 인스턴스
+        test_name: 파일명에 쓸 테스트 이름
+        timeout: 전체 제한 시간 (초)
+        budget: 저장 한도 (기본: 세션 공용)
+
+    Returns:
+        {'screenshot_name', 'screenshot_path', 'png', 'source_path', 'activity', 'package', 'timed_out'}
+        제한 시간 안에 받지 못한 항목은 'timed_out' 목록에 포함
+    """
+    budget = budget or get_failure_budget()
+    started = time.monotonic()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base_name = f"FAILED_{test_name}_{timestamp}"
+
+    results, timed_out = _call_with_deadline({
+        'png': driver.get_screenshot_as_png,
+        'source': lambda: driver.page_source,
+        'activity': lambda: driver.current_activity,
+        'package': lambda: driver.current_package,
+    }, timeout)
+    if timed_out:
+        budget.record_timeout()
+        logger.error(f"⏱️ 실패 캡처 제한 시간({timeout}s) 초과 - 미수집: {', '.join(timed_out)}")
+
+    artifacts: Dict[str, Any] = {
+        'screenshot_name': base_name,
+        'png': results.get('png'),
+        'activity': results.get('activity'),
+        'package': results.get('package'),
+        'timed_out': timed_out,
+    }
+    if artifacts['package'] or artifacts['activity']:
+        logger.error(f"📱 현재 화면: {artifacts['package']}/{artifacts['activity']}")
+
+    if ('png' in results or 'source' in results) and budget.reserve():
+        writer = get_screenshot_writer()
+        if 'png' in results:
+            png = results['png']
+            artifacts['screenshot_path'] = get_artifact_store().put(base_name, png, writer=writer)
+            budget.add_bytes(len(png))
+            logger.error(f"📸 실패 스크린샷 저장: {artifacts['screenshot_path']} ({base_name})")
+        if 'source' in results:
+            source_path = f"{AppConfig.PAGE_SOURCE_DIR}/{base_name}.xml.gz"
+            writer.submit_task(_write_page_source, results['source'], source_path, budget)
+            artifacts['source_path'] = source_path
+            logger.error(f"📄 실패 페이지 소스 저장: {source_path}")
+
+    logger.debug(f"실패 캡처 완료: {time.monotonic() - started:.2f}s")
+    return artifacts
+
+
+_budget: Optional[FailureArtifactBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_failure_budget() -> FailureArtifactBudget:
+    """세션 공용 실패 증거 저장 한도"""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            _budget = FailureArtifactBudget()
+        return _budget
+
+
+def log_failure_capture_summary() -> None:
+    """세션 종료 시 실패 증거 저장 현황"""
+    if _budget is None:
+        return
+    logger.info(
+        f"🧯 실패 증거: 저장 {_budget.captures}건 ({_budget.bytes_used / 1024 / 1024:.1f}MB), "
+        f"한도 초과 생략 {_budget.skipped}건, 제한 시간 초과 {_budget.timeouts}건"
+    )
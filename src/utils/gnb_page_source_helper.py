@@ -1,25 +1,45 @@
 """
-페이지 소스 관련 유틸리티
+페이지 소스 관련 유틸리티 (GNB 영역)
+실무용: page_source 1회 조회로 GNB 컨테이너를 로컬 트리에서 찾아 저장/출력
+       (저장된 덤프 파일도 print_gnb_elements("window_dump.xml") 로 분석 가능)
 """
+from typing import List, Optional
+from itertools import islice
+import xml.etree.ElementTree as ET
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import StaleElementReferenceException
 from appium.webdriver.webdriver import WebDriver
 from config.app_config import AppConfig
-import xml.etree.ElementTree as ET
-
-
-def save_page_source(driver: WebDriver, filename: str = "page_source.xml") -> str:
-    """현재 화면의 UI 계층 구조를 XML 파일로 저장"""
-    AppConfig.ensure_directories()
-
-    source = driver.page_source
-    filepath = f"{AppConfig.PAGE_SOURCE_DIR}/{filename}"
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(source)
-
-    print(f"Page source saved to {filepath}")
-    return source
+from utils.hierarchy_cache import get_hierarchy_cache
+from utils.hierarchy_stream import find_gnb_subtree
+from utils.locator_engine import resolve_locator
+from utils.page_source_helper import (
+    SourceLike,
+    load_ui_tree,
+    print_all_elements,
+    print_elements_with_content_desc,
+    print_elements_with_text,
+    save_page_source,
+)
+from utils.ui_tree import UiNode, UiTree
+
+# GNB 컨테이너 후보 (우선순위 순)
+GNB_SELECTORS = [
+    (AppiumBy.ID, "com.wjthinkbig.woongjinbooks:id/ll_gnb"),
+    (AppiumBy.ID, "com.wjthinkbig.woongjinbooks:id/bottom_navigation"),
+    (AppiumBy.XPATH, "//*[contains(@resource-id, 'gnb')]"),
+    (AppiumBy.XPATH, "//*[contains(@resource-id, 'bottom')]"),
+    (AppiumBy.XPATH, "//*[contains(@resource-id, 'navigation')]"),
+]
+
+
+def find_gnb_container(tree: UiTree) -> Optional[UiNode]:
+    """우선순위가 가장 높은 GNB 컨테이너 노드 (없으면 None)"""
+    for locator in GNB_SELECTORS:
+        nodes = resolve_locator(tree, locator)
+        if nodes:
+            print(f"✅ GNB 컨테이너 발견: {locator[1]}")
+            return nodes[0]
+    return None
 
 
 def save_gnb_source(driver: WebDriver, filename: str = "gnb_source.xml") -> str:
@@ -34,165 +54,60 @@ def save_gnb_source(driver: WebDriver, filename: str = "gnb_source.xml") -> str:
         추출된 GNB XML 문자열
     """
     AppConfig.ensure_directories()
-    
-    source = driver.page_source
-    
+
     try:
-        # XML 파싱
-        root = ET.fromstring(source)
-        
-        # GNB 영역 찾기 (여러 패턴 시도)
-        gnb_patterns = [
-            ".//android.widget.LinearLayout[@resource-id='com.wjthinkbig.woongjinbooks:id/ll_gnb']",
-            ".//android.widget.LinearLayout[@resource-id='com.wjthinkbig.woongjinbooks:id/bottom_navigation']",
-            ".//*[@resource-id='com.wjthinkbig.woongjinbooks:id/ll_gnb']",
-            ".//*[contains(@resource-id, 'gnb')]",
-            ".//*[contains(@resource-id, 'bottom')]",
-            ".//*[contains(@resource-id, 'navigation')]",
-        ]
-        
-        gnb_element = None
-        for pattern in gnb_patterns:
-            gnb_element = root.find(pattern)
-            if gnb_element is not None:
-                print(f"✅ GNB 영역 발견: {pattern}")
-                break
-        
-        if gnb_element is None:
+        snapshot = get_hierarchy_cache(driver).snapshot()
+        gnb_node = find_gnb_container(snapshot.tree)
+
+        if gnb_node is None:
             print("⚠️ GNB 영역을 찾을 수 없습니다. 전체 소스를 저장합니다.")
-            gnb_xml = source
+            gnb_xml = snapshot.source
         else:
-            # GNB 요소를 XML 문자열로 변환
+            # 트리 노드 순서 = ET 문서 순서 → 같은 위치의 원본 요소를 XML 문자열로 변환
+            gnb_element = next(islice(snapshot.root.iter(), gnb_node.order, None))
             gnb_xml = ET.tostring(gnb_element, encoding='unicode')
-        
-        # 파일 저장
+
         filepath = f"{AppConfig.PAGE_SOURCE_DIR}/{filename}"
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(gnb_xml)
-        
+
         print(f"📄 GNB source saved to {filepath}")
         return gnb_xml
-        
+
     except Exception as e:
         print(f"❌ GNB 추출 실패: {e}")
         print("전체 소스를 저장합니다.")
         return save_page_source(driver, filename)
 
 
-def print_gnb_elements(driver: WebDriver) -> None:
+def print_gnb_elements(source: SourceLike) -> None:
     """GNB 영역의 모든 요소 출력"""
-    from appium.webdriver.common.appiumby import AppiumBy
-    
     print("\n=== GNB 영역 요소 분석 ===\n")
-    
-    # GNB 영역 찾기
-    gnb_selectors = [
-        (AppiumBy.ID, "com.wjthinkbig.woongjinbooks:id/ll_gnb"),
-        (AppiumBy.XPATH, "//*[contains(@resource-id, 'gnb')]"),
-        (AppiumBy.XPATH, "//*[contains(@resource-id, 'bottom')]"),
-        (AppiumBy.XPATH, "//*[contains(@resource-id, 'navigation')]"),
-    ]
-    
-    gnb_container = None
-    for by, selector in gnb_selectors:
-        try:
-            gnb_container = driver.find_element(by, selector)
-            print(f"✅ GNB 컨테이너 발견: {selector}")
-            break
-        except:
-            continue
-    
+
+    if isinstance(source, str) and not source.lstrip().startswith("<"):
+        # 저장된 덤프: 전체 트리 대신 GNB 서브트리만 스트리밍 추출 (대용량 WebView 덤프 대비)
+        match = find_gnb_subtree(source)
+        gnb_container = UiTree(match.element).root if match else None
+        if match:
+            print(f"✅ GNB 컨테이너 발견: {match.target}")
+    else:
+        gnb_container = find_gnb_container(load_ui_tree(source))
     if gnb_container is None:
         print("⚠️ GNB 컨테이너를 찾을 수 없습니다.")
         return
-    
-    # GNB 내부의 모든 요소 찾기
-    try:
-        elements = gnb_container.find_elements(AppiumBy.XPATH, ".//*")
-        print(f"\n📊 GNB 내부 요소 수: {len(elements)}\n")
-        
-        for idx, elem in enumerate(elements):
-            try:
-                tag = elem.tag_name
-                resource_id = elem.get_attribute('resource-id') or ""
-                text = elem.get_attribute('text') or ""
-                content_desc = elem.get_attribute('content-desc') or ""
-                clickable = elem.get_attribute('clickable') or ""
-                
-                print(f"[{idx+1}] {tag}")
-                if resource_id:
-                    print(f"    ├─ Resource-ID: {resource_id}")
-                if text:
-                    print(f"    ├─ Text: {text}")
-                if content_desc:
-                    print(f"    ├─ Content-desc: {content_desc}")
-                if clickable == "true":
-                    print(f"    └─ ✅ Clickable")
-                print()
-                
-            except Exception as e:
-                print(f"[{idx+1}] Error: {e}\n")
-                
-    except Exception as e:
-        print(f"❌ GNB 요소 분석 실패: {e}")
-
-
-def print_all_elements(driver: WebDriver) -> None:
-    """화면의 모든 요소 정보 출력"""
-
-    elements = driver.find_elements(AppiumBy.XPATH, "//*")
-    print(f"\n=== 전체 요소 수: {len(elements)} ===\n")
-
-    for idx, elem in enumerate(elements[:50]):  # 처음 50개만 출력
-        try:
-            tag = elem.tag_name
-            resource_id = elem.get_attribute('resource-id') or ""
-            text = elem.get_attribute('text') or ""
-            content_desc = elem.get_attribute('content-desc') or ""
-
-            if resource_id or text or content_desc:
-                print(f"[{idx}] Tag: {tag}")
-                if resource_id:
-                    print(f"    Resource-ID: {resource_id}")
-                if text:
-                    print(f"    Text: {text}")
-                if content_desc:
-                    print(f"    Content-desc: {content_desc}")
-                print()
-        except Exception as e:
-            print(f"[{idx}] Error: {e}")
-
-
-def print_elements_with_content_desc(driver: WebDriver) -> None:
-    """content-desc가 있는 요소만 출력"""
-
-    elements = driver.find_elements(AppiumBy.XPATH, "//*[@content-desc and @content-desc!='']")
-    print(f"\n=== Content-desc가 있는 요소 ({len(elements)}개) ===\n")
-
-    for elem in elements:
-        try:
-            desc = elem.get_attribute('content-desc')
-            if desc:
-                print(f"  - '{desc}'")
-        except StaleElementReferenceException:
-            continue
-
-
-def print_elements_with_text(driver: WebDriver, limit: int = 20) -> None:
-    """text가 있는 요소만 출력"""
-
-
-    elements = driver.find_elements(AppiumBy.XPATH, "//*[@text and @text!='']")
-    print(f"\n=== Text가 있는 요소 (처음 {limit}개) ===\n")
-
-    count = 0
-    for elem in elements:
-        if count >= limit:
-            break
-        try:
-            text = elem.get_attribute('text')
-            if text:
-                print(f"  - '{text}'")
-                count += 1
-        except StaleElementReferenceException:
-            continue
\ No newline at end of file
+
+    elements: List[UiNode] = list(gnb_container.iter_descendants())
+    print(f"\n📊 GNB 내부 요소 수: {len(elements)}\n")
+
+    for idx, node in enumerate(elements):
+        print(f"[{idx+1}] {node.cls}")
+        if node.resource_id:
+            print(f"    ├─ Resource-ID: {node.resource_id}")
+        if node.text:
+            print(f"    ├─ Text: {node.text}")
+        if node.content_desc:
+            print(f"    ├─ Content-desc: {node.content_desc}")
+        if node.get('clickable') == "true":
+            print(f"    └─ ✅ Clickable")
+        print()
+
@@ -0,0 +1,212 @@
+"""
+UI 계층 스냅샷 캐시
+실무용: 화면 변화(액션)가 없는 동안 반복되는 조회를 page_source 1회로 처리
+"""
+from typing import List, Dict, Any, Optional
+import hashlib
+import time
+import weakref
+import xml.etree.ElementTree as ET
+from appium.webdriver.webdriver import WebDriver
+from config.app_config import AppConfig
+from utils.logger import get_logger
+from utils.ui_hierarchy import parse_page_source
+from utils.ui_tree import UiNode, UiTree
+from utils.locator_engine import resolve_locator
+
+logger = get_logger(__name__)
+
+
+def hierarchy_fingerprint(root: ET.Element) -> str:
+    """계층 구조 해시 (page_source 원문 비교보다 작고 빠름)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for node in root.iter():
+        digest.update("\x1f".join((
+            node.get('class') or node.tag,
+            node.get('resource-id') or "",
+            node.get('content-desc') or "",
+            node.get('text') or "",
+            node.get('bounds') or "",
+        )).encode('utf-8'))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class HierarchySnapshot:
+    """page_source 1회 조회 결과 (파싱된 계층)"""
+
+    def __init__(self, source: str) -> None:
+        self.source: str = source
+        self.root: ET.Element = parse_page_source(source)
+        self.fetched_at: float = time.monotonic()
+        self._tree: Optional[UiTree] = None
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def age(self) -> float:
+        """스냅샷 생성 후 경과 시간(초)"""
+        return time.monotonic() - self.fetched_at
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        화면 구조 지문 (class, resource-id, content-desc, text, bounds)
+        두 스냅샷의 지문이 같으면 화면이 안정된 것으로 판단
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hierarchy_fingerprint(self.root)
+        return self._fingerprint
+
+    @property
+    def tree(self) -> UiTree:
+        """인덱스 트리 (최초 조회 시 1회 구성)"""
+        if self._tree is None:
+            self._tree = UiTree(self.root)
+        return self._tree
+
+    def find(self, locator) -> Optional[List[UiNode]]:
+        """
+        로케이터에 매칭되는 노드 목록
+
+        Returns:
+            매칭 노드 목록, 로컬에서 해석할 수 없는 로케이터면 None
+        """
+        return resolve_locator(self.tree, locator)
+
+    def is_visible(self, locator) -> Optional[bool]:
+        """로케이터 요소가 보이는지 (해석 불가 시 None)"""
+        nodes = self.find(locator)
+        if nodes is None:
+            return None
+        return any(node.is_visible for node in nodes)
+
+    def is_clickable(self, locator) -> Optional[bool]:
+        """로케이터 요소가 클릭 가능한지 (해석 불가 시 None)"""
+        nodes = self.find(locator)
+        if nodes is None:
+            return None
+        return any(node.is_clickable for node in nodes)
+
+
+class HierarchyCache:
+    """
+    드라이버별 계층 스냅샷 캐시
+
+    - TTL 동안 같은 스냅샷으로 조회 응답
+    - 클릭/입력/스와이프/키 입력 등 액션 시 invalidate()
+    """
+
+    def __init__(self, driver: WebDriver, ttl: float = AppConfig.HIERARCHY_CACHE_TTL) -> None:
+        self._driver_ref = weakref.ref(driver)
+        self.ttl: float = ttl
+        self._snapshot: Optional[HierarchySnapshot] = None
+        self.hits: int = 0          # snapshot() 이 캐시된 스냅샷으로 응답 (원격 호출 없음)
+        self.misses: int = 0        # snapshot() 이 만료되어 page_source 재조회
+        self.fetches: int = 0
+        self.fetch_time: Optional[float] = None  # 마지막 page_source 조회 소요 시간 (초)
+        # 로컬 판정 결과 (True면 서버 대기 생략, False면 서버 대기로 넘김)
+        self.local_true: int = 0
+        self.local_false: int = 0
+        self.invalidations: int = 0
+        # 화면 안정화 대기 통계 (고정 sleep 대비 절약 시간)
+        self.settle_waits: int = 0
+        self.settle_budget: float = 0.0
+        self.settle_spent: float = 0.0
+        self.settle_overruns: int = 0   # 조회가 길어 max_wait 를 넘긴 대기
+
+    def peek(self) -> Optional[HierarchySnapshot]:
+        """유효한 스냅샷이 있으면 반환 (원격 호출 없음)"""
+        if self._snapshot is not None and self._snapshot.age <= self.ttl:
+            return self._snapshot
+        return None
+
+    def snapshot(self) -> HierarchySnapshot:
+        """유효한 스냅샷 반환, 만료되었으면 page_source 재조회"""
+        snapshot = self.peek()
+        if snapshot is None:
+            self.misses += 1
+            snapshot = self.refresh()
+        else:
+            self.hits += 1
+        return snapshot
+
+    def refresh(self) -> HierarchySnapshot:
+        """page_source 강제 재조회"""
+        driver = self._driver_ref()
+        if driver is None:
+            raise RuntimeError("드라이버가 이미 해제되었습니다")
+        started = time.monotonic()
+        self._snapshot = HierarchySnapshot(driver.page_source)
+        self.fetch_time = time.monotonic() - started
+        self.fetches += 1
+        return self._snapshot
+
+    def invalidate(self, reason: str = "") -> None:
+        """화면 변화 가능성이 있을 때 스냅샷 폐기"""
+        if self._snapshot is not None:
+            self._snapshot = None
+            self.invalidations += 1
+            logger.debug(f"계층 캐시 무효화: {reason}")
+
+    def record(self, found: bool) -> None:
+        """로컬 판정 결과 기록 (캐시 hit/miss 는 snapshot() 에서 기록)"""
+        if found:
+            self.local_true += 1
+        else:
+            self.local_false += 1
+
+    def record_settle(self, budget: float, spent: float) -> None:
+        """화면 안정화 대기 기록 (budget: 대체한 고정 sleep 시간)"""
+        self.settle_waits += 1
+        self.settle_budget += budget
+        self.settle_spent += spent
+        if spent > budget:
+            self.settle_overruns += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fetches': self.fetches,
+            'local_true': self.local_true,
+            'local_false': self.local_false,
+            'invalidations': self.invalidations,
+            'settle_waits': self.settle_waits,
+            'settle_budget': self.settle_budget,
+            'settle_spent': self.settle_spent,
+            'settle_overruns': self.settle_overruns,
+        }
+
+
+def stats_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """두 stats() 사이 증가분 (세션 재사용 시 테스트별 통계)"""
+    return {key: value - before.get(key, 0) for key, value in after.items()}
+
+
+def log_cache_stats(stats: Dict[str, Any], scope: str = "테스트") -> None:
+    """계층 캐시 효과 + 화면 안정화 대기 절약 시간 기록"""
+    logger.info(
+        f"🗂️ 계층 캐시({scope}): hit {stats['hits']} / miss {stats['misses']} "
+        f"(page_source 조회 {stats['fetches']}회, 무효화 {stats['invalidations']}회, "
+        f"로컬 판정 True {stats['local_true']} / False {stats['local_false']})"
+    )
+    if stats['settle_waits']:
+        saved = stats['settle_budget'] - stats['settle_spent']
+        logger.info(
+            f"⏱️ 화면 안정화 대기({scope}) {stats['settle_waits']}회: "
+            f"{stats['settle_spent']:.1f}s 소요 (고정 대기 {stats['settle_budget']:.1f}s, 절약 {saved:.1f}s, "
+            f"고정 대기 초과 {stats['settle_overruns']}회)"
+        )
+
+
+_caches: "weakref.WeakKeyDictionary[WebDriver, HierarchyCache]" = weakref.WeakKeyDictionary()
+
+
+def get_hierarchy_cache(driver: WebDriver) -> HierarchyCache:
+    """드라이버별 계층 캐시 반환 (없으면 생성)"""
+    cache = _caches.get(driver)
+    if cache is None:
+        cache = HierarchyCache(driver)
+        _caches[driver] = cache
+    return cache
@@ -0,0 +1,224 @@
+"""
+대용량 UI 계층 덤프 스트리밍 분석
+실무용: 수 MB 짜리 WebView 실패 덤프 / 수천 개 보관 덤프에서 GNB·배너·ImageView 서브트리를
+       iterparse 1회 순회로 추출 (전체 트리를 메모리에 만들지 않음)
+       처리가 끝난 노드는 부모에서 떼어내 메모리 사용량을 (열린 경로 + 추출 중인 서브트리) 로 제한
+
+Usage:
+    for match in iter_subtrees("page_sources/failure.xml.gz"):
+        print(match.target, match.element.get('resource-id'))
+
+    find_gnb_subtree("window_dump.xml")                     # 우선순위가 가장 높은 GNB 컨테이너
+    python -m utils.hierarchy_stream page_sources/ -o reports/dump_scan.jsonl
+"""
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple, Union
+import argparse
+import gzip
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from utils.ui_hierarchy import IMAGE_VIEW_CLASS, parse_bounds
+
+# 노드 속성(class 포함) → 추출 대상 여부
+NodePredicate = Callable[[Dict[str, str]], bool]
+
+
+class StreamTarget(NamedTuple):
+    """추출할 서브트리 종류"""
+    name: str
+    predicate: NodePredicate
+    limit: Optional[int] = None  # 덤프 1개당 최대 추출 수 (None: 제한 없음)
+
+
+class StreamMatch(NamedTuple):
+    """추출된 서브트리"""
+    path: str               # 덤프 파일
+    target: str             # StreamTarget 이름
+    order: int              # 문서 순서 (UiTree 노드 순서와 동일)
+    depth: int
+    element: ET.Element     # 부모에서 떼어낸 서브트리 (하위 노드 포함)
+
+
+def resource_id_is(*resource_ids: str) -> NodePredicate:
+    return lambda attrib: attrib.get('resource-id') in resource_ids
+
+
+def resource_id_contains(part: str) -> NodePredicate:
+    return lambda attrib: part in (attrib.get('resource-id') or "")
+
+
+def class_is(cls: str) -> NodePredicate:
+    return lambda attrib: attrib.get('class') == cls
+
+
+# gnb_page_source_helper.GNB_SELECTORS 와 같은 우선순위 (덤프 1개당 우선순위별 1개만 보관)
+GNB_TARGETS: Tuple[StreamTarget, ...] = (
+    StreamTarget("gnb:ll_gnb", resource_id_is("com.wjthinkbig.woongjinbooks:id/ll_gnb"), limit=1),
+    StreamTarget("gnb:bottom_navigation", resource_id_is("com.wjthinkbig.woongjinbooks:id/bottom_navigation"), limit=1),
+    StreamTarget("gnb:gnb", resource_id_contains("gnb"), limit=1),
+    StreamTarget("gnb:bottom", resource_id_contains("bottom"), limit=1),
+    StreamTarget("gnb:navigation", resource_id_contains("navigation"), limit=1),
+)
+
+# popup_handler.BANNER_INDICATORS 의 컨테이너
+BANNER_TARGET = StreamTarget("banner", resource_id_is("groobeeWrap"))
+
+IMAGE_TARGET = StreamTarget("image", class_is(IMAGE_VIEW_CLASS))
+
+DEFAULT_TARGETS: Tuple[StreamTarget, ...] = GNB_TARGETS + (BANNER_TARGET, IMAGE_TARGET)
+
+TARGET_GROUPS: Dict[str, Tuple[StreamTarget, ...]] = {
+    'gnb': GNB_TARGETS,
+    'banner': (BANNER_TARGET,),
+    'image': (IMAGE_TARGET,),
+}
+
+DumpSource = Union[str, os.PathLike]
+
+
+def _open_dump(path: str):
+    return gzip.open(path, 'rb') if path.endswith(".gz") else open(path, 'rb')
+
+
+def iter_subtrees(path: DumpSource, targets: Sequence[StreamTarget] = DEFAULT_TARGETS) -> Iterator[StreamMatch]:
+    """
+    덤프 1개에서 대상 서브트리를 문서 순서(서브트리 끝 기준)로 추출
+
+    - 대상 판단은 start 이벤트의 속성만 사용 (class 속성이 없으면 태그명)
+    - 추출 중인 서브트리 밖의 노드는 end 이벤트에서 부모로부터 제거
+    - 중첩 대상(배너 안의 ImageView 등)은 각각 추출되며, 바깥 서브트리에도 그대로 포함
+
+    Raises:
+        ET.ParseError: 깨진 XML (잘린 덤프 등) - 그 전까지 찾은 서브트리는 이미 반환됨
+    """
+    path = os.fspath(path)
+    found: Dict[str, int] = {target.name: 0 for target in targets}
+    open_path: List[ET.Element] = []       # 루트부터 현재 노드까지
+    captures: Dict[int, Tuple[List[str], int, int]] = {}  # id(element) → (대상 이름, 순서, 깊이)
+    order = 0
+    with _open_dump(path) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                attrib = element.attrib if 'class' in element.attrib else dict(element.attrib, **{'class': element.tag})
+                names = []
+                for target in targets:
+                    if (target.limit is None or found[target.name] < target.limit) and target.predicate(attrib):
+                        found[target.name] += 1
+                        names.append(target.name)
+                if names:
+                    captures[id(element)] = (names, order, len(open_path))
+                open_path.append(element)
+                order += 1
+                continue
+
+            open_path.pop()
+            capture = captures.pop(id(element), None)
+            if capture is not None:
+                names, start_order, depth = capture
+                for name in names:
+                    yield StreamMatch(path, name, start_order, depth, element)
+            # 바깥에 추출 중인 서브트리가 없으면 부모에서 떼어냄 (이미 끝난 앞 형제는 제거됐으므로 첫 자식)
+            if open_path and not captures:
+                open_path[-1].remove(element)
+
+
+def find_dumps(root: DumpSource, patterns: Sequence[str] = (".xml", ".xml.gz")) -> Iterator[str]:
+    """디렉토리 하위의 덤프 파일 (경로 순, 하위 디렉토리 포함 - 목록을 미리 만들지 않음)"""
+    root = os.fspath(root)
+    if os.path.isfile(root):
+        yield root
+        return
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(tuple(patterns)):
+                yield os.path.join(directory, name)
+
+
+def scan_dumps(paths: Iterable[DumpSource], targets: Sequence[StreamTarget] = DEFAULT_TARGETS,
+               errors: Optional[List[Tuple[str, str]]] = None) -> Iterator[StreamMatch]:
+    """
+    여러 덤프를 차례로 스트리밍 (한 번에 덤프 1개만 열림)
+
+    Args:
+        paths: 덤프 파일 경로들 (find_dumps 결과 등 - 지연 평가 가능)
+        errors: 깨진 덤프의 (경로, 에러) 를 모을 목록 - None 이면 ET.ParseError 전파
+    """
+    for path in paths:
+        try:
+            yield from iter_subtrees(path, targets)
+        except (ET.ParseError, OSError, EOFError) as e:
+            if errors is None:
+                raise
+            errors.append((os.fspath(path), str(e)))
+
+
+def find_gnb_subtree(path: DumpSource) -> Optional[StreamMatch]:
+    """우선순위가 가장 높은 GNB 컨테이너 서브트리 (없으면 None)"""
+    best: Optional[StreamMatch] = None
+    priority = {target.name: index for index, target in enumerate(GNB_TARGETS)}
+    for match in iter_subtrees(path, GNB_TARGETS):
+        if best is None or priority[match.target] < priority[best.target]:
+            best = match
+    return best
+
+
+def match_summary(match: StreamMatch, include_xml: bool = False) -> Dict[str, object]:
+    """JSON lines 출력용 요약"""
+    element = match.element
+    summary: Dict[str, object] = {
+        'path': match.path,
+        'target': match.target,
+        'order': match.order,
+        'depth': match.depth,
+        'class': element.get('class') or element.tag,
+        'resource-id': element.get('resource-id') or "",
+        'bounds': parse_bounds(element.get('bounds')),
+        'descendants': sum(1 for _ in element.iter()) - 1,
+    }
+    if include_xml:
+        summary['xml'] = ET.tostring(element, encoding='unicode')
+    return summary
+
+
+def write_scan(matches: Iterable[StreamMatch], output: TextIO, include_xml: bool = False) -> Dict[str, int]:
+    """추출 결과를 JSON lines 로 출력 (대상별 건수 반환)"""
+    counts: Dict[str, int] = {}
+    for match in matches:
+        output.write(json.dumps(match_summary(match, include_xml), ensure_ascii=False) + "\n")
+        counts[match.target] = counts.get(match.target, 0) + 1
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="UI 계층 덤프에서 GNB/배너/ImageView 서브트리 스트리밍 추출")
+    parser.add_argument("paths", nargs="*", default=["./page_sources"], help="덤프 파일 또는 디렉토리 (기본: ./page_sources)")
+    parser.add_argument("--target", action="append", choices=sorted(TARGET_GROUPS),
+                        help="추출 대상 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--xml", action="store_true", help="서브트리 XML 포함")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    targets = DEFAULT_TARGETS
+    if args.target:
+        targets = tuple(target for group in args.target for target in TARGET_GROUPS[group])
+    dumps = (dump for path in args.paths for dump in find_dumps(path))
+    errors: List[Tuple[str, str]] = []
+    matches = scan_dumps(dumps, targets, errors)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            counts = write_scan(matches, output, args.xml)
+    else:
+        counts = write_scan(matches, sys.stdout, args.xml)
+
+    summary = ", ".join(f"{name} {count}건" for name, count in counts.items()) or "없음"
+    print(f"추출 결과: {summary}", file=sys.stderr)
+    for path, error in errors:
+        print(f"⚠️ 분석 실패 (건너뜀): {path} - {error}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+스크린샷 픽셀 분석
+실무용: 스크린샷 1장에서 모든 ImageView 영역을 잘라 통계를 한 번에(벡터화) 계산
+       크기는 정상인데 빈 화면/단색/플레이스홀더를 표시하는 이미지 감지
+
+영역 통계:
+    std           밝기 표준편차 (적분 영상으로 영역 수와 무관하게 O(1) 합계)
+    edge_energy   픽셀당 평균 밝기 변화량 (윤곽이 없으면 0에 가까움)
+    unique_ratio  격자 샘플의 고유 색상 비율 (플레이스홀더는 색이 몇 개 안 됨)
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import io
+import numpy as np
+from config.app_config import AppConfig
+from utils.ui_hierarchy import parse_bounds
+
+# 깨진 이미지 사유 코드
+BLANK_PIXELS = "BLANK_PIXELS"              # 단색/빈 영역
+PLACEHOLDER_PIXELS = "PLACEHOLDER_PIXELS"  # 색이 거의 없고 윤곽도 없는 기본 이미지
+
+# 분석할 최소 영역 크기 (px) - 이보다 작으면 통계가 의미 없음
+MIN_REGION_SIDE: int = 8
+
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def decode_screenshot(png: bytes) -> np.ndarray:
+    """PNG bytes → (높이, 너비, 3) uint8 RGB 배열"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def _integral(values: np.ndarray) -> np.ndarray:
+    """적분 영상 (앞쪽 0 패딩, 영역 합 = 꼭짓점 4개 조회)"""
+    height, width = values.shape
+    integral = np.zeros((height + 1, width + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(values, axis=0, dtype=np.float64), axis=1, out=integral[1:, 1:])
+    return integral
+
+
+def _box_sums(integral: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """모든 영역의 합을 한 번에 계산 (boxes: (N, 4) left, top, right, bottom)"""
+    left, top, right, bottom = boxes.T
+    return integral[bottom, right] - integral[top, right] - integral[bottom, left] + integral[top, left]
+
+
+def to_pixel_boxes(bounds_list: Sequence[Optional[str]], shape: Tuple[int, ...],
+                   screen_size: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    bounds 문자열 목록 → 스크린샷 좌표의 (N, 4) 영역 배열
+
+    Args:
+        bounds_list: "[l,t][r,b]" 목록
+        shape: 스크린샷 배열 shape
+        screen_size: 계층 기준 화면 크기 (width, height) - 스크린샷 해상도와 다르면 비율 보정
+
+    Returns:
+        (boxes, valid) - 화면 밖/너무 작은 영역, 절반 이상 잘린 영역은 valid=False
+    """
+    height, width = shape[:2]
+    boxes = np.array([parse_bounds(bounds) or (0, 0, 0, 0) for bounds in bounds_list],
+                     dtype=np.float64).reshape(-1, 4)
+    if screen_size and screen_size[0] > 0 and screen_size[1] > 0:
+        boxes *= np.array([width / screen_size[0], height / screen_size[1]] * 2)
+    boxes = np.rint(boxes).astype(np.intp)
+    full_area = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    np.clip(boxes[:, 0::2], 0, width, out=boxes[:, 0::2])
+    np.clip(boxes[:, 1::2], 0, height, out=boxes[:, 1::2])
+    box_width = boxes[:, 2] - boxes[:, 0]
+    box_height = boxes[:, 3] - boxes[:, 1]
+    # 스크롤 경계에 걸친 이미지는 보이는 부분이 여백일 수 있어 제외
+    valid = (box_width >= MIN_REGION_SIDE) & (box_height >= MIN_REGION_SIDE) & (box_width * box_height * 2 >= full_area)
+    return boxes, valid
+
+
+def region_statistics(image: np.ndarray, boxes: np.ndarray,
+                      grid: int = AppConfig.PIXEL_SAMPLE_GRID) -> Dict[str, np.ndarray]:
+    """
+    모든 영역의 픽셀 통계를 한 번에 계산 (영역별 반복 없음)
+
+    Args:
+        image: (높이, 너비, 3) uint8 배열
+        boxes: (N, 4) 영역 배열 (유효한 영역만)
+        grid: 고유 색상 샘플 격자 크기 (grid × grid)
+
+    Returns:
+        {'std', 'edge_energy', 'unique_ratio'} - 각각 (N,) 배열
+    """
+    height, width = image.shape[:2]
+    left, top, right, bottom = boxes.T
+    area = np.maximum((right - left) * (bottom - top), 1)
+
+    # 밝기 평균/분산
+    gray = image @ _LUMA
+    mean = _box_sums(_integral(gray), boxes) / area
+    variance = _box_sums(_integral(np.square(gray)), boxes) / area - np.square(mean)
+    std = np.sqrt(np.maximum(variance, 0))
+
+    # 가로/세로 밝기 변화량 (영역 경계 바깥과의 차이는 제외)
+    edges = np.zeros_like(gray)
+    edges[:, :-1] += np.abs(np.diff(gray, axis=1))
+    edges[:-1, :] += np.abs(np.diff(gray, axis=0))
+    inner = np.stack([left, top, np.maximum(right - 1, left), np.maximum(bottom - 1, top)], axis=1)
+    inner_area = np.maximum((inner[:, 2] - left) * (inner[:, 3] - top), 1)
+    edge_energy = _box_sums(_integral(edges), inner) / inner_area
+
+    # 격자 샘플 고유 색상 비율 (색상당 5bit 양자화 - 압축 노이즈 무시)
+    offsets = (np.arange(grid) + 0.5) / grid
+    xs = np.minimum((left[:, None] + offsets[None, :] * (right - left)[:, None]).astype(np.intp), width - 1)
+    ys = np.minimum((top[:, None] + offsets[None, :] * (bottom - top)[:, None]).astype(np.intp), height - 1)
+    samples = (image[ys[:, :, None], xs[:, None, :]] >> 3).astype(np.int32)
+    packed = ((samples[..., 0] << 10) | (samples[..., 1] << 5) | samples[..., 2]).reshape(len(boxes), -1)
+    packed.sort(axis=1)
+    unique = 1 + np.count_nonzero(np.diff(packed, axis=1), axis=1)
+    unique_ratio = unique / float(grid * grid)
+
+    return {'std': std, 'edge_energy': edge_energy, 'unique_ratio': unique_ratio}
+
+
+def classify_regions(stats: Dict[str, np.ndarray], boxes: np.ndarray,
+                     blank_std: float = AppConfig.PIXEL_BLANK_STD,
+                     blank_min_side: int = AppConfig.PIXEL_BLANK_MIN_SIDE,
+                     placeholder_color_ratio: float = AppConfig.PIXEL_PLACEHOLDER_COLOR_RATIO,
+                     placeholder_edge: float = AppConfig.PIXEL_PLACEHOLDER_EDGE,
+                     placeholder_min_side: int = AppConfig.PIXEL_PLACEHOLDER_MIN_SIDE) -> List[Optional[str]]:
+    """
+    영역 통계 → 사유 코드 (정상이면 None)
+
+    단색/플레이스홀더 판정은 일정 크기 이상 영역(상품/배너 이미지)에만 적용
+    - 단색 아이콘/구분선, 작은 아이콘은 원래 색이 적음
+    """
+    min_side = np.minimum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    solid = stats['std'] <= blank_std
+    blank = solid & (min_side >= blank_min_side)
+    placeholder = (~solid
+                   & (stats['unique_ratio'] <= placeholder_color_ratio)
+                   & (stats['edge_energy'] <= placeholder_edge)
+                   & (min_side >= placeholder_min_side))
+    codes = np.where(blank, BLANK_PIXELS, np.where(placeholder, PLACEHOLDER_PIXELS, ""))
+    return [code or None for code in codes.tolist()]
+
+
+def analyze_image_regions(png: bytes, bounds_list: Sequence[Optional[str]],
+                          screen_size: Optional[Tuple[int, int]] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    스크린샷 1장으로 모든 이미지 영역 분석
+
+    Args:
+        png: 스크린샷 PNG bytes
+        bounds_list: 이미지별 bounds 문자열 (find_image_views 결과 순서)
+        screen_size: 계층 기준 화면 크기 (width, height)
+
+    Returns:
+        이미지별 {'reason_code', 'std', 'edge_energy', 'unique_ratio'}
+        화면 밖/너무 작아 분석하지 못한 이미지는 None
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(bounds_list)
+    if not bounds_list:
+        return results
+
+    image = decode_screenshot(png)
+    boxes, valid = to_pixel_boxes(bounds_list, image.shape, screen_size)
+    if not valid.any():
+        return results
+
+    boxes = boxes[valid]
+    stats = region_statistics(image, boxes)
+    codes = classify_regions(stats, boxes)
+    for position, index in enumerate(np.flatnonzero(valid).tolist()):
+        results[index] = {
+            'reason_code': codes[position],
+            'std': round(float(stats['std'][position]), 2),
+            'edge_energy': round(float(stats['edge_energy'][position]), 2),
+            'unique_ratio': round(float(stats['unique_ratio'][position]), 3),
+        }
+    return results
@@ -0,0 +1,302 @@
+"""
+클라이언트 측 로케이터 엔진
+실무용: page_source 1회 파싱 후 XPath/ID/Accessibility ID 로케이터를 로컬에서 해석
+       (UiAutomator2 서버는 조회마다 전체 트리를 직렬화하므로 느림)
+
+지원 XPath 부분집합:
+    //class, /class, .//class, *, [n], [@attr], [@attr='v'], [@attr!='v'],
+    [contains(@attr,'v')], [starts-with(@attr,'v')], and / or / not()
+지원하지 않는 식은 UnsupportedXPathError → 호출 측에서 서버 조회로 위임
+text() 는 지원하지 않음: UiAutomator2 XML 은 텍스트 노드가 없어 서버에서는 항상 빈 값
+                       (@text 로 해석하면 서버와 결과가 달라짐)
+"""
+from typing import List, Dict, Callable, Optional, Tuple, Any
+from functools import lru_cache
+import re
+import time
+from appium.webdriver.common.appiumby import AppiumBy
+from utils.ui_tree import UiNode, UiTree
+
+NodePredicate = Callable[[UiNode], bool]
+
+
+class UnsupportedXPathError(ValueError):
+    """로컬 엔진이 해석할 수 없는 XPath"""
+    pass
+
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<string>'[^']*'|\"[^\"]*\")"
+    r"|(?P<op>//|/|\[|\]|\(|\)|@|!=|=|,)"
+    r"|(?P<number>\d+(?![\w.\-]))"
+    r"|(?P<name>\*|\.\.|\.|[A-Za-z_][\w.\-]*)"
+    r")"
+)
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = _TOKEN_PATTERN.match(expression, pos)
+        if match is None or match.end() == pos:
+            raise UnsupportedXPathError(f"토큰 해석 실패: {expression[pos:pos + 20]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = value[1:-1]
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _Step:
+    """경로 한 단계 (축 + 이름 + 조건)"""
+
+    __slots__ = ('descendant', 'name', 'predicates', 'index_hint')
+
+    def __init__(self, descendant: bool, name: str) -> None:
+        self.descendant: bool = descendant
+        self.name: str = name
+        # (predicate, position) - position이 있으면 위치 조건
+        self.predicates: List[Tuple[Optional[NodePredicate], Optional[int]]] = []
+        # 인덱스 조회 힌트 (attr, value) - 첫 조건이 @attr='v' 인 경우
+        self.index_hint: Optional[Tuple[str, str]] = None
+
+
+class _Parser:
+    """XPath 부분집합 재귀 하강 파서"""
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+
+    def _peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def _take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        token = self._peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise UnsupportedXPathError(f"'{value}' 필요: {self.expression}")
+        self.pos += 1
+        return token
+
+    def parse(self) -> List[_Step]:
+        if self._peek() == ('name', '.'):
+            self.pos += 1
+        steps = []
+        while self._peek()[1] in ('/', '//'):
+            descendant = self._take()[1] == '//'
+            kind, name = self._take()
+            if kind != 'name' or name in ('.', '..'):
+                raise UnsupportedXPathError(f"지원하지 않는 단계: {name!r}")
+            step = _Step(descendant, name)
+            while self._peek()[1] == '[':
+                self._parse_predicate(step)
+            steps.append(step)
+        if not steps or self.pos != len(self.tokens):
+            raise UnsupportedXPathError(f"지원하지 않는 XPath: {self.expression}")
+        return steps
+
+    def _parse_predicate(self, step: _Step) -> None:
+        self._take('[')
+        kind, value = self._peek()
+        if kind == 'number' and self._peek(1)[1] == ']':
+            self.pos += 1
+            step.predicates.append((None, int(value)))
+        else:
+            if not step.predicates and self._peek(0)[1] == '@' and self._peek(2)[1] == '=' \
+                    and self._peek(3)[0] == 'string' and self._peek(3)[1] and self._peek(4)[1] == ']':
+                step.index_hint = (self._peek(1)[1], self._peek(3)[1])
+            step.predicates.append((self._parse_or(), None))
+        self._take(']')
+
+    def _parse_or(self) -> NodePredicate:
+        left = self._parse_and()
+        while self._peek() == ('name', 'or'):
+            self.pos += 1
+            right = self._parse_and()
+            left = (lambda a, b: lambda node: a(node) or b(node))(left, right)
+        return left
+
+    def _parse_and(self) -> NodePredicate:
+        left = self._parse_unary()
+        while self._peek() == ('name', 'and'):
+            self.pos += 1
+            right = self._parse_unary()
+            left = (lambda a, b: lambda node: a(node) and b(node))(left, right)
+        return left
+
+    def _parse_unary(self) -> NodePredicate:
+        if self._peek() == ('name', 'not') and self._peek(1)[1] == '(':
+            self.pos += 2
+            inner = self._parse_or()
+            self._take(')')
+            return lambda node: not inner(node)
+        if self._peek()[1] == '(':
+            self.pos += 1
+            inner = self._parse_or()
+            self._take(')')
+            return inner
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> NodePredicate:
+        kind, name = self._peek()
+        if kind == 'name' and name in ('contains', 'starts-with') and self._peek(1)[1] == '(':
+            self.pos += 2
+            getter = self._parse_value()
+            self._take(',')
+            needle_kind, needle = self._take()
+            if needle_kind != 'string':
+                raise UnsupportedXPathError(f"{name}() 두번째 인자는 문자열만 지원")
+            self._take(')')
+            if name == 'contains':
+                return lambda node: (lambda v: v is not None and needle in v)(getter(node))
+            return lambda node: (lambda v: v is not None and v.startswith(needle))(getter(node))
+
+        getter = self._parse_value()
+        op = self._peek()[1]
+        if op not in ('=', '!='):
+            # [@attr] - 속성 존재 여부
+            return lambda node: getter(node) is not None
+        self.pos += 1
+        value_kind, expected = self._take()
+        if value_kind not in ('string', 'number'):
+            raise UnsupportedXPathError("비교 대상은 리터럴만 지원")
+        if op == '=':
+            return lambda node: getter(node) == expected
+        return lambda node: (lambda v: v is not None and v != expected)(getter(node))
+
+    def _parse_value(self) -> Callable[[UiNode], Optional[str]]:
+        kind, value = self._peek()
+        if value == '@':
+            self.pos += 1
+            _, attr = self._take()
+            return lambda node: node.get(attr)
+        if kind == 'name' and value == 'text' and self._peek(1)[1] == '(':
+            raise UnsupportedXPathError("text() 는 서버 XPath 와 의미가 다름 - @text 사용")
+        raise UnsupportedXPathError(f"지원하지 않는 값: {value!r}")
+
+
+class CompiledXPath:
+    """컴파일된 XPath (트리에 반복 적용 가능)"""
+
+    def __init__(self, expression: str) -> None:
+        self.expression: str = expression
+        self.steps: List[_Step] = _Parser(expression).parse()
+
+    def evaluate(self, tree: UiTree) -> List[UiNode]:
+        """트리에서 매칭 노드 목록 (문서 순서)"""
+        # 가상의 문서 노드에서 시작 (root = hierarchy)
+        context: Optional[List[UiNode]] = None
+        for step_index, step in enumerate(self.steps):
+            candidates = self._candidates(tree, step, context, first=step_index == 0)
+            context = self._apply_predicates(step, candidates)
+            if not context:
+                return []
+        return context
+
+    @staticmethod
+    def _candidates(tree: UiTree, step: _Step, context: Optional[List[UiNode]], first: bool) -> List[UiNode]:
+        if first and step.descendant:
+            # //name 은 인덱스로 바로 후보 선택
+            if step.index_hint is not None:
+                nodes = tree.lookup(*step.index_hint)
+                if nodes is not None:
+                    return [node for node in nodes if step.name == '*' or node.cls == step.name]
+            if step.name == '*':
+                return list(tree.nodes)
+            return list(tree.by_class(step.name))
+        if first:
+            parents = [tree.root] if step.name in ('*', tree.root.cls) else []
+            return parents
+
+        seen = set()
+        result = []
+        for parent in context:
+            nodes = parent.iter_descendants() if step.descendant else parent.children
+            for node in nodes:
+                if (step.name == '*' or node.cls == step.name) and node.order not in seen:
+                    seen.add(node.order)
+                    result.append(node)
+        result.sort(key=lambda n: n.order)
+        return result
+
+    @staticmethod
+    def _apply_predicates(step: _Step, nodes: List[UiNode]) -> List[UiNode]:
+        for predicate, position in step.predicates:
+            if position is None:
+                nodes = [node for node in nodes if predicate(node)]
+            else:
+                # 위치 조건은 같은 부모 기준 (XPath 의미 동일)
+                counters: Dict[int, int] = {}
+                selected = []
+                for node in nodes:
+                    key = id(node.parent)
+                    counters[key] = counters.get(key, 0) + 1
+                    if counters[key] == position:
+                        selected.append(node)
+                nodes = selected
+        return nodes
+
+
+@lru_cache(maxsize=512)
+def compile_xpath(expression: str) -> CompiledXPath:
+    """XPath 컴파일 (결과 캐시)"""
+    return CompiledXPath(expression)
+
+
+def resolve_locator(tree: UiTree, locator) -> Optional[List[UiNode]]:
+    """
+    BasePage 로케이터 튜플을 로컬 트리에서 해석
+
+    Returns:
+        매칭 노드 목록, 로컬에서 해석할 수 없으면 None (서버 조회 필요)
+    """
+    by, value = locator
+    if by == AppiumBy.ID:
+        return tree.by_resource_id(value)
+    if by == AppiumBy.ACCESSIBILITY_ID:
+        return tree.by_content_desc(value)
+    if by == AppiumBy.CLASS_NAME:
+        return tree.by_class(value)
+    if by == AppiumBy.XPATH:
+        try:
+            return compile_xpath(value).evaluate(tree)
+        except UnsupportedXPathError:
+            return None
+    return None
+
+
+def benchmark_locators(driver, locators: List[Any], rounds: int = 3) -> Dict[str, float]:
+    """
+    서버 측 조회 vs 로컬 엔진 조회 시간 비교 (마이크로 벤치마크)
+
+    Returns:
+        {'server': 평균 초, 'local': 평균 초, 'speedup': 배수}
+    """
+    server_total = 0.0
+    local_total = 0.0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for by, value in locators:
+            driver.find_elements(by, value)
+        server_total += time.perf_counter() - started
+
+        started = time.perf_counter()
+        tree = UiTree.from_source(driver.page_source)
+        for locator in locators:
+            resolve_locator(tree, locator)
+        local_total += time.perf_counter() - started
+
+    server = server_total / rounds
+    local = local_total / rounds
+    return {
+        'server': server,
+        'local': local,
+        'speedup': server / local if local > 0 else float('inf'),
+    }
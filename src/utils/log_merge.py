@@ -0,0 +1,130 @@
+"""
+워커별 로그 병합
+실무용: pytest-xdist 워커별 로그 파일(gzip 회전본 포함)을 시각 순으로 하나의 흐름으로 병합
+       파일 전체를 메모리에 올리지 않고 heapq.merge 로 워커마다 한 레코드씩만 보관하며 스트리밍
+
+Usage:
+    python -m utils.log_merge logs/                        # 표준 출력
+    python -m utils.log_merge logs/ -o logs/merged.log
+    python -m utils.log_merge logs/ --pattern "error_*.log"
+"""
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+import argparse
+import glob
+import gzip
+import heapq
+import os
+import re
+import sys
+
+# 로그 레코드 시작 줄 (시각 | 레벨 | ...) - 시각이 없는 줄은 이전 레코드에 이어짐 (traceback 등)
+RECORD_START = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:[.,]\d{3})?) \| ")
+# test_{날짜}_{시각}_{워커}_{pid}.log
+LOG_NAME = re.compile(r"^[a-z]+_\d{8}_\d{6}_(?P<worker>[^_]+)_(?P<pid>\d+)\.")
+# 회전본: test_....log.3.gz
+ROTATED_SUFFIX = re.compile(r"\.(\d+)(\.gz)?$")
+
+# (시각, 워커 라벨, 레코드 텍스트)
+LogRecord = Tuple[str, str, str]
+
+
+def log_segments(path: str) -> List[str]:
+    """로그 파일의 회전본 포함 전체 조각 (오래된 순: .N.gz → ... → .1.gz → 현재 파일)"""
+    rotated = []
+    for candidate in glob.glob(f"{glob.escape(path)}.*"):
+        match = ROTATED_SUFFIX.search(candidate[len(path):])
+        if match and candidate[len(path):] == match.group(0):
+            rotated.append((int(match.group(1)), candidate))
+    segments = [candidate for _, candidate in sorted(rotated, reverse=True)]
+    if os.path.exists(path):
+        segments.append(path)
+    return segments
+
+
+def _open_segment(path: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, encoding='utf-8', errors='replace')
+
+
+def iter_records(path: str, label: str) -> Iterator[LogRecord]:
+    """로그 파일(회전본 포함)의 레코드를 순서대로 (여러 줄 레코드는 하나로 묶음)"""
+    timestamp, lines = "", []
+    for segment in log_segments(path):
+        with _open_segment(segment) as f:
+            for line in f:
+                match = RECORD_START.match(line)
+                if match and lines:
+                    yield timestamp, label, "".join(lines)
+                    lines = []
+                if match:
+                    timestamp = match.group(1).replace(",", ".")
+                lines.append(line)
+    if lines:
+        yield timestamp, label, "".join(lines)
+
+
+def worker_label(path: str) -> str:
+    """파일명에서 워커 라벨 (gw0:12345), 형식이 다르면 파일명"""
+    name = os.path.basename(path)
+    match = LOG_NAME.match(name)
+    if match:
+        return f"{match.group('worker')}:{match.group('pid')}"
+    return name.split(".", 1)[0]
+
+
+def find_logs(directory: str, pattern: str = "test_*.log") -> List[str]:
+    """디렉토리의 워커별 로그 파일 (회전본만 남은 경우 포함, 기준 경로로 반환)"""
+    paths = set(glob.glob(os.path.join(directory, pattern)))
+    for rotated in glob.glob(os.path.join(directory, f"{pattern}.*")):
+        match = ROTATED_SUFFIX.search(rotated)
+        if match:
+            paths.add(rotated[:match.start()])
+    return sorted(paths)
+
+
+def merge_logs(paths: Sequence[str], labels: Optional[Dict[str, str]] = None) -> Iterator[LogRecord]:
+    """
+    여러 로그 파일을 시각 순으로 병합 (각 파일은 이미 시각 순이므로 k-way merge)
+
+    메모리 사용량은 파일 수에 비례 (파일 크기와 무관)
+    같은 시각이면 paths 순서 유지
+    """
+    labels = labels or {}
+    streams = [iter_records(path, labels.get(path) or worker_label(path)) for path in paths]
+    return heapq.merge(*streams, key=lambda record: record[0])
+
+
+def write_merged(paths: Sequence[str], output: TextIO) -> int:
+    """병합 결과를 [워커] 접두사와 함께 출력 (레코드 수 반환)"""
+    count = 0
+    for _, label, text in merge_logs(paths):
+        output.write(f"[{label}] {text}")
+        if not text.endswith("\n"):
+            output.write("\n")
+        count += 1
+    return count
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="워커별 로그를 시각 순으로 병합")
+    parser.add_argument("directory", nargs="?", default="./logs", help="로그 디렉토리 (기본: ./logs)")
+    parser.add_argument("--pattern", default="test_*.log", help="병합할 로그 파일 패턴 (기본: test_*.log)")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    paths = find_logs(args.directory, args.pattern)
+    if not paths:
+        print(f"병합할 로그 없음: {os.path.join(args.directory, args.pattern)}", file=sys.stderr)
+        return 1
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            count = write_merged(paths, output)
+        print(f"로그 {len(paths)}개 → {args.output} ({count}개 레코드)", file=sys.stderr)
+    else:
+        write_merged(paths, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
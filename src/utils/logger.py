@@ -1,19 +1,139 @@
 """
 중앙 로깅 시스템
 실무용: 파일 저장, 콘솔 출력, 레벨별 필터링
+       큐 모드(LOG_QUEUE=1): 테스트 스레드는 레코드를 큐에 넣기만 하고 포맷/파일 쓰기는 리스너 스레드에서
+       JSON lines 출력(LOG_JSON=1), 호출 위치별 샘플링(LOG_SAMPLING="DEBUG=20")
+       파일명에 xdist 워커 + pid 포함 (병렬 워커 충돌 방지), 크기 기준 회전 + 회전본 gzip 압축
+       워커별 로그 합치기: python -m utils.log_merge logs/
+
+로그 파일:
+    logs/test_{시각}_{워커}_{pid}.log      전체 로그 (회전본: .1.gz, .2.gz, ...)
+    logs/error_{시각}_{워커}_{pid}.log     에러만
+    logs/test_{시각}_{워커}_{pid}.jsonl    JSON lines (LOG_JSON=1)
+
+메시지는 %-style 인자로 전달 (출력되지 않는 레벨/샘플링 제외 레코드는 포맷하지 않음):
+    logger.debug("[%s/%s] ID: %s", idx, total, resource_id)
+큐 모드에서는 포맷이 나중에 일어나므로 로그 후 변경되는 객체(list/dict)는 인자로 넘기지 말 것
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
+import threading
 from datetime import datetime
 from config.app_config import AppConfig
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """JSON lines 포맷 (로그 분석 도구/집계용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'worker': os.getenv("PYTEST_XDIST_WORKER", "master"),
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    호출 위치별 샘플링 (대량 반복 로그용)
+    레벨별 비율 N: 같은 위치(파일, 줄)에서 처음 burst 건은 모두, 이후 N건 중 1건만 통과
+    여러 핸들러에 붙여도 레코드당 한 번만 판정
+    """
+
+    def __init__(self, rates: Dict[int, int], burst: int = AppConfig.LOG_SAMPLING_BURST) -> None:
+        super().__init__()
+        self.rates: Dict[int, int] = rates
+        self.burst: int = burst
+        self.suppressed: int = 0
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decision = getattr(record, '_sampled', None)
+        if decision is not None:
+            return decision
+        rate = self.rates.get(record.levelno, 1)
+        decision = True
+        if rate > 1:
+            key = (record.pathname, record.lineno)
+            with self._lock:
+                count = self._counts.get(key, 0) + 1
+                self._counts[key] = count
+                if count > self.burst and (count - self.burst) % rate:
+                    decision = False
+                    self.suppressed += 1
+        record._sampled = decision
+        return decision
+
+
+def parse_sampling_rates(spec: str) -> Dict[int, int]:
+    """"DEBUG=20,INFO=5" → {logging.DEBUG: 20, logging.INFO: 5}"""
+    rates: Dict[int, int] = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        level, rate = item.split("=", 1)
+        level_no = logging.getLevelName(level.strip().upper())
+        if isinstance(level_no, int) and rate.strip().isdigit():
+            rates[level_no] = int(rate.strip())
+    return rates
+
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """회전된 로그 파일을 gzip 압축 (원본 삭제)"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb', compresslevel=6) as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _rotating_file_handler(path: str) -> logging.handlers.RotatingFileHandler:
+    """크기 기준 회전 + 회전본 gzip 압축 핸들러 (LOG_MAX_BYTES=0 이면 회전 안 함)"""
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=AppConfig.LOG_MAX_BYTES, backupCount=AppConfig.LOG_BACKUP_COUNT, encoding='utf-8'
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def log_file_suffix() -> str:
+    """로그 파일명 접미사 (시각 + xdist 워커 + pid - 같은 초에 시작한 워커끼리 충돌 방지)"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    return f"{timestamp}_{worker}_{os.getpid()}"
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 포맷하지 않고 그대로 큐에 넣음 (기본 QueueHandler 는 호출 스레드에서 포맷)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class TestLogger:
     """테스트 로거 싱글톤"""
 
     _instance: Optional['TestLogger'] = None
     _logger: Optional[logging.Logger] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+    sampling_filter: Optional[SamplingFilter] = None
 
     def __new__(cls) -> 'TestLogger':
         if cls._instance is None:
@@ -39,29 +159,32 @@ class TestLogger:
             self._logger.handlers.clear()
 
         # 포맷 설정
+        # 밀리초 포함 (워커 로그 병합 시 순서 판정용)
         formatter = logging.Formatter(
-            fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+            fmt='%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
+        handlers: List[logging.Handler] = []
 
         # 파일 핸들러 - 전체 로그
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_handler = logging.FileHandler(
-            f"{log_dir}/test_{timestamp}.log",
-            encoding='utf-8'
-        )
+        suffix = log_file_suffix()
+        file_handler = _rotating_file_handler(f"{log_dir}/test_{suffix}.log")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        self._logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
         # 파일 핸들러 - 에러만
-        error_handler = logging.FileHandler(
-            f"{log_dir}/error_{timestamp}.log",
-            encoding='utf-8'
-        )
+        error_handler = _rotating_file_handler(f"{log_dir}/error_{suffix}.log")
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        self._logger.addHandler(error_handler)
+        handlers.append(error_handler)
+
+        # 파일 핸들러 - JSON lines (선택)
+        if AppConfig.LOG_JSON:
+            json_handler = _rotating_file_handler(f"{log_dir}/test_{suffix}.jsonl")
+            json_handler.setLevel(logging.DEBUG)
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
 
         # 콘솔 핸들러
         console_handler = logging.StreamHandler()
@@ -70,7 +193,29 @@ class TestLogger:
             '%(levelname)-8s | %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        self._logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+        # 호출 위치별 샘플링 (선택)
+        rates = parse_sampling_rates(AppConfig.LOG_SAMPLING)
+        self.sampling_filter = SamplingFilter(rates) if rates else None
+
+        if AppConfig.LOG_QUEUE:
+            # 테스트 스레드: 큐에 넣기만 / 리스너 스레드: 포맷 + 파일/콘솔 쓰기
+            queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+            queue_handler.setLevel(logging.DEBUG)
+            if self.sampling_filter:
+                queue_handler.addFilter(self.sampling_filter)
+            self._logger.addHandler(queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                queue_handler.queue, *handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.stop)
+        else:
+            for handler in handlers:
+                if self.sampling_filter:
+                    handler.addFilter(self.sampling_filter)
+                self._logger.addHandler(handler)
 
         self._logger.info("=" * 80)
         self._logger.info("테스트 로거 초기화 완료")
@@ -80,6 +225,15 @@ class TestLogger:
         """로거 인스턴스 반환"""
         return self._logger
 
+    def stop(self) -> None:
+        """큐 모드 리스너 종료 (남은 레코드를 모두 쓴 뒤 반환)"""
+        if self.sampling_filter and self.sampling_filter.suppressed:
+            self._logger.info("로그 샘플링: %s건 생략", self.sampling_filter.suppressed)
+            self.sampling_filter.suppressed = 0
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
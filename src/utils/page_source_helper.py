@@ -1,8 +1,32 @@
 """
 페이지 소스 관련 유틸리티
+실무용: page_source 1회 조회(또는 저장된 덤프 파일)로 만든 UiTree 에서 요소 정보 출력
+       (요소마다 get_attribute 원격 호출 X, 드라이버 없이 window_dump.xml 분석 가능)
+
+Usage:
+    print_all_elements(driver)
+    print_elements_with_text("window_dump.xml")
+    python -m utils.page_source_helper window_dump.xml      # 오프라인
 """
+from typing import Optional, Sequence, Union
+import argparse
+import sys
 from appium.webdriver.webdriver import WebDriver
 from config.app_config import AppConfig
+from utils.ui_tree import UiTree
+
+# 드라이버(현재 화면), 파싱된 트리, page_source 문자열 또는 저장된 파일 경로
+SourceLike = Union[WebDriver, UiTree, str]
+
+
+def load_ui_tree(source: SourceLike) -> UiTree:
+    """출력 대상 UI 트리 (드라이버면 계층 캐시 스냅샷 - page_source 최대 1회 조회)"""
+    if isinstance(source, UiTree):
+        return source
+    if isinstance(source, str):
+        return UiTree.load(source)
+    from utils.hierarchy_cache import get_hierarchy_cache
+    return get_hierarchy_cache(source).snapshot().tree
 
 
 def save_page_source(driver: WebDriver, filename: str = "page_source.xml") -> str:
@@ -19,66 +43,53 @@ def save_page_source(driver: WebDriver, filename: str = "page_source.xml") -> st
     return source
 
 
-def print_all_elements(driver: WebDriver) -> None:
-    """화면의 모든 요소 정보 출력"""
-    from appium.webdriver.common.appiumby import AppiumBy
+def print_all_elements(source: SourceLike, limit: int = 50) -> None:
+    """화면의 모든 요소 정보 출력 (처음 limit개 중 식별 정보가 있는 요소)"""
+    tree = load_ui_tree(source)
+    print(f"\n=== 전체 요소 수: {len(tree)} ===\n")
 
-    elements = driver.find_elements(AppiumBy.XPATH, "//*")
-    print(f"\n=== 전체 요소 수: {len(elements)} ===\n")
+    for idx, node in enumerate(tree.nodes[:limit]):
+        if node.resource_id or node.text or node.content_desc:
+            print(f"[{idx}] Tag: {node.cls}")
+            if node.resource_id:
+                print(f"    Resource-ID: {node.resource_id}")
+            if node.text:
+                print(f"    Text: {node.text}")
+            if node.content_desc:
+                print(f"    Content-desc: {node.content_desc}")
+            print()
 
-    for idx, elem in enumerate(elements[:50]):  # 처음 50개만 출력
-        try:
-            tag = elem.tag_name
-            resource_id = elem.get_attribute('resource-id') or ""
-            text = elem.get_attribute('text') or ""
-            content_desc = elem.get_attribute('content-desc') or ""
 
-            if resource_id or text or content_desc:
-                print(f"[{idx}] Tag: {tag}")
-                if resource_id:
-                    print(f"    Resource-ID: {resource_id}")
-                if text:
-                    print(f"    Text: {text}")
-                if content_desc:
-                    print(f"    Content-desc: {content_desc}")
-                print()
-        except Exception as e:
-            print(f"[{idx}] Error: {e}")
+def print_elements_with_content_desc(source: SourceLike) -> None:
+    """content-desc가 있는 요소만 출력"""
+    nodes = load_ui_tree(source).with_attribute('content-desc')
+    print(f"\n=== Content-desc가 있는 요소 ({len(nodes)}개) ===\n")
 
+    for node in nodes:
+        print(f"  - '{node.content_desc}'")
 
-def print_elements_with_content_desc(driver: WebDriver) -> None:
-    """content-desc가 있는 요소만 출력"""
-    from appium.webdriver.common.appiumby import AppiumBy
-    from selenium.common.exceptions import StaleElementReferenceException
 
-    elements = driver.find_elements(AppiumBy.XPATH, "//*[@content-desc and @content-desc!='']")
-    print(f"\n=== Content-desc가 있는 요소 ({len(elements)}개) ===\n")
+def print_elements_with_text(source: SourceLike, limit: int = 20) -> None:
+    """text가 있는 요소만 출력"""
+    nodes = load_ui_tree(source).with_attribute('text')
+    print(f"\n=== Text가 있는 요소 (처음 {limit}개) ===\n")
 
-    for elem in elements:
-        try:
-            desc = elem.get_attribute('content-desc')
-            if desc:
-                print(f"  - '{desc}'")
-        except StaleElementReferenceException:
-            continue
+    for node in nodes[:limit]:
+        print(f"  - '{node.text}'")
 
 
-def print_elements_with_text(driver: WebDriver, limit: int = 20) -> None:
-    """text가 있는 요소만 출력"""
-    from appium.webdriver.common.appiumby import AppiumBy
-    from selenium.common.exceptions import StaleElementReferenceException
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="저장된 page_source / window_dump.xml 요소 분석")
+    parser.add_argument("path", help="XML 파일 (.xml, .xml.gz)")
+    parser.add_argument("--limit", type=int, default=50, help="전체 요소 출력 개수 (기본: 50)")
+    args = parser.parse_args(argv)
+
+    tree = UiTree.from_file(args.path)
+    print_all_elements(tree, limit=args.limit)
+    print_elements_with_content_desc(tree)
+    print_elements_with_text(tree)
+    return 0
 
-    elements = driver.find_elements(AppiumBy.XPATH, "//*[@text and @text!='']")
-    print(f"\n=== Text가 있는 요소 (처음 {limit}개) ===\n")
 
-    count = 0
-    for elem in elements:
-        if count >= limit:
-            break
-        try:
-            text = elem.get_attribute('text')
-            if text:
-                print(f"  - '{text}'")
-                count += 1
-        except StaleElementReferenceException:
-            continue
+if __name__ == "__main__":
+    sys.exit(main())
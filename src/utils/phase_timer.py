@@ -0,0 +1,155 @@
+"""
+단계별 소요 시간 측정 (driver 픽스처 준비 시간 분석)
+실무용: 세션 생성 / 앱 초기화 / 팝업별 처리 / 홈 화면 대기 시간을 테스트마다 기록
+       → 세션 종료 시 단계별 p50/p95 요약 (준비 시간 회귀 감지, 최적화 우선순위 판단)
+
+기록 형식 (AppConfig.PHASE_TIMING_LOG, JSON lines):
+    {"test": "...", "worker": "gw0", "mode": "reset:clear", "total": 12.3,
+     "phases": {"app.clear": 1.2, "popup.권한 안내": 0.4, "popup.wait": 6.0, ...}, "timestamp": ...}
+
+Usage:
+    with PhaseTimer(test_name) as timer:
+        with timed_phase("session.create"):
+            ...
+    write_phase_record(timer.to_record(mode="new_session"))
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import math
+import os
+import threading
+import time
+from config.app_config import AppConfig
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 스레드별 활성 타이머 (팝업 감시 스레드 등 다른 스레드의 동작은 측정하지 않음)
+_local = threading.local()
+
+
+class PhaseTimer:
+    """with 블록 동안 현재 스레드의 단계 시간을 모으는 타이머"""
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.phases: Dict[str, float] = {}  # 같은 단계가 여러 번이면 합산
+        self.total: float = 0.0
+        self._started: float = 0.0
+        self._previous: Optional['PhaseTimer'] = None
+
+    def __enter__(self) -> 'PhaseTimer':
+        self._previous = getattr(_local, 'timer', None)
+        _local.timer = self
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.total = time.perf_counter() - self._started
+        _local.timer = self._previous
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_record(self, **extra: Any) -> Dict[str, Any]:
+        """JSON lines 기록 1건 (측정하지 않은 나머지 시간은 'other')"""
+        phases = {phase: round(seconds, 3) for phase, seconds in self.phases.items()}
+        other = self.total - sum(self.phases.values())
+        if other > 0.001:
+            phases['other'] = round(other, 3)
+        record = {
+            'test': self.name,
+            'worker': os.getenv("PYTEST_XDIST_WORKER", "master"),
+            'total': round(self.total, 3),
+            'phases': phases,
+            'timestamp': time.time(),
+        }
+        record.update(extra)
+        return record
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    """현재 스레드의 활성 타이머 (없으면 None)"""
+    return getattr(_local, 'timer', None)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """활성 타이머에 단계 시간 추가 (활성 타이머가 없으면 무시)"""
+    timer = current_timer()
+    if timer is not None:
+        timer.add(phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """블록 실행 시간을 활성 타이머의 단계로 기록"""
+    if current_timer() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - started)
+
+
+_records: List[Dict[str, Any]] = []
+_records_lock = threading.Lock()
+
+
+def write_phase_record(record: Dict[str, Any], path: str = AppConfig.PHASE_TIMING_LOG) -> None:
+    """테스트별 단계 시간 1건 기록 (JSON lines append + 세션 요약용 보관)"""
+    with _records_lock:
+        _records.append(record)
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"단계 시간 기록 실패 (무시): {e}")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위수 (q: 0~100)"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_phases(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    단계별 p50/p95 (단계가 없었던 테스트는 0초로 포함하지 않음)
+
+    Returns:
+        {단계: {'count', 'p50', 'p95', 'sum'}} - 'total' 은 테스트 전체 준비 시간
+    """
+    values: Dict[str, List[float]] = {'total': [record['total'] for record in records]}
+    for record in records:
+        for phase, seconds in record['phases'].items():
+            values.setdefault(phase, []).append(seconds)
+    return {
+        phase: {
+            'count': len(samples),
+            'p50': percentile(samples, 50),
+            'p95': percentile(samples, 95),
+            'sum': sum(samples),
+        }
+        for phase, samples in values.items() if samples
+    }
+
+
+def log_phase_timing_summary() -> None:
+    """세션 종료 시 단계별 준비 시간 요약 (합계가 큰 단계부터)"""
+    with _records_lock:
+        records = list(_records)
+    if not records:
+        return
+    summary = summarize_phases(records)
+    logger.info(f"⏱️ 테스트 준비 단계별 시간 ({len(records)}개 테스트, p50 / p95 / 합계):")
+    for phase, stats in sorted(summary.items(), key=lambda item: (item[0] != 'total', -item[1]['sum'])):
+        logger.info(
+            f"   {phase:<24} {stats['p50']:6.2f}s / {stats['p95']:6.2f}s / {stats['sum']:7.1f}s ({stats['count']}회)"
+        )
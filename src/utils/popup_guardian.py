@@ -0,0 +1,280 @@
+"""
+테스트 중 팝업 감시 (opt-in)
+실무용: 테스트 도중 나타나는 이벤트 배너/권한 팝업을 백그라운드 스레드가 명령 사이에 처리
+       (BasePage click 실패 → 재시도/재실행 방지)
+
+동작:
+    - driver.execute 를 드라이버 잠금(RLock)으로 감싸 테스트 명령과 감시 명령을 직렬화
+    - 감시 스레드는 잠금을 기다리지 않음 (테스트 명령 실행 중이면 이번 틱 건너뜀)
+      → 테스트 스레드 추가 지연은 경합 없는 잠금 획득 + 감시 조회와 겹친 경우의 대기뿐 (통계로 측정)
+    - 테스트 명령은 잠금을 최대 POPUP_GUARD_LOCK_TIMEOUT 초만 기다림
+      (감시 조회가 멈춰도 테스트가 멈추지 않도록 - 초과 시 경고 후 잠금 없이 실행)
+    - 실패 캡처처럼 unguarded() 안에서 실행한 명령은 잠금을 거치지 않음
+    - 테스트가 최근에 조회한 계층 스냅샷이 있으면 재사용 (원격 호출 없음)
+      단, 스냅샷 이후 다른 명령(클릭 등)이 실행됐으면 이미 바뀐 화면일 수 있으므로 재조회
+    - 틱 간격 + 점유율 상한으로 감시 비용 제한
+    - 위치 기반 대체 동작은 사용하지 않음 (테스트 화면을 임의 좌표로 탭하지 않도록)
+
+사용:
+    @pytest.mark.popup_guard  또는  POPUP_GUARD=1
+"""
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+from contextlib import contextmanager
+import threading
+import time
+import weakref
+from selenium.common.exceptions import WebDriverException
+from appium.webdriver.webdriver import WebDriver
+from config.app_config import AppConfig
+from utils.hierarchy_cache import HierarchySnapshot, get_hierarchy_cache
+from utils.logger import get_logger
+from utils.popup_handler import WOONGJIN_POPUP_RULES, PopupRule, apply_popup_rules
+
+logger = get_logger(__name__)
+
+PAGE_SOURCE_COMMAND = "getPageSource"  # selenium Command.GET_PAGE_SOURCE
+
+# 스레드별 잠금 우회 여부 (unguarded)
+_local = threading.local()
+
+
+@contextmanager
+def unguarded() -> Iterator[None]:
+    """
+    현재 스레드의 드라이버 명령이 감시 잠금을 거치지 않도록 함
+    실패 캡처용: 감시 조회가 멈춘 상태에서도 증거 수집은 제한 시간 안에 진행
+    """
+    previous = getattr(_local, 'bypass', False)
+    _local.bypass = True
+    try:
+        yield
+    finally:
+        _local.bypass = previous
+
+
+class PopupInterruption(NamedTuple):
+    """테스트 중 감시 스레드가 처리한 팝업"""
+    popup: str              # 팝업 규칙 이름
+    test: Optional[str]     # 처리 당시 테스트 (nodeid)
+    handled: bool           # 처리 성공 여부
+    at: float               # 처리 시각 (time.time())
+
+
+class PopupGuardian:
+    """
+    드라이버별 팝업 감시 스레드
+
+    Usage:
+        guardian = get_popup_guardian(driver)
+        guardian.start(test_name)
+        ...                                # 테스트 실행
+        interruptions = guardian.stop()    # 이번 테스트 중 처리한 팝업
+    """
+
+    def __init__(self, driver: WebDriver, rules: Optional[Sequence[PopupRule]] = None,
+                 interval: float = AppConfig.POPUP_GUARD_INTERVAL,
+                 max_duty: float = AppConfig.POPUP_GUARD_MAX_DUTY,
+                 lock_timeout: float = AppConfig.POPUP_GUARD_LOCK_TIMEOUT) -> None:
+        self._driver_ref = weakref.ref(driver)
+        self.rules: Sequence[PopupRule] = WOONGJIN_POPUP_RULES if rules is None else rules
+        self.interval: float = interval
+        self.max_duty: float = max_duty  # 감시 스레드가 잠금을 점유하는 시간 비율 상한
+        self.lock_timeout: float = lock_timeout  # 테스트 명령의 잠금 대기 상한
+        self.lock = threading.RLock()
+        self.test_name: Optional[str] = None
+        self.interruptions: List[PopupInterruption] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._guard_holding: bool = False
+        self._attempts: Dict[str, int] = {}
+        self._previous_snapshot: Optional[HierarchySnapshot] = None
+        self._last_command_at: float = 0.0  # 마지막 page_source 외 명령 완료 시각 (time.monotonic())
+        self._test_start: int = 0
+        # 오버헤드 통계
+        self.ticks: int = 0
+        self.busy_skips: int = 0        # 테스트 명령 실행 중이라 건너뛴 틱
+        self.fetches: int = 0           # 감시 스레드의 page_source 조회
+        self.snapshot_reuses: int = 0   # 테스트 스냅샷 재사용 (원격 호출 없음)
+        self.guard_time: float = 0.0    # 감시 스레드 잠금 점유 시간 합계
+        self.test_waits: int = 0        # 테스트 명령이 감시 스레드를 기다린 횟수
+        self.test_wait_time: float = 0.0
+        self.test_wait_max: float = 0.0
+        self.lock_timeouts: int = 0     # 잠금 대기 상한 초과 (잠금 없이 실행)
+        self._install(driver)
+
+    def _install(self, driver: WebDriver) -> None:
+        """driver.execute 를 드라이버 잠금으로 감쌈 (모든 WebDriver 명령이 거치는 지점)"""
+        execute = driver.execute
+
+        def run(driver_command: str, params: Optional[Dict[str, Any]]) -> Any:
+            try:
+                return execute(driver_command, params)
+            finally:
+                if driver_command != PAGE_SOURCE_COMMAND:
+                    self._last_command_at = time.monotonic()
+
+        def guarded_execute(driver_command: str, params: Optional[Dict[str, Any]] = None) -> Any:
+            if getattr(_local, 'bypass', False):
+                return run(driver_command, params)
+            if not self.lock.acquire(blocking=False):
+                waited_for_guard = self._guard_holding
+                started = time.perf_counter()
+                acquired = self.lock.acquire(timeout=self.lock_timeout)
+                if waited_for_guard:
+                    self._record_test_wait(time.perf_counter() - started)
+                if not acquired:
+                    self.lock_timeouts += 1
+                    logger.warning(
+                        f"⚠️ 팝업 감시 잠금 대기 {self.lock_timeout:g}s 초과 - 잠금 없이 실행: {driver_command}"
+                    )
+                    return run(driver_command, params)
+            try:
+                return run(driver_command, params)
+            finally:
+                self.lock.release()
+
+        driver.execute = guarded_execute
+
+    def _record_test_wait(self, waited: float) -> None:
+        self.test_waits += 1
+        self.test_wait_time += waited
+        self.test_wait_max = max(self.test_wait_max, waited)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, test_name: Optional[str] = None) -> None:
+        """감시 시작 (이미 실행 중이면 테스트 이름만 변경 - 종료되지 않은 이전 스레드도 이어서 감시)"""
+        self.test_name = test_name
+        self._test_start = len(self.interruptions)
+        self._stop.clear()
+        if self.running:
+            return
+        self._attempts.clear()
+        self._previous_snapshot = None
+        self._thread = threading.Thread(target=self._run, name="popup-guardian", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[PopupInterruption]:
+        """
+        감시 중지
+
+        Returns:
+            start() 이후 처리한 팝업 목록
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=AppConfig.DEFAULT_TIMEOUT)
+            if self._thread.is_alive():
+                # 조회가 멈춘 스레드를 남겨둠 - 다음 start() 가 감시 스레드를 하나 더 만들지 않도록
+                logger.warning(f"⚠️ 팝업 감시 스레드가 {AppConfig.DEFAULT_TIMEOUT}s 안에 종료되지 않음 (조회 응답 대기 중)")
+            else:
+                self._thread = None
+        return self.interruptions[self._test_start:]
+
+    def _run(self) -> None:
+        delay = self.interval
+        while not self._stop.wait(delay):
+            delay = self.interval
+            driver = self._driver_ref()
+            if driver is None:
+                return
+            self.ticks += 1
+            if not self.lock.acquire(blocking=False):
+                self.busy_skips += 1  # 테스트 명령 실행 중 - 기다리지 않고 다음 틱
+                continue
+            started = time.perf_counter()
+            self._guard_holding = True
+            try:
+                self._check(driver)
+            except WebDriverException as e:
+                logger.debug(f"팝업 감시 조회 실패 (무시): {e}")
+            except Exception as e:
+                logger.warning(f"팝업 감시 중 에러 (무시): {e}")
+            finally:
+                self._guard_holding = False
+                self.lock.release()
+            spent = time.perf_counter() - started
+            self.guard_time += spent
+            # 이번 틱 점유 시간에 비례해 쉬어서 평균 점유율을 max_duty 이하로 유지
+            delay = max(self.interval, spent / self.max_duty - spent)
+
+    def _check(self, driver: WebDriver) -> None:
+        """
+        스냅샷 1개로 팝업 규칙 확인
+        테스트가 최근 조회한 스냅샷은 그 뒤로 다른 명령이 없었을 때만 재사용
+        (클릭 직후 테스트 스레드가 캐시를 무효화하기 전의 이전 화면에 규칙을 적용하지 않도록)
+        """
+        cache = get_hierarchy_cache(driver)
+        snapshot = cache.peek()
+        if snapshot is None or snapshot.fetched_at <= self._last_command_at:
+            snapshot = cache.refresh()
+            self.fetches += 1
+        else:
+            self.snapshot_reuses += 1
+
+        attempts_before = dict(self._attempts)
+        shown, success = apply_popup_rules(driver, snapshot, self.rules, self._attempts,
+                                           self._previous_snapshot, use_fallback=False)
+        self._previous_snapshot = snapshot
+        if shown is None:
+            self._attempts.clear()  # 팝업이 사라졌으면 다음 팝업은 처음부터 시도
+            return
+        if self._attempts.get(shown) != attempts_before.get(shown):
+            self.interruptions.append(PopupInterruption(shown, self.test_name, success, time.time()))
+            logger.warning(f"🛡️ 테스트 중 팝업 {'처리' if success else '처리 실패'}: {shown} ({self.test_name})")
+
+    def stats(self) -> Dict[str, Any]:
+        """감시 비용 통계"""
+        return {
+            'ticks': self.ticks,
+            'busy_skips': self.busy_skips,
+            'fetches': self.fetches,
+            'snapshot_reuses': self.snapshot_reuses,
+            'guard_time': self.guard_time,
+            'test_waits': self.test_waits,
+            'test_wait_time': self.test_wait_time,
+            'test_wait_max': self.test_wait_max,
+            'lock_timeouts': self.lock_timeouts,
+            'interruptions': len(self.interruptions),
+        }
+
+
+_guardians: "weakref.WeakKeyDictionary[WebDriver, PopupGuardian]" = weakref.WeakKeyDictionary()
+_all_guardians: List[PopupGuardian] = []  # 세션 요약용 (드라이버 종료 후에도 통계 유지)
+
+
+def get_popup_guardian(driver: WebDriver) -> PopupGuardian:
+    """드라이버별 팝업 감시 스레드 (없으면 생성 + driver.execute 잠금 설치)"""
+    guardian = _guardians.get(driver)
+    if guardian is None:
+        guardian = PopupGuardian(driver)
+        _guardians[driver] = guardian
+        _all_guardians.append(guardian)
+    return guardian
+
+
+def log_popup_guardian_summary() -> None:
+    """세션 종료 시 팝업 감시 비용 + 처리 현황"""
+    if not _all_guardians:
+        return
+    totals: Dict[str, float] = {}
+    for guardian in _all_guardians:
+        for key, value in guardian.stats().items():
+            totals[key] = max(totals.get(key, 0), value) if key == 'test_wait_max' else totals.get(key, 0) + value
+    logger.info(
+        f"🛡️ 팝업 감시: {totals['ticks']:.0f}틱 (page_source 조회 {totals['fetches']:.0f}회, "
+        f"스냅샷 재사용 {totals['snapshot_reuses']:.0f}회, 테스트 명령 중 건너뜀 {totals['busy_skips']:.0f}회), "
+        f"잠금 점유 {totals['guard_time']:.1f}s"
+    )
+    logger.info(
+        f"🛡️ 테스트 명령 대기: {totals['test_waits']:.0f}회, 합계 {totals['test_wait_time']:.2f}s, "
+        f"최대 {totals['test_wait_max'] * 1000:.0f}ms, 대기 상한 초과 {totals['lock_timeouts']:.0f}회"
+    )
+    counts: Dict[str, int] = {}
+    for guardian in _all_guardians:
+        for interruption in guardian.interruptions:
+            counts[interruption.popup] = counts.get(interruption.popup, 0) + 1
+    if counts:
+        logger.info(f"🛡️ 테스트 중 처리한 팝업: {', '.join(f'{name} {n}건' for name, n in counts.items())}")
@@ -1,127 +1,224 @@
 """
 팝업 처리 유틸리티
+실무용: 팝업별 시그니처 로케이터 + 처리 동작을 규칙 테이블로 선언하고,
+       폴링 루프 1개가 틱마다 계층 1회 조회 → 매칭 규칙 실행 → 홈 화면이 안정되면 종료
+       안정 판정은 기준 요소(홈 로고, 배너 시그니처)의 위치로만 - 롤링 배너/애니메이션은 무시
 """
-from typing import Union
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from selenium.common.exceptions import WebDriverException
 from appium.webdriver.webdriver import WebDriver
 from appium.webdriver.common.appiumby import AppiumBy
 from config.app_config import AppConfig
+from pages.woongjin_app_home_page import WoongjinAppHomePage
+from utils.banner_position_cache import get_banner_position_cache
+from utils.element_waits import DEFAULT_POLL_INTERVAL, Locator, find_first_of, wait_until_settled
+from utils.hierarchy_cache import HierarchySnapshot, get_hierarchy_cache
+from utils.phase_timer import timed_phase
 import time
 
+PopupAction = Callable[[WebDriver, Locator], bool]
 
-def handle_woongjin_popups(driver: WebDriver, wait_time: Union[int, float] = 3, use_position_based: bool = True) -> None:
-    """
-    웅진마켓 앱 초기 팝업 처리
 
-    Args:
-        driver: WebDriver 인스턴스
-        wait_time: 팝업 대기 시간 (초)
-        use_position_based: 위치 기반 배너 닫기 사용 여부 (기본 True, 자주 바뀌는 배너에 권장)
+class PopupRule(NamedTuple):
     """
-    
-    # 앱 초기 로딩 대기
-    print("⏱️ 앱 초기 로딩 대기 중... (2초)")
-    time.sleep(2)
-
-    # 권한 요청 팝업 처리
-    _handle_permission_guide(driver)
-
-    # 권한 허용 팝업 처리
-    _handle_permission_allow(driver)
-
-    # WebView 배너가 실제로 나타날 때까지 대기 (명시적 대기)
-    print("\n⏱️ WebView 배너 로딩 대기 중... (최대 10초)")
-    banner_loaded = _wait_for_banner_load(driver, timeout=10)
-
-    if not banner_loaded:
-        print("⚠️ 배너가 나타나지 않음 - 스킵")
-        return
-
-    # 이벤트 배너/팝업 닫기 (조합 전략)
-    print("\n🎯 배너 닫기 시도 시작")
-
-    # 전략 1: 요소 찾기 (content-desc='닫기') - 가장 안정적
-    print("\n📍 전략 1: content-desc='닫기'로 요소 찾기")
-    success = _close_banner_by_element(driver)
-
-    if success:
-        print("✅ 요소 찾기 성공!")
-        return
-
-    # 전략 2: 위치 기반 클릭 (요소 찾기 실패 시)
-    if use_position_based:
-        print("\n📍 전략 2: 위치 기반 클릭으로 재시도")
-        for attempt in range(3):
-            print(f"\n🎯 위치 기반 {attempt+1}차 시도")
-            success = _close_banner_by_position(driver, wait_time=0.3)
-            if success:
-                print("✅ 위치 기반 클릭 성공!")
-                return
-            time.sleep(0.5)
-
-    print("\n⚠️ 모든 배너 닫기 시도 실패")
+    팝업 규칙 (시그니처 요소가 보이면 동작 실행)
+
+    Attributes:
+        name: 팝업 이름 (로그용)
+        signatures: 팝업 판별 로케이터 (하나라도 보이면 매칭)
+        action: 처리 동작 (driver, 매칭된 로케이터) → 성공 여부
+        fallback: action 이 한 번 실패한 뒤 사용할 동작 (위치 기반 닫기 등)
+        settle: True면 시그니처 요소가 연속 두 틱 같은 위치일 때만 실행 (나타나는 중인 배너)
+        max_attempts: 최대 처리 시도 횟수 (계속 실패하면 포기)
+    """
+    name: str
+    signatures: Tuple[Locator, ...]
+    action: PopupAction
+    fallback: Optional[PopupAction] = None
+    settle: bool = False
+    max_attempts: int = 3
+
+
+def _click_signature(driver: WebDriver, locator: Locator) -> bool:
+    """매칭된 시그니처 요소 클릭 (권한 팝업 버튼 등)"""
+    driver.find_element(*locator).click()
+    return True
+
+
+def _close_banner(driver: WebDriver, locator: Locator) -> bool:
+    """닫기 버튼 패턴으로 배너 닫기 (현재 틱 스냅샷에서 즉시 확인)"""
+    return _close_banner_by_element(driver, timeout=0)
+
+
+def _tap_banner_close_position(driver: WebDriver, locator: Locator) -> bool:
+    """위치 기반 배너 닫기 (닫기 버튼 요소를 찾지 못한 경우)"""
+    return _close_banner_by_position(driver, wait_time=0)
+
+
+# 이벤트 배너 표시 요소 (하나라도 보이면 배너가 떠 있음)
+BANNER_INDICATORS: Tuple[Locator, ...] = (
+    (AppiumBy.ID, "groobeeWrap"),           # 배너 컨테이너
+    (AppiumBy.ID, "grb-close-x"),           # 닫기 버튼
+    (AppiumBy.XPATH, "//*[contains(@resource-id, 'innerWrap')]"),  # 내부 래퍼
+)
+
+# 웅진마켓 초기 팝업 규칙 (우선순위 순 - 한 틱에 하나만 처리 후 새 계층으로 재확인)
+WOONGJIN_POPUP_RULES: List[PopupRule] = [
+    PopupRule(
+        name="권한 안내",
+        signatures=((AppiumBy.ID, "com.wjthinkbig.woongjinbooks:id/btnPermGuideOk"),),
+        action=_click_signature,
+    ),
+    PopupRule(
+        name="권한 허용",
+        signatures=((AppiumBy.ID, "com.android.permissioncontroller:id/permission_allow_button"),),
+        action=_click_signature,
+    ),
+    PopupRule(
+        name="이벤트 배너",
+        signatures=BANNER_INDICATORS,
+        action=_close_banner,
+        fallback=_tap_banner_close_position,
+        settle=True,
+        max_attempts=2,  # 요소 찾기 1회 + 위치 기반 1회 (학습 좌표 → 후보 좌표 순으로 닫힘 확인)
+    ),
+]
+
+
+def _visible_signature(driver: WebDriver, snapshot: HierarchySnapshot,
+                       signatures: Sequence[Locator]) -> Optional[Locator]:
+    """스냅샷에서 보이는 첫 시그니처 (로컬 해석 불가 로케이터는 서버에 즉시 조회)"""
+    for locator in signatures:
+        visible = snapshot.is_visible(locator)
+        if visible is None:
+            visible = bool(driver.find_elements(*locator))
+        if visible:
+            return locator
+    return None
+
+
+def _locator_bounds(snapshot: Optional[HierarchySnapshot], locator: Locator) -> Optional[Tuple[Any, ...]]:
+    """
+    로케이터에 매칭되는 보이는 노드들의 bounds (위치 안정 판정용)
+    스냅샷이 없으면 None, 로컬 해석 불가 로케이터는 빈 튜플 (위치 비교 생략)
+    """
+    if snapshot is None:
+        return None
+    nodes = snapshot.find(locator)
+    if nodes is None:
+        return ()
+    return tuple(node.bounds for node in nodes if node.is_visible)
 
 
-def _wait_for_banner_load(driver: WebDriver, timeout: int = 15) -> bool:
+def apply_popup_rules(driver: WebDriver, snapshot: HierarchySnapshot, rules: Sequence[PopupRule],
+                      attempts: Dict[str, int], previous_snapshot: Optional[HierarchySnapshot] = None,
+                      use_fallback: bool = True) -> Tuple[Optional[str], bool]:
     """
-    배너가 실제로 로드될 때까지 명시적으로 대기
+    스냅샷에 매칭되는 첫 규칙 실행 (폴링 1틱 처리, 한 틱에 팝업 하나만 처리)
 
     Args:
         driver: WebDriver 인스턴스
-        timeout: 최대 대기 시간 (초)
+        snapshot: 이번 틱의 계층 스냅샷
+        rules: 팝업 규칙 (우선순위 순)
+        attempts: 규칙별 시도 횟수 (호출 측에서 유지, 이 함수가 갱신)
+        previous_snapshot: 직전 틱 계층 스냅샷 (settle 규칙 판정용)
+        use_fallback: 규칙의 대체 동작 사용 여부
 
     Returns:
-        배너 로드 성공 여부 (bool)
+        (보이는 팝업 이름, 처리 성공 여부) - 보이는 팝업이 없으면 (None, False)
     """
-    # 배너 관련 요소들 (하나라도 나타나면 배너 로드됨)
-    banner_indicators = [
-        (AppiumBy.ID, "groobeeWrap"),           # 배너 컨테이너
-        (AppiumBy.ID, "grb-close-x"),           # 닫기 버튼
-        (AppiumBy.XPATH, "//*[contains(@resource-id, 'innerWrap')]"),  # 내부 래퍼
-    ]
-
-    for indicator_by, indicator_locator in banner_indicators:
-        try:
-            print(f"  🔍 배너 요소 확인 중: {indicator_locator[:50]}...")
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((indicator_by, indicator_locator))
-            )
-            print(f"  ✅ 배너 로드 완료! (감지: {indicator_locator[:50]})")
-            time.sleep(1)  # 배너 애니메이션 안정화 대기
-            return True
-        except TimeoutException:
+    for rule in rules:
+        locator = _visible_signature(driver, snapshot, rule.signatures)
+        if locator is None:
             continue
+        count = attempts.get(rule.name, 0)
+        if count >= rule.max_attempts:
+            continue  # 포기한 팝업 - 홈 화면 판정을 막지 않음
+        if rule.settle and _locator_bounds(previous_snapshot, locator) != _locator_bounds(snapshot, locator):
+            return rule.name, False  # 나타나는 중 (위치 변화) - 다음 틱에 같은 위치면 처리
+
+        fallback = count > 0 and rule.fallback is not None and use_fallback
+        action = rule.fallback if fallback else rule.action
+        attempts[rule.name] = count + 1
+        try:
+            with timed_phase(f"popup.{rule.name}"):
+                success = action(driver, locator)
+        except WebDriverException as e:
+            print(f"✗ {rule.name} 팝업 처리 실패: {str(e)[:50]}")
+            success = False
+        get_hierarchy_cache(driver).invalidate(rule.name)
+        if success:
+            print(f"✅ {rule.name} 팝업 처리 완료{' (대체 동작)' if fallback else ''}")
+        elif attempts[rule.name] >= rule.max_attempts:
+            print(f"⚠️ {rule.name} 팝업 처리 {rule.max_attempts}회 실패 - 포기")
+        return rule.name, success
+    return None, False
+
+
+def handle_woongjin_popups(driver: WebDriver, wait_time: Union[int, float] = 3, use_position_based: bool = True,
+                           rules: Optional[Sequence[PopupRule]] = None,
+                           timeout: float = AppConfig.POPUP_MAX_WAIT,
+                           poll_interval: float = DEFAULT_POLL_INTERVAL) -> Dict[str, int]:
+    """
+    웅진마켓 앱 초기 팝업 처리 (규칙 기반 단일 폴링 루프)
 
-    print(f"  ⚠️ {timeout}초 동안 배너가 나타나지 않음")
-    return False
+    틱마다 page_source 1회 조회 → 매칭되는 규칙 실행 → 홈 화면 로고가 wait_time 동안
+    같은 위치에 보이면 종료 (롤링 배너 등 나머지 화면 변화는 무시).
+    실제로 나타난 팝업만큼만 시간이 걸림 (단계별 타임아웃 합 X)
 
+    Args:
+        driver: WebDriver 인스턴스
+        wait_time: 홈 화면 안정 판정 시간 (초) - 늦게 뜨는 배너를 기다리는 시간
+        use_position_based: 위치 기반 배너 닫기 사용 여부 (기본 True, 자주 바뀌는 배너에 권장)
+        rules: 팝업 규칙 (기본: WOONGJIN_POPUP_RULES)
+        timeout: 전체 최대 대기 시간 (초)
+        poll_interval: 폴링 간격 (초)
 
-def _handle_permission_guide(driver: WebDriver, timeout: int = 5) -> None:
-    """권한 안내 팝업 처리"""
-    try:
-        WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(
-                (AppiumBy.ID, "com.wjthinkbig.woongjinbooks:id/btnPermGuideOk")
-            )
-        ).click()
-        print("✅ 권한 안내 팝업 처리 완료")
-    except (TimeoutException, NoSuchElementException):
-        print("ℹ️ 권한 안내 팝업 없음")
-
-
-def _handle_permission_allow(driver: WebDriver, timeout: int = 5) -> None:
-    """권한 허용 팝업 처리"""
-    try:
-        WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(
-                (AppiumBy.ID, "com.android.permissioncontroller:id/permission_allow_button")
-            )
-        ).click()
-        print("✅ 권한 허용 팝업 처리 완료")
-    except (TimeoutException, NoSuchElementException):
-        print("ℹ️ 권한 허용 팝업 없음")
+    Returns:
+        {팝업 이름: 처리 횟수}
+    """
+    rules = WOONGJIN_POPUP_RULES if rules is None else rules
+    cache = get_hierarchy_cache(driver)
+    started = time.monotonic()
+    deadline = started + timeout
+    attempts: Dict[str, int] = {}
+    handled: Dict[str, int] = {}
+    previous_snapshot: Optional[HierarchySnapshot] = None
+    previous_marker: Optional[Tuple[Any, ...]] = None
+    home_stable_since: Optional[float] = None
+    ticks = 0
+
+    print(f"⏱️ 초기 팝업 처리 중... (최대 {timeout:.0f}초, 규칙 {len(rules)}개)")
+    while True:
+        ticks += 1
+        with timed_phase("popup.hierarchy"):
+            snapshot = cache.refresh()
+
+        shown, success = apply_popup_rules(driver, snapshot, rules, attempts,
+                                           previous_snapshot, use_fallback=use_position_based)
+        popup_shown = shown is not None
+        if success:
+            handled[shown] = handled.get(shown, 0) + 1
+
+        now = time.monotonic()
+        marker = _locator_bounds(snapshot, WoongjinAppHomePage.HOME_LOGO)
+        marker_visible = bool(marker) or (marker == () and bool(
+            _visible_signature(driver, snapshot, (WoongjinAppHomePage.HOME_LOGO,))))
+        if popup_shown or not marker_visible:
+            home_stable_since = None
+        elif home_stable_since is None or marker != previous_marker:
+            home_stable_since = now
+        elif now - home_stable_since >= wait_time:
+            handled_names = ", ".join(f"{name} {n}회" for name, n in handled.items()) or "없음"
+            print(f"✅ 홈 화면 진입: {now - started:.1f}s ({ticks}회 폴링, 처리한 팝업: {handled_names})")
+            return handled
+        previous_snapshot, previous_marker = snapshot, marker
+
+        if now >= deadline:
+            print(f"⚠️ {timeout:.0f}초 동안 홈 화면이 안정되지 않음 - 팝업 처리 종료 ({ticks}회 폴링)")
+            return handled
+        with timed_phase("popup.wait"):
+            time.sleep(min(poll_interval, deadline - now))
 
 
 def _close_banner_by_element(driver: WebDriver, timeout: int = 2) -> bool:
@@ -164,98 +261,114 @@ def _close_banner_by_element(driver: WebDriver, timeout: int = 2) -> bool:
         (AppiumBy.XPATH, "//*[@text='X']"),
     ]
 
-    for idx, (by, locator) in enumerate(close_button_patterns):
-        try:
-            print(f"  [{idx+1}/{len(close_button_patterns)}] 시도: {locator[:60]}...")
-
-            # timeout 짧게 설정 (빠른 실패)
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((by, locator))
-            )
+    # 폴링마다 모든 패턴을 한 번에 확인 → 최악의 경우에도 타임아웃 1회
+    start = 0
+    while start < len(close_button_patterns):
+        candidates = close_button_patterns[start:]
+        print(f"  [{start+1}~{len(close_button_patterns)}] 패턴 {len(candidates)}개 동시 확인...")
+        match = find_first_of(driver, candidates, timeout=timeout if start == 0 else 0)
+        if match is None:
+            break
 
+        pattern_no = start + match.index + 1
+        try:
             # 요소 찾았으면 클릭 시도
-            element.click()
-            print(f"  ✅ 닫기 버튼 클릭 성공! (패턴: {idx+1})")
-            time.sleep(0.5)  # 클릭 후 안정화
+            match.element.click()
+            get_hierarchy_cache(driver).invalidate("banner close")
+            print(f"  ✅ 닫기 버튼 클릭 성공! (패턴: {pattern_no})")
+            wait_until_settled(driver, max_wait=0.5)  # 클릭 후 안정화
             return True
-
-        except (TimeoutException, NoSuchElementException):
-            print(f"  ✗ 패턴 {idx+1} 실패")
-            continue
         except Exception as e:
-            print(f"  ✗ 클릭 실패: {str(e)[:50]}")
-            continue
+            print(f"  ✗ 패턴 {pattern_no} 클릭 실패: {str(e)[:50]}")
+            start = pattern_no
 
     print("  ⚠️ 모든 요소 찾기 패턴 실패")
     return False
 
 
+def _candidate_positions(width: int, height: int) -> List[Tuple[int, int]]:
+    """
+    배너 닫기 버튼 후보 좌표 (우선순위 순)
+    웅진마켓 배너 닫기 버튼 주변만 시도 - 화면 모서리/상단 중앙은 배너가 이미 닫혔거나
+    표시 요소만 계층에 남은 경우 실제 앱 UI(검색창, 뒤로가기 등)를 누르게 되므로 제외
+    """
+    # 웅진마켓 실제 위치: (88.5%, 31%) 기준
+    return [
+        (int(width * 0.885), int(height * 0.31)),  # 실제 위치
+        (int(width * 0.88), int(height * 0.30)),   # 약간 왼쪽 위
+        (int(width * 0.89), int(height * 0.32)),   # 약간 오른쪽 아래
+    ]
+
+
+def _tap_and_verify(driver: WebDriver, x: int, y: int) -> bool:
+    """좌표 탭 후 화면이 안정되면 배너 표시 요소가 사라졌는지 확인"""
+    try:
+        driver.tap([(x, y)])
+    except WebDriverException as e:
+        print(f"  ✗ 탭 실패: {str(e)[:50]}")
+        return False
+    cache = get_hierarchy_cache(driver)
+    cache.invalidate("banner position tap")
+    wait_until_settled(driver, max_wait=1.0)
+    return _visible_signature(driver, cache.snapshot(), BANNER_INDICATORS) is None
+
+
 def _close_banner_by_position(driver: WebDriver, wait_time: float = 1.0) -> bool:
     """
     화면 특정 위치 클릭으로 배너 닫기 (자주 바뀌는 배너에 최적화)
     배너 닫기 버튼이 보통 우측/좌측 상단에 위치한다는 것을 활용
 
+    배너가 실제로 사라진 좌표를 디바이스/앱 버전별로 캐시에 기록해 두고
+    다음 세션부터 화면 크기 조회 없이 그 좌표를 먼저 탭 (닫히지 않으면 캐시 무효화 후 재학습)
+
     Args:
         driver: WebDriver 인스턴스
         wait_time: 배너 로딩 대기 시간 (초)
 
     Returns:
-        성공 여부 (bool)
+        성공 여부 (배너 표시 요소가 사라졌는지로 판단)
     """
     print("=== 위치 기반 배너 닫기 시도 ===")
 
     # 배너가 완전히 로드될 때까지 대기
-    time.sleep(wait_time)
+    if wait_time:
+        time.sleep(wait_time)
+
+    position_cache = get_banner_position_cache()
+    key = position_cache.device_key(driver)
+    learned = position_cache.get(key)
+    if learned is not None:
+        x, y = learned['position']
+        print(f"  📌 학습된 위치 클릭: ({x}, {y})")
+        if _tap_and_verify(driver, x, y):
+            position_cache.record_hit(key, learned)
+            print(f"  ✅ 위치 ({x}, {y}) 클릭으로 배너 닫힘!")
+            return True
+        position_cache.invalidate(key, f"({x}, {y}) 탭 후에도 배너 표시")
 
-    try:
-        # 화면 크기 동적으로 가져오기
-        screen_size = driver.get_window_size()
-        width = screen_size['width']
-        height = screen_size['height']
-
-        print(f"📱 화면 크기: {width}x{height}")
-
-        # 닫기 버튼이 위치할 가능성이 높은 좌표들 (우선순위 순)
-        # 웅진마켓 실제 위치: (88.5%, 31%) 기준
-        close_button_positions = [
-            # 1순위: 웅진마켓 배너 실제 위치 (분석 결과 기반)
-            (int(width * 0.885), int(height * 0.31)),  # 실제 위치
-            (int(width * 0.88), int(height * 0.30)),   # 약간 왼쪽 위
-            (int(width * 0.89), int(height * 0.32)),   # 약간 오른쪽 아래
-
-            # 2순위: 일반적인 우측 상단
-            (int(width * 0.95), int(height * 0.05)),
-            (int(width * 0.93), int(height * 0.08)),
-            (int(width * 0.90), int(height * 0.10)),
-
-            # 3순위: 좌측 상단
-            (int(width * 0.05), int(height * 0.05)),
-            (int(width * 0.07), int(height * 0.08)),
-
-            # 4순위: 중앙 상단
-            (int(width * 0.50), int(height * 0.05)),
-
-            # 5순위: 우측 중앙
-            (int(width * 0.95), int(height * 0.50)),
-        ]
-
-        for idx, (x, y) in enumerate(close_button_positions):
-            try:
-                print(f"  [{idx+1}/{len(close_button_positions)}] 위치 클릭 시도: ({x}, {y})")
-                driver.tap([(x, y)])
-                time.sleep(0.3)
-                print(f"  ✅ 위치 ({x}, {y}) 클릭 성공!")
-                return True
-            except Exception as e:
-                print(f"  ✗ 실패: {str(e)[:50]}")
-                continue
-
-        print("  ⚠️ 모든 위치 클릭 실패")
-        return False
+    if learned is not None:
+        width, height = learned['window']  # 같은 디바이스/해상도 - 크기 재조회 불필요
+    else:
+        try:
+            screen_size = driver.get_window_size()
+        except WebDriverException as e:
+            print(f"  ❌ 화면 크기 확인 실패: {e}")
+            return False
+        width, height = screen_size['width'], screen_size['height']
+    print(f"📱 화면 크기: {width}x{height}")
+
+    positions = _candidate_positions(width, height)
+    for idx, (x, y) in enumerate(positions):
+        if learned is not None and [x, y] == list(learned['position']):
+            continue  # 방금 실패한 좌표
+        print(f"  [{idx+1}/{len(positions)}] 위치 클릭 시도: ({x}, {y})")
+        if _tap_and_verify(driver, x, y):
+            position_cache.record_success(key, (width, height), (x, y))
+            print(f"  ✅ 위치 ({x}, {y}) 클릭으로 배너 닫힘!")
+            return True
 
-    except Exception as e:
-        print(f"  ❌ 화면 크기 확인 실패: {e}")
-        return False
+    print("  ⚠️ 모든 위치 클릭 실패")
+    return False
 
 
 # def _close_banner_if_exists(driver: WebDriver) -> bool:
@@ -0,0 +1,161 @@
+"""
+비동기 스크린샷 저장
+실무용: 테스트 스레드는 캡처(PNG bytes)만 하고, 파일 저장/인코딩은 백그라운드 스레드에서 처리
+"""
+from typing import Any, Callable, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import io
+import os
+import threading
+from config.app_config import AppConfig
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScreenshotWriter:
+    """
+    제한된 스레드 풀 기반 스크린샷 저장기
+
+    - max_pending 개를 넘으면 submit()이 대기 (느린 디스크에서도 메모리 무한 증가 방지)
+    - scale/image_format 지정 시 저장 전에 축소/재인코딩 (Pillow 사용)
+    """
+
+    def __init__(self, max_workers: int = AppConfig.SCREENSHOT_WRITER_WORKERS,
+                 max_pending: int = AppConfig.SCREENSHOT_MAX_PENDING) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self.written: int = 0
+        self.failed: int = 0
+
+    def submit(self, png: bytes, path: str, scale: float = AppConfig.SCREENSHOT_SCALE,
+               image_format: str = AppConfig.SCREENSHOT_FORMAT) -> str:
+        """
+        PNG bytes 저장 예약
+
+        Returns:
+            저장될 파일 경로 (재인코딩 시 확장자 변경)
+        """
+        if image_format != "png":
+            path = f"{os.path.splitext(path)[0]}.{image_extension(image_format)}"
+
+        self.submit_task(write_image, png, path, scale, image_format)
+        return path
+
+    def submit_task(self, func: Callable[..., Any], *args: Any) -> Future:
+        """저장 작업 예약 (저장 대기 중인 작업이 max_pending 개면 여기서 대기)"""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+        error = future.exception()
+        if error is None:
+            self.written += 1
+        else:
+            self.failed += 1
+            logger.error(f"스크린샷 저장 실패: {error}")
+
+    @property
+    def pending(self) -> int:
+        """저장 대기 중인 스크린샷 수"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        대기 중인 저장 작업 완료까지 대기
+
+        Returns:
+            timeout 내에 끝나지 않은 작업 수
+        """
+        with self._lock:
+            pending = set(self._pending)
+        if not pending:
+            return 0
+        _, not_done = wait(pending, timeout=timeout)
+        return len(not_done)
+
+    def shutdown(self, timeout: Optional[float] = None) -> int:
+        """남은 작업을 저장하고 스레드 풀 종료"""
+        remaining = self.flush(timeout)
+        self._executor.shutdown(wait=remaining == 0)
+        return remaining
+
+
+def image_extension(image_format: str = AppConfig.SCREENSHOT_FORMAT) -> str:
+    """저장 형식별 파일 확장자"""
+    return "jpg" if image_format == "jpeg" else image_format
+
+
+def write_image(png: bytes, path: str, scale: float = AppConfig.SCREENSHOT_SCALE,
+                image_format: str = AppConfig.SCREENSHOT_FORMAT) -> None:
+    """PNG bytes를 (필요 시 축소/재인코딩 후) 파일로 저장"""
+    data = png
+    if scale != 1.0 or image_format != "png":
+        data = _reencode(png, scale, image_format)
+    write_file(data, path)
+
+
+def write_file(data: bytes, path: str) -> None:
+    """bytes 를 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # 임시 파일에 쓴 뒤 교체 (저장 도중 읽어도 깨진 파일을 보지 않도록)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _reencode(png: bytes, scale: float, image_format: str) -> bytes:
+    """PNG 축소/재인코딩 (백그라운드 스레드에서 실행)"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        if scale != 1.0:
+            size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+            image = image.resize(size, Image.BILINEAR)
+        if image_format == "jpeg" and image.mode != "RGB":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, format=image_format.upper(), quality=AppConfig.SCREENSHOT_QUALITY, optimize=False)
+        return output.getvalue()
+
+
+_writer: Optional[ScreenshotWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer() -> ScreenshotWriter:
+    """세션 공용 스크린샷 저장기"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ScreenshotWriter()
+        return _writer
+
+
+def flush_screenshot_writer(timeout: Optional[float] = None) -> int:
+    """세션 종료 시 남은 스크린샷 저장 (생성된 적 없으면 즉시 반환)"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
+        return 0
+    remaining = writer.shutdown(timeout)
+    logger.info(f"🖼️ 스크린샷 저장 완료: {writer.written}개 (실패 {writer.failed}개, 미완료 {remaining}개)")
+    return remaining
@@ -0,0 +1,157 @@
+"""
+UI 계층(page_source) 파싱 유틸리티
+실무용: page_source 1회 조회 후 로컬에서 요소 정보 분석 (원격 호출 최소화)
+"""
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+import re
+import xml.etree.ElementTree as ET
+
+# (left, top, right, bottom)
+Bounds = Tuple[int, int, int, int]
+
+IMAGE_VIEW_CLASS = "android.widget.ImageView"
+
+_BOUNDS_PATTERN = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+def parse_page_source(source: str) -> ET.Element:
+    """page_source XML 문자열을 파싱하여 루트 노드 반환"""
+    return ET.fromstring(source)
+
+
+def parse_bounds(bounds: Optional[str]) -> Optional[Bounds]:
+    """
+    bounds 문자열 파싱
+
+    Example:
+        "[0,84][1440,252]" → (0, 84, 1440, 252)
+    """
+    if not bounds:
+        return None
+    match = _BOUNDS_PATTERN.match(bounds)
+    if match is None:
+        return None
+    return tuple(int(value) for value in match.groups())
+
+
+def bounds_size(bounds: Optional[Bounds]) -> Dict[str, int]:
+    """bounds → element.size 와 같은 형태의 dict"""
+    if bounds is None:
+        return {'width': 0, 'height': 0}
+    left, top, right, bottom = bounds
+    return {'width': max(right - left, 0), 'height': max(bottom - top, 0)}
+
+
+def node_class(node: ET.Element) -> str:
+    """
+    노드의 클래스명 반환
+    UiAutomator2 page_source는 태그가 클래스명, uiautomator dump(window_dump.xml)는 class 속성 사용
+    """
+    return node.get('class') or node.tag
+
+
+def iter_nodes(root: ET.Element) -> Iterator[ET.Element]:
+    """루트(hierarchy)를 제외한 모든 노드 순회 (문서 순서)"""
+    for node in root.iter():
+        if node is root:
+            continue
+        yield node
+
+
+# 기준 텍스트를 찾을 때 올라가는 최대 부모 단계 (이미지 → 카드 → 목록)
+ANCHOR_MAX_LEVELS = 3
+
+# 스크롤 간 이미지 식별 기준 텍스트 (텍스트, 기준 노드 bounds)
+Anchor = Tuple[str, str]
+
+
+def _context_text(container: Optional[ET.Element]) -> str:
+    """컨테이너 하위의 첫 텍스트 (상품명 등)"""
+    if container is None:
+        return ""
+    for node in container.iter():
+        text = node.get('text') or node.get('content-desc')
+        if text:
+            return text
+    return ""
+
+
+def _nearest_anchor(node: ET.Element, parents: Dict[ET.Element, ET.Element]) -> Optional[Tuple[str, str, int, int]]:
+    """
+    이미지에서 가장 가까운 형제 텍스트 (없으면 부모 단계로 올라가며 탐색)
+
+    Returns:
+        (텍스트, 기준 노드 bounds, 단계, 기준 대비 위치), 없으면 None
+        위치는 형제 순서 차이 (음수: 기준보다 앞) - 평평한 WebView 목록에서도 이미지마다 다름
+    """
+    current = node
+    for level in range(ANCHOR_MAX_LEVELS):
+        parent = parents.get(current)
+        if parent is None:
+            return None
+        siblings = list(parent)
+        position = siblings.index(current)
+        for distance in range(1, len(siblings)):
+            for index in (position + distance, position - distance):  # 같은 거리면 뒤(캡션) 우선
+                if 0 <= index < len(siblings):
+                    text = _context_text(siblings[index])
+                    if text:
+                        return text, siblings[index].get('bounds') or "", level, position - index
+        current = parent
+    return None
+
+
+def image_identity(resource_id: str, content_desc: str, anchor_text: str = "", level: int = 0,
+                   offset: int = 0) -> Optional[Tuple[Any, ...]]:
+    """
+    스크롤 간 같은 이미지를 식별하는 키
+    (resource-id, content-desc, 가장 가까운 형제 텍스트, 단계, 기준 대비 위치)
+    자체 content-desc 도 기준 텍스트도 없으면 None (식별 불가 - 중복 제거하지 않음)
+    """
+    if not (content_desc or anchor_text):
+        return None
+    return (resource_id, content_desc, anchor_text, level, offset)
+
+
+def is_duplicate_candidate(image: Dict[str, Any], stationary_anchors: Iterable[Anchor]) -> bool:
+    """
+    스크롤 간 중복 판정 대상 여부
+
+    기준 텍스트가 이전 화면과 같은 위치에 있으면 (고정 헤더 등) 스크롤해도 움직이지 않은 것
+    → 기준 대비 위치가 같아도 다른 이미지일 수 있으므로 중복 판정하지 않음
+    """
+    if image.get('identity') is None:
+        return False
+    return image.get('anchor') not in set(stationary_anchors)
+
+
+def find_image_views(root: ET.Element) -> List[Dict[str, Any]]:
+    """
+    파싱된 계층에서 모든 ImageView 정보 추출
+
+    Returns:
+        [{'index', 'resource_id', 'content_desc', 'bounds', 'size', 'displayed', 'identity', 'anchor'}, ...]
+        index는 find_elements("//android.widget.ImageView") 결과 순서와 동일
+    """
+    images = []
+    # ET는 부모 참조가 없음 - 기준 텍스트 탐색용 부모 맵
+    parents = {child: parent for parent in root.iter() for child in parent}
+    for node in iter_nodes(root):
+        if node_class(node) != IMAGE_VIEW_CLASS:
+            continue
+        bounds = node.get('bounds')
+        resource_id = node.get('resource-id') or "Unknown"
+        content_desc = node.get('content-desc') or ""
+        anchor = _nearest_anchor(node, parents)
+        anchor_text, anchor_bounds, level, offset = anchor or ("", "", 0, 0)
+        images.append({
+            'index': len(images),
+            'resource_id': resource_id,
+            'content_desc': content_desc,
+            'bounds': bounds,
+            'size': bounds_size(parse_bounds(bounds)),
+            'displayed': node.get('displayed', 'true') == 'true',
+            'identity': image_identity(resource_id, content_desc, anchor_text, level, offset),
+            'anchor': (anchor_text, anchor_bounds) if anchor else None,
+        })
+    return images
@@ -0,0 +1,184 @@
+"""
+인덱스 기반 UI 트리
+실무용: page_source 1회 파싱 후 resource-id/content-desc/text/class 로 즉시 조회
+       저장된 덤프(window_dump.xml, 실패 시 저장한 .xml.gz)도 드라이버 없이 분석
+"""
+from typing import List, Dict, Iterator, Optional
+import gzip
+import xml.etree.ElementTree as ET
+from utils.ui_hierarchy import Bounds, parse_bounds, parse_page_source
+
+
+class UiNode:
+    """UI 트리 노드 (메모리 절약을 위해 __slots__ 사용)"""
+
+    __slots__ = ('cls', 'attrib', 'bounds', 'parent', 'children', 'order')
+
+    def __init__(self, cls: str, attrib: Dict[str, str], parent: Optional['UiNode'], order: int) -> None:
+        self.cls: str = cls
+        self.attrib: Dict[str, str] = attrib
+        self.bounds: Optional[Bounds] = parse_bounds(attrib.get('bounds'))
+        self.parent: Optional['UiNode'] = parent
+        self.children: List['UiNode'] = []
+        self.order: int = order  # 문서 순서
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """속성 값 (class는 태그/속성 형식 모두 지원)"""
+        if name == 'class':
+            return self.cls
+        return self.attrib.get(name, default)
+
+    @property
+    def resource_id(self) -> str:
+        return self.attrib.get('resource-id') or ""
+
+    @property
+    def content_desc(self) -> str:
+        return self.attrib.get('content-desc') or ""
+
+    @property
+    def text(self) -> str:
+        return self.attrib.get('text') or ""
+
+    @property
+    def is_visible(self) -> bool:
+        """displayed 속성 + 영역 크기로 판단"""
+        if self.attrib.get('displayed', 'true') != 'true' or self.bounds is None:
+            return False
+        left, top, right, bottom = self.bounds
+        return right > left and bottom > top
+
+    @property
+    def is_clickable(self) -> bool:
+        """EC.element_to_be_clickable 과 동일 기준 (보임 + enabled)"""
+        return self.is_visible and self.attrib.get('enabled', 'true') == 'true'
+
+    def iter_descendants(self) -> Iterator['UiNode']:
+        """하위 노드 전체 (문서 순서)"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def __repr__(self) -> str:
+        return f"UiNode({self.cls}, id={self.resource_id!r}, desc={self.content_desc!r}, text={self.text!r})"
+
+
+class UiTree:
+    """
+    파싱된 UI 트리 + 해시 인덱스
+
+    Usage:
+        tree = UiTree.from_source(driver.page_source)
+        tree = UiTree.from_file("window_dump.xml")    # 오프라인
+        tree.by_content_desc("검색")
+    """
+
+    def __init__(self, root: ET.Element) -> None:
+        self.nodes: List[UiNode] = []
+        self._by_resource_id: Dict[str, List[UiNode]] = {}
+        self._by_short_id: Dict[str, List[UiNode]] = {}
+        self._by_content_desc: Dict[str, List[UiNode]] = {}
+        self._by_text: Dict[str, List[UiNode]] = {}
+        self._by_class: Dict[str, List[UiNode]] = {}
+        self.root: UiNode = self._build(root)
+
+    @classmethod
+    def from_source(cls, source: str) -> 'UiTree':
+        """page_source 문자열로 트리 생성"""
+        return cls(parse_page_source(source))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'UiTree':
+        """저장된 page_source / uiautomator 덤프 파일로 트리 생성 (.gz 지원)"""
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, 'rb') as f:
+            return cls(ET.parse(f).getroot())
+
+    @classmethod
+    def load(cls, source: str) -> 'UiTree':
+        """XML 문자열 또는 파일 경로로 트리 생성"""
+        if source.lstrip().startswith("<"):
+            return cls.from_source(source)
+        return cls.from_file(source)
+
+    def _build(self, element: ET.Element) -> UiNode:
+        """ET 트리를 UiNode 트리로 변환하며 인덱스 구성 (재귀 없이)"""
+        root = self._add(element, None)
+        stack = [(root, list(reversed(element)))]
+        while stack:
+            parent, pending = stack[-1]
+            if not pending:
+                stack.pop()
+                continue
+            child_element = pending.pop()
+            child = self._add(child_element, parent)
+            parent.children.append(child)
+            stack.append((child, list(reversed(child_element))))
+        return root
+
+    def _add(self, element: ET.Element, parent: Optional[UiNode]) -> UiNode:
+        node = UiNode(element.get('class') or element.tag, element.attrib, parent, len(self.nodes))
+        self.nodes.append(node)
+        self._by_class.setdefault(node.cls, []).append(node)
+        resource_id = node.resource_id
+        if resource_id:
+            self._by_resource_id.setdefault(resource_id, []).append(node)
+            if ":id/" in resource_id:
+                self._by_short_id.setdefault(resource_id.split(":id/", 1)[1], []).append(node)
+        if node.content_desc:
+            self._by_content_desc.setdefault(node.content_desc, []).append(node)
+        if node.text:
+            self._by_text.setdefault(node.text, []).append(node)
+        return node
+
+    def by_resource_id(self, resource_id: str) -> List[UiNode]:
+        """
+        resource-id 로 조회
+        패키지 접두어 없이 주면 UiAutomator2 By.ID 처럼 '<package>:id/<값>' 도 매칭
+        """
+        nodes = self._by_resource_id.get(resource_id, [])
+        if ":id/" not in resource_id:
+            nodes = nodes + self._by_short_id.get(resource_id, [])
+        return nodes
+
+    def by_content_desc(self, content_desc: str) -> List[UiNode]:
+        return self._by_content_desc.get(content_desc, [])
+
+    def by_text(self, text: str) -> List[UiNode]:
+        return self._by_text.get(text, [])
+
+    def by_class(self, cls: str) -> List[UiNode]:
+        return self._by_class.get(cls, [])
+
+    def with_attribute(self, attr: str) -> List[UiNode]:
+        """속성 값이 비어 있지 않은 노드 (문서 순서, 인덱스가 있는 속성은 인덱스로)"""
+        index = {
+            'resource-id': self._by_resource_id,
+            'content-desc': self._by_content_desc,
+            'text': self._by_text,
+        }.get(attr)
+        if index is None:
+            return [node for node in self.nodes if node.get(attr)]
+        return sorted((node for nodes in index.values() for node in nodes), key=lambda node: node.order)
+
+    def lookup(self, attr: str, value: str) -> Optional[List[UiNode]]:
+        """
+        속성 값 정확히 일치 조회 (인덱스가 있는 속성만)
+
+        Returns:
+            매칭 노드 목록, 인덱스가 없는 속성이면 None
+        """
+        index = {
+            'resource-id': self._by_resource_id,
+            'content-desc': self._by_content_desc,
+            'text': self._by_text,
+            'class': self._by_class,
+        }.get(attr)
+        if index is None:
+            return None
+        return index.get(value, [])
+
+    def __len__(self) -> int:
+        return len(self.nodes)
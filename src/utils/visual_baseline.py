@@ -0,0 +1,228 @@
+"""
+시각 회귀(visual regression) 비교
+실무용: 페이지 스크린샷을 기준 이미지(baseline)와 타일 단위로 비교 (NumPy 벡터화)
+       배너/시계 등 동적 영역은 UI 계층 bounds 로 마스킹
+
+구조:
+    {BASELINE_DIR}/{너비}x{높이}/{이름}.png     기준 이미지 (해상도별)
+    {SCREENSHOT_DIR}/diff/{이름}_diff.png       불일치 시 차이 히트맵
+
+Usage:
+    store = get_baseline_store()
+    result = store.compare("nav_01_home", png, mask_bounds=[(0, 0, 1440, 84)])
+    result.passed(tolerance=0.01, tile_tolerance=0.25)
+"""
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+import io
+import os
+import threading
+import numpy as np
+from config.app_config import AppConfig
+from utils.image_analysis import decode_screenshot
+from utils.logger import get_logger
+from utils.screenshot_writer import write_image
+from utils.ui_hierarchy import Bounds
+
+logger = get_logger(__name__)
+
+
+class VisualDiff(NamedTuple):
+    """기준 이미지 비교 결과"""
+    name: str
+    status: str                         # 'match' | 'diff' | 'size_mismatch' | 'new_baseline'
+    changed_ratio: float                # 마스크 제외 영역 중 변경된 픽셀 비율
+    changed_tiles: int                  # 변경 픽셀이 있는 타일 수
+    max_tile_ratio: float               # 가장 많이 바뀐 타일의 변경 비율
+    baseline_path: str
+    heatmap_path: Optional[str] = None
+
+    def passed(self, tolerance: float = AppConfig.BASELINE_TOLERANCE,
+               tile_tolerance: float = AppConfig.BASELINE_TILE_TOLERANCE) -> bool:
+        """
+        전체 변경 비율과 타일별 변경 비율이 모두 허용 이내면 통과 (기준 이미지를 새로 만든 경우 통과)
+        타일 기준: 화면의 1% 미만인 버튼/배너가 통째로 깨져도 감지
+        """
+        if self.status == 'size_mismatch':
+            return False
+        return self.changed_ratio <= tolerance and self.max_tile_ratio <= tile_tolerance
+
+
+def build_mask(shape: Tuple[int, ...], mask_bounds: Sequence[Bounds],
+               screen_size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """
+    동적 영역 bounds → (높이, 너비) bool 마스크 (True = 비교 제외)
+
+    Args:
+        shape: 스크린샷 배열 shape
+        mask_bounds: 계층 좌표 (left, top, right, bottom) 목록
+        screen_size: 계층 기준 화면 크기 - 스크린샷 해상도와 다르면 비율 보정
+    """
+    height, width = shape[:2]
+    mask = np.zeros((height, width), dtype=bool)
+    scale_x = scale_y = 1.0
+    if screen_size and screen_size[0] > 0 and screen_size[1] > 0:
+        scale_x, scale_y = width / screen_size[0], height / screen_size[1]
+    for left, top, right, bottom in mask_bounds:
+        left, right = (int(np.clip(round(value * scale_x), 0, width)) for value in (left, right))
+        top, bottom = (int(np.clip(round(value * scale_y), 0, height)) for value in (top, bottom))
+        mask[top:bottom, left:right] = True
+    return mask
+
+
+def tile_differences(current: np.ndarray, baseline: np.ndarray, mask: Optional[np.ndarray] = None,
+                     tile: int = AppConfig.BASELINE_TILE_SIZE,
+                     pixel_threshold: int = AppConfig.BASELINE_PIXEL_THRESHOLD) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    두 이미지의 타일별 변경 비율 (전체 연산을 배열 단위로 처리, 타일/픽셀 반복 없음)
+
+    Args:
+        current, baseline: 같은 shape 의 (높이, 너비, 3) uint8 배열
+        mask: True 인 픽셀은 비교 제외
+        tile: 타일 한 변 크기 (px)
+        pixel_threshold: 채널 최대 차이가 이 값 이하면 같은 픽셀 (압축/렌더링 노이즈 무시)
+
+    Returns:
+        (changed, tile_ratios, changed_ratio)
+        changed: (높이, 너비) 변경 픽셀 bool 배열
+        tile_ratios: (타일 행, 타일 열) 타일별 변경 비율
+        changed_ratio: 마스크 제외 영역 전체의 변경 비율
+    """
+    # uint8 그대로 |a - b| 계산 (int16 변환 없이 메모리 절반)
+    diff = (np.maximum(current, baseline) - np.minimum(current, baseline)).max(axis=2)
+    changed = diff > pixel_threshold
+    compared = np.ones(changed.shape, dtype=bool) if mask is None else ~mask
+    changed &= compared
+
+    height, width = changed.shape
+    rows, cols = -(-height // tile), -(-width // tile)
+    pad = ((0, rows * tile - height), (0, cols * tile - width))
+    changed_counts = np.pad(changed, pad).reshape(rows, tile, cols, tile).sum(axis=(1, 3))
+    compared_counts = np.pad(compared, pad).reshape(rows, tile, cols, tile).sum(axis=(1, 3))
+    tile_ratios = changed_counts / np.maximum(compared_counts, 1)
+    changed_ratio = float(changed_counts.sum()) / max(int(compared_counts.sum()), 1)
+    return changed, tile_ratios, changed_ratio
+
+
+def render_heatmap(current: np.ndarray, changed: np.ndarray, tile_ratios: np.ndarray,
+                   mask: Optional[np.ndarray] = None, tile: int = AppConfig.BASELINE_TILE_SIZE) -> np.ndarray:
+    """
+    차이 히트맵 (어둡게 한 현재 화면 + 타일 변경 비율 빨강 + 변경 픽셀 노랑 + 마스크 파랑)
+    """
+    height, width = changed.shape
+    heatmap = (current.astype(np.float32) * 0.35)
+    intensity = np.sqrt(np.repeat(np.repeat(tile_ratios, tile, axis=0), tile, axis=1)[:height, :width])
+    heatmap[..., 0] += intensity * 200
+    if mask is not None:
+        heatmap[mask, 2] += 90
+    heatmap[changed] = (255, 230, 0)
+    return np.clip(heatmap, 0, 255).astype(np.uint8)
+
+
+def png_shape(png: bytes) -> Tuple[int, int]:
+    """PNG 헤더(IHDR)에서 (높이, 너비) 읽기 - 디코딩 없이 기준 이미지 경로 결정"""
+    return int.from_bytes(png[20:24], 'big'), int.from_bytes(png[16:20], 'big')
+
+
+def _encode_png(image: np.ndarray) -> bytes:
+    """배열 → PNG bytes"""
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.fromarray(image).save(output, format="PNG", optimize=False)
+    return output.getvalue()
+
+
+class BaselineStore:
+    """기준 이미지 저장소 (해상도별 디렉토리, 스레드 안전)"""
+
+    def __init__(self, root: str = AppConfig.BASELINE_DIR, diff_dir: Optional[str] = None,
+                 update: bool = AppConfig.BASELINE_UPDATE) -> None:
+        self.root: str = root
+        self.diff_dir: str = diff_dir or os.path.join(AppConfig.SCREENSHOT_DIR, "diff")
+        self.update: bool = update  # True면 비교 대신 기준 이미지 갱신
+        self._lock = threading.Lock()
+        self.results: Dict[str, VisualDiff] = {}
+
+    def baseline_path(self, name: str, shape: Tuple[int, ...]) -> str:
+        """이름 + 해상도별 기준 이미지 경로"""
+        height, width = shape[:2]
+        name = os.path.splitext(name)[0] if name.endswith(".png") else name
+        return os.path.join(self.root, f"{width}x{height}", f"{name}.png")
+
+    def compare(self, name: str, png: bytes, mask_bounds: Sequence[Bounds] = (),
+                screen_size: Optional[Tuple[int, int]] = None,
+                tolerance: float = AppConfig.BASELINE_TOLERANCE,
+                tile_tolerance: float = AppConfig.BASELINE_TILE_TOLERANCE) -> VisualDiff:
+        """
+        스크린샷을 기준 이미지와 비교 (기준 이미지가 없거나 갱신 모드면 저장 후 'new_baseline')
+
+        Args:
+            name: 기준 이미지 이름
+            png: 현재 스크린샷 PNG bytes
+            mask_bounds: 비교 제외 영역 (계층 좌표)
+            screen_size: 계층 기준 화면 크기
+            tolerance, tile_tolerance: 히트맵 저장 기준 (VisualDiff.passed 와 동일)
+        """
+        path = self.baseline_path(name, png_shape(png))
+
+        if self.update or not os.path.exists(path):
+            write_image(png, path, scale=1.0, image_format="png")
+            logger.info(f"📐 기준 이미지 저장: {path}")
+            return self._record(VisualDiff(name, 'new_baseline', 0.0, 0, 0.0, path))
+
+        with open(path, 'rb') as f:
+            baseline_png = f.read()
+        # 인코딩 결과까지 같으면 디코딩/비교 생략
+        if baseline_png == png:
+            return self._record(VisualDiff(name, 'match', 0.0, 0, 0.0, path))
+
+        current = decode_screenshot(png)
+        baseline = decode_screenshot(baseline_png)
+        if baseline.shape != current.shape:
+            logger.warning(f"기준 이미지 크기 불일치: {name} {baseline.shape} != {current.shape}")
+            return self._record(VisualDiff(name, 'size_mismatch', 1.0, 0, 1.0, path))
+
+        mask = build_mask(current.shape, mask_bounds, screen_size) if mask_bounds else None
+        changed, tile_ratios, changed_ratio = tile_differences(current, baseline, mask)
+        result = VisualDiff(
+            name=name,
+            status='match' if changed_ratio == 0 else 'diff',
+            changed_ratio=changed_ratio,
+            changed_tiles=int(np.count_nonzero(tile_ratios)),
+            max_tile_ratio=float(tile_ratios.max()) if tile_ratios.size else 0.0,
+            baseline_path=path,
+        )
+        if not result.passed(tolerance, tile_tolerance):
+            heatmap_path = os.path.join(self.diff_dir, f"{os.path.splitext(os.path.basename(path))[0]}_diff.png")
+            write_image(_encode_png(render_heatmap(current, changed, tile_ratios, mask)), heatmap_path,
+                        scale=1.0, image_format="png")
+            result = result._replace(heatmap_path=heatmap_path)
+        return self._record(result)
+
+    def _record(self, result: VisualDiff) -> VisualDiff:
+        with self._lock:
+            self.results[result.name] = result
+        return result
+
+
+_store: Optional[BaselineStore] = None
+_store_lock = threading.Lock()
+
+
+def get_baseline_store() -> BaselineStore:
+    """세션 공용 기준 이미지 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BaselineStore()
+        return _store
+
+
+def log_baseline_summary() -> None:
+    """세션 종료 시 시각 비교 결과 요약"""
+    if _store is None or not _store.results:
+        return
+    counts: Dict[str, int] = {}
+    for result in _store.results.values():
+        counts[result.status] = counts.get(result.status, 0) + 1
+    logger.info(f"📐 시각 비교: {', '.join(f'{status} {count}개' for status, count in counts.items())}")